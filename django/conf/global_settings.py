@@ -255,6 +255,14 @@ FILE_UPLOAD_TEMP_DIR = None
 # you'd pass directly to os.chmod; see http://docs.python.org/lib/os-file-dir.html.
 FILE_UPLOAD_PERMISSIONS = None
 
+# Settings for django.views.static.serve(). If STATIC_SERVE_SENDFILE_HEADER is
+# set (e.g. to 'X-Sendfile'), files are handed off to the Web server by
+# sending their path in that header instead of their content.
+# STATIC_SERVE_STAT_CACHE_TIMEOUT is the number of seconds for which the
+# result of stat()ing a file may be reused.
+STATIC_SERVE_SENDFILE_HEADER = None
+STATIC_SERVE_STAT_CACHE_TIMEOUT = 0
+
 # Default formatting for date objects. See all available format strings here:
 # http://docs.djangoproject.com/en/dev/ref/templates/builtins/#now
 DATE_FORMAT = 'N j, Y'
@@ -305,6 +313,19 @@ MIDDLEWARE_CLASSES = (
 #     'django.middleware.gzip.GZipMiddleware',
 )
 
+# Whether the request handler should record the number of calls to, and the
+# cumulative time spent in, each middleware method. See the
+# middleware_timings attribute of django.core.handlers.base.BaseHandler.
+MIDDLEWARE_TIMING = False
+
+# Settings for django.middleware.gzip.GZipMiddleware. Responses shorter than
+# GZIP_MIN_LENGTH bytes aren't compressed. If GZIP_CONTENT_TYPES is a tuple,
+# only responses whose MIME type starts with one of its entries (e.g. 'text/'
+# or 'application/json') are compressed.
+GZIP_COMPRESSION_LEVEL = 6
+GZIP_MIN_LENGTH = 200
+GZIP_CONTENT_TYPES = None
+
 ############
 # SESSIONS #
 ############
@@ -318,6 +339,8 @@ SESSION_SAVE_EVERY_REQUEST = False                      # Whether to save the se
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False                 # Whether a user's session cookie expires when the Web browser is closed.
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'  # The module to store session data
 SESSION_FILE_PATH = None                                # Directory to store session files if using the file session module. If None, the backend will use a sensible default.
+SESSION_REFRESH_THRESHOLD = None                        # If set along with SESSION_SAVE_EVERY_REQUEST, only save unmodified sessions once fewer than this many seconds of their lifetime remain.
+SESSION_CACHED_DB_WRITE_INTERVAL = None                 # If set, the cached_db session module only writes unchanged sessions to the database this often, in seconds.
 
 #########
 # CACHE #
@@ -374,6 +397,14 @@ LOGIN_REDIRECT_URL = '/accounts/profile/'
 # The number of days a password reset link is valid for
 PASSWORD_RESET_TIMEOUT_DAYS = 3
 
+# The number of seconds a logged in user object is cached for, keyed by
+# session. None disables caching and fetches the user on every request.
+AUTH_USER_CACHE_TIMEOUT = None
+
+# The number of seconds the permissions computed by ModelBackend are cached
+# for. None disables caching and fetches them once per request.
+AUTH_PERMISSION_CACHE_TIMEOUT = None
+
 ###########
 # TESTING #
 ###########
@@ -6,13 +6,20 @@ Each filter subclass knows how to display a filter for a field that passes a
 certain test -- e.g. being a DateField or ForeignKey.
 """
 
+from django.core.cache import cache
 from django.db import models
-from django.utils.encoding import smart_unicode, iri_to_uri
+from django.db.models.sql import EmptyResultSet
+from django.utils.encoding import smart_str, smart_unicode, iri_to_uri
+from django.utils.hashcompat import md5_constructor
 from django.utils.translation import ugettext as _
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
 import datetime
 
+# The query string parameter used to show all the choices of a filter that was
+# cut short by ModelAdmin.list_filter_max_choices. Its value is the field name.
+MORE_VAR = '_more'
+
 class FilterSpec(object):
     filter_specs = []
     def __init__(self, f, request, params, model, model_admin):
@@ -61,10 +68,58 @@ class RelatedFilterSpec(FilterSpec):
         rel_name = f.rel.get_related_field().name
         self.lookup_kwarg = '%s__%s__exact' % (f.name, rel_name)
         self.lookup_val = request.GET.get(self.lookup_kwarg, None)
-        self.lookup_choices = f.get_choices(include_blank=False)
+        self.show_more = params.get(MORE_VAR) == f.name
+        self.max_choices = getattr(model_admin, 'list_filter_max_choices', None)
+        self.lookup_choices = self.get_lookup_choices(request, model_admin)
+        self.has_more = False
+        if self.max_choices is not None and not self.show_more and \
+                len(self.lookup_choices) > self.max_choices:
+            self.has_more = True
+            self.lookup_choices = self.lookup_choices[:self.max_choices]
+
+    def get_lookup_choices(self, request, model_admin):
+        """
+        Returns a list of (value, label) pairs for the related objects.
+
+        If ModelAdmin.list_filter_related_only is set, only the objects
+        referred to by the ModelAdmin's queryset are listed. Unless the full
+        list was asked for, at most ModelAdmin.list_filter_max_choices + 1
+        objects are fetched. The result is cached for
+        ModelAdmin.list_filter_cache_timeout seconds.
+        """
+        f = self.field
+        related_field = f.rel.get_related_field()
+        qs = f.rel.to._default_manager.complex_filter(f.rel.limit_choices_to)
+        if getattr(model_admin, 'list_filter_related_only', False):
+            if isinstance(f, models.ManyToManyField):
+                present = '%s__%s' % (f.name, related_field.name)
+            else:
+                present = f.name
+            values = model_admin.queryset(request).order_by().values_list(present, flat=True)
+            qs = qs.filter(**{'%s__in' % related_field.name: values.distinct()})
+        if self.max_choices is not None and not self.show_more:
+            qs = qs[:self.max_choices + 1]
+
+        def get_choices():
+            return [(getattr(x, related_field.attname), smart_unicode(x)) for x in qs]
+
+        timeout = getattr(model_admin, 'list_filter_cache_timeout', None)
+        if timeout is None:
+            return get_choices()
+        try:
+            sql, sql_params = qs.query.as_sql()
+        except EmptyResultSet:
+            return []
+        key = 'django.contrib.admin.filter.%s' % md5_constructor(
+                smart_str(u'%s|%r' % (sql, sql_params))).hexdigest()
+        choices = cache.get(key)
+        if choices is None:
+            choices = get_choices()
+            cache.set(key, choices, timeout)
+        return choices
 
     def has_output(self):
-        return len(self.lookup_choices) > 1
+        return self.has_more or len(self.lookup_choices) > 1
 
     def title(self):
         return self.lookup_title
@@ -73,10 +128,28 @@ class RelatedFilterSpec(FilterSpec):
         yield {'selected': self.lookup_val is None,
                'query_string': cl.get_query_string({}, [self.lookup_kwarg]),
                'display': _('All')}
+        selected_listed = False
         for pk_val, val in self.lookup_choices:
-            yield {'selected': self.lookup_val == smart_unicode(pk_val),
+            selected = self.lookup_val == smart_unicode(pk_val)
+            selected_listed = selected_listed or selected
+            yield {'selected': selected,
                    'query_string': cl.get_query_string({self.lookup_kwarg: pk_val}),
                    'display': val}
+        if self.has_more:
+            if self.lookup_val is not None and not selected_listed:
+                # Keep the active filter visible even if it's past the cut.
+                try:
+                    obj = self.field.rel.to._default_manager.get(
+                        **{self.field.rel.get_related_field().name: self.lookup_val})
+                except (self.field.rel.to.DoesNotExist, ValueError):
+                    pass
+                else:
+                    yield {'selected': True,
+                           'query_string': cl.get_query_string({self.lookup_kwarg: self.lookup_val}),
+                           'display': smart_unicode(obj)}
+            yield {'selected': False,
+                   'query_string': cl.get_query_string({MORE_VAR: self.field.name}),
+                   'display': _(u'More\u2026')}
 
 FilterSpec.register(lambda f: bool(f.rel), RelatedFilterSpec)
 
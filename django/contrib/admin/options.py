@@ -32,6 +32,14 @@ get_ul_class = lambda x: 'radiolist%s' % ((x == HORIZONTAL) and ' inline' or '')
 class IncorrectLookupParameters(Exception):
     pass
 
+# The lookup applied to search_fields entries that have no operator prefix,
+# for each of the ModelAdmin.search_backend choices.
+SEARCH_BACKEND_LOOKUPS = {
+    'contains': 'icontains',
+    'prefix': 'istartswith',
+    'fulltext': 'search',
+}
+
 # Defaults for formfield_overrides. ModelAdmin subclasses can change this
 # by adding to ModelAdmin.formfield_overrides.
 
@@ -179,10 +187,17 @@ class ModelAdmin(BaseModelAdmin):
     list_display = ('__str__',)
     list_display_links = ()
     list_filter = ()
+    list_filter_related_only = False
+    list_filter_max_choices = None
+    list_filter_cache_timeout = None
     list_select_related = False
     list_per_page = 100
     list_editable = ()
+    list_count_estimate = False
+    list_count_cache_timeout = None
+    list_show_total = True
     search_fields = ()
+    search_backend = 'contains'
     date_hierarchy = None
     save_as = False
     save_on_top = False
@@ -7,7 +7,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.forms.models import BaseModelForm, BaseModelFormSet, fields_for_model, _get_foreign_key
 from django.contrib.admin.options import flatten_fieldsets, BaseModelAdmin
-from django.contrib.admin.options import HORIZONTAL, VERTICAL
+from django.contrib.admin.options import HORIZONTAL, VERTICAL, SEARCH_BACKEND_LOOKUPS
 
 __all__ = ['validate']
 
@@ -64,6 +64,22 @@ def validate(cls, model):
         raise ImproperlyConfigured("'%s.list_per_page' should be a integer."
                 % cls.__name__)
 
+    # list_count_cache_timeout = None
+    # list_filter_max_choices = None
+    # list_filter_cache_timeout = None
+    for attr in ('list_count_cache_timeout', 'list_filter_max_choices',
+                 'list_filter_cache_timeout'):
+        if getattr(cls, attr, None) is not None and \
+                not isinstance(getattr(cls, attr), int):
+            raise ImproperlyConfigured("'%s.%s' should be an integer or None."
+                    % (cls.__name__, attr))
+
+    # search_backend = 'contains'
+    if hasattr(cls, 'search_backend'):
+        if cls.search_backend not in SEARCH_BACKEND_LOOKUPS:
+            raise ImproperlyConfigured("'%s.search_backend' should be one of %s."
+                    % (cls.__name__, ', '.join(["'%s'" % b for b in sorted(SEARCH_BACKEND_LOOKUPS)])))
+
     # list_editable
     if hasattr(cls, 'list_editable') and cls.list_editable:
         check_isseq(cls, 'list_editable', cls.list_editable)
@@ -126,7 +142,12 @@ def validate(cls, model):
     # list_select_related = False
     # save_as = False
     # save_on_top = False
-    for attr in ('list_select_related', 'save_as', 'save_on_top'):
+    # list_count_estimate = False
+    # list_show_total = True
+    # list_filter_related_only = False
+    for attr in ('list_select_related', 'save_as', 'save_on_top',
+                 'list_count_estimate', 'list_show_total',
+                 'list_filter_related_only'):
         if not isinstance(getattr(cls, attr), bool):
             raise ImproperlyConfigured("'%s.%s' should be a boolean."
                     % (cls.__name__, attr))
@@ -1,10 +1,13 @@
-from django.contrib.admin.filterspecs import FilterSpec
-from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.filterspecs import FilterSpec, MORE_VAR
+from django.contrib.admin.options import IncorrectLookupParameters, SEARCH_BACKEND_LOOKUPS
 from django.contrib.admin.util import quote
 from django.core.paginator import Paginator, InvalidPage
-from django.db import models
+from django.core.cache import cache
+from django.db import connection, models
 from django.db.models.query import QuerySet
+from django.db.models.sql import EmptyResultSet
 from django.utils.encoding import force_unicode, smart_str
+from django.utils.hashcompat import md5_constructor
 from django.utils.translation import ugettext
 from django.utils.http import urlencode
 import operator
@@ -18,6 +21,10 @@ except NameError:
 # total result count is less than or equal to this setting.
 MAX_SHOW_ALL_ALLOWED = 200
 
+# Estimated counts (see ModelAdmin.list_count_estimate) below this are
+# replaced by an exact count, as statistics for small tables tend to be off.
+MIN_ESTIMATED_COUNT = 10000
+
 # Changelist settings
 ALL_VAR = 'all'
 ORDER_VAR = 'o'
@@ -98,9 +105,13 @@ class ChangeList(object):
         return '?%s' % urlencode(p)
 
     def get_results(self, request):
+        self.show_total = self.model_admin.list_show_total
+        if not self.show_total:
+            return self.get_results_without_count()
+
         paginator = Paginator(self.query_set, self.list_per_page)
         # Get the number of objects, with admin filters applied.
-        result_count = paginator.count
+        result_count = paginator._count = self.get_count(self.query_set)
 
         # Get the total number of objects, with no admin filters applied.
         # Perform a slight optimization: Check to see whether any filters were
@@ -109,7 +120,7 @@ class ChangeList(object):
         if not self.query_set.query.where:
             full_result_count = result_count
         else:
-            full_result_count = self.root_query_set.count()
+            full_result_count = self.get_count(self.root_query_set)
 
         can_show_all = result_count <= MAX_SHOW_ALL_ALLOWED
         multi_page = result_count > self.list_per_page
@@ -130,6 +141,71 @@ class ChangeList(object):
         self.multi_page = multi_page
         self.paginator = paginator
 
+    def get_results_without_count(self):
+        """
+        Gets the objects to display without counting them (see
+        ModelAdmin.list_show_total). One extra object is fetched to find out
+        whether there's a next page; the paginator only knows about the pages
+        up to that one. A page past the last one raises
+        IncorrectLookupParameters.
+        """
+        if self.page_num < 0:
+            raise IncorrectLookupParameters
+        bottom = self.page_num * self.list_per_page
+        top = bottom + self.list_per_page
+        objects = list(self.query_set[bottom:top + 1])
+        if not objects and self.page_num > 0:
+            # Past the last page.
+            raise IncorrectLookupParameters
+        has_next = len(objects) > self.list_per_page
+        paginator = Paginator(self.query_set, self.list_per_page)
+        paginator._count = bottom + len(objects)
+        # Keep a QuerySet (e.g. for list_editable formsets), without running
+        # the query again.
+        result_list = self.query_set[bottom:top]
+        result_list._result_cache = objects[:self.list_per_page]
+
+        self.result_count = None
+        self.full_result_count = None
+        self.result_list = result_list
+        self.can_show_all = False
+        self.multi_page = self.page_num > 0 or has_next
+        self.paginator = paginator
+
+    def get_count(self, query_set):
+        """
+        Returns the number of objects in the given QuerySet. Depending on the
+        ModelAdmin options, an unfiltered count may be estimated from the
+        database statistics, and counts may be cached.
+        """
+        if self.model_admin.list_count_estimate:
+            query = query_set.query
+            if not (query.where or query.extra_where or query.distinct or
+                    query.low_mark or query.high_mark is not None):
+                cursor = connection.cursor()
+                count = connection.ops.estimated_row_count(cursor,
+                        query_set.model._meta.db_table)
+                if count is not None and count >= MIN_ESTIMATED_COUNT:
+                    return count
+
+        timeout = self.model_admin.list_count_cache_timeout
+        if timeout is None:
+            return query_set.count()
+        # Ordering doesn't change the count, so leave it out of the key.
+        query = query_set.query.clone()
+        query.clear_ordering(True)
+        try:
+            sql, params = query.as_sql()
+        except EmptyResultSet:
+            return 0
+        key = 'django.contrib.admin.count.%s' % md5_constructor(
+                smart_str(u'%s|%r' % (sql, params))).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = query_set.count()
+            cache.set(key, count, timeout)
+        return count
+
     def get_ordering(self):
         lookup_opts, params = self.lookup_opts, self.params
         # For ordering, first check the "ordering" parameter in the admin
@@ -171,7 +247,7 @@ class ChangeList(object):
     def get_query_set(self):
         qs = self.root_query_set
         lookup_params = self.params.copy() # a dictionary of the query string
-        for i in (ALL_VAR, ORDER_VAR, ORDER_TYPE_VAR, SEARCH_VAR, IS_POPUP_VAR):
+        for i in (ALL_VAR, ORDER_VAR, ORDER_TYPE_VAR, SEARCH_VAR, IS_POPUP_VAR, MORE_VAR):
             if i in lookup_params:
                 del lookup_params[i]
         for key, value in lookup_params.items():
@@ -218,6 +294,7 @@ class ChangeList(object):
             qs = qs.order_by('%s%s' % ((self.order_type == 'desc' and '-' or ''), self.order_field))
 
         # Apply keyword searches.
+        default_lookup = self.get_search_lookup()
         def construct_search(field_name):
             if field_name.startswith('^'):
                 return "%s__istartswith" % field_name[1:]
@@ -226,7 +303,7 @@ class ChangeList(object):
             elif field_name.startswith('@'):
                 return "%s__search" % field_name[1:]
             else:
-                return "%s__icontains" % field_name
+                return "%s__%s" % (field_name, default_lookup)
 
         if self.search_fields and self.query:
             for bit in self.query.split():
@@ -239,5 +316,20 @@ class ChangeList(object):
 
         return qs
 
+    def get_search_lookup(self):
+        """
+        Returns the lookup used for search_fields without an operator prefix,
+        as chosen by ModelAdmin.search_backend. The 'fulltext' backend falls
+        back to 'icontains' on databases without full-text search support.
+        """
+        backend = getattr(self.model_admin, 'search_backend', 'contains')
+        lookup = SEARCH_BACKEND_LOOKUPS[backend]
+        if lookup == 'search':
+            try:
+                connection.ops.fulltext_search_sql('')
+            except NotImplementedError:
+                lookup = 'icontains'
+        return lookup
+
     def url_for_result(self, result):
         return "%s/" % quote(getattr(result, self.pk_attname))
@@ -1,10 +1,16 @@
 import datetime
+import random
+import time
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.importlib import import_module
 
 SESSION_KEY = '_auth_user_id'
 BACKEND_SESSION_KEY = '_auth_user_backend'
 REDIRECT_FIELD_NAME = 'next'
+USER_CACHE_KEY = 'django.contrib.auth.user.%s'
+USER_VERSION_CACHE_KEY = 'django.contrib.auth.user_version.%s'
+PERMISSION_CACHE_KEY = 'django.contrib.auth.permissions.%s'
+PERMISSION_VERSION_CACHE_KEY = 'django.contrib.auth.permission_version'
 
 def load_backend(path):
     i = path.rfind('.')
@@ -79,12 +85,75 @@ def logout(request):
         request.user = AnonymousUser()
 
 def get_user(request):
+    from django.conf import settings
     from django.contrib.auth.models import AnonymousUser
     try:
         user_id = request.session[SESSION_KEY]
         backend_path = request.session[BACKEND_SESSION_KEY]
-        backend = load_backend(backend_path)
-        user = backend.get_user(user_id) or AnonymousUser()
     except KeyError:
-        user = AnonymousUser()
+        return AnonymousUser()
+    if settings.AUTH_USER_CACHE_TIMEOUT is None:
+        return load_backend(backend_path).get_user(user_id) or AnonymousUser()
+
+    # The cached user is keyed by user id, which is short and, unlike the
+    # session key of some session backends, doesn't change between requests.
+    # Entries are stamped with the user's version, which changes whenever the
+    # User is saved or deleted, and with the backend the user was loaded from.
+    # Logging out doesn't need to touch the cache: the session then has no
+    # user id any more.
+    from django.core.cache import cache
+    key = USER_CACHE_KEY % user_id
+    version_key = USER_VERSION_CACHE_KEY % user_id
+    cached = cache.get_many([key, version_key])
+    version = cached.get(version_key)
+    if version is None:
+        version = get_user_version(user_id)
+    elif key in cached and cached[key][:2] == (version, backend_path):
+        return cached[key][2]
+    user = load_backend(backend_path).get_user(user_id)
+    if user is None:
+        return AnonymousUser()
+    cache.set(key, (version, backend_path, user), settings.AUTH_USER_CACHE_TIMEOUT)
     return user
+
+def get_cache_version(key):
+    """
+    Returns the version stored in the cache under the given key, creating a
+    new one if needed. Cached data stamped with a version is only valid while
+    that version is current.
+    """
+    from django.core.cache import cache
+    version = cache.get(key)
+    if version is None:
+        # A version must never be reused, or entries cached before the
+        # version key was evicted would be considered current again.
+        version = '%s.%s' % (time.time(), random.randrange(1 << 30))
+        cache.set(key, version)
+    return version
+
+def get_user_version(user_id):
+    """
+    Returns the current version of the cached data (user object, permissions)
+    belonging to the user with the given id.
+    """
+    return get_cache_version(USER_VERSION_CACHE_KEY % user_id)
+
+def invalidate_user_version(user_id):
+    """
+    Marks all cached data belonging to the user with the given id as stale.
+    """
+    from django.core.cache import cache
+    cache.delete(USER_VERSION_CACHE_KEY % user_id)
+
+def get_permission_version():
+    """
+    Returns the current global version of cached permissions.
+    """
+    return get_cache_version(PERMISSION_VERSION_CACHE_KEY)
+
+def invalidate_permission_version():
+    """
+    Marks the cached permissions of all users as stale.
+    """
+    from django.core.cache import cache
+    cache.delete(PERMISSION_VERSION_CACHE_KEY)
@@ -3,8 +3,11 @@ try:
 except NameError:
     from sets import Set as set # Python 2.3 fallback
 
-from django.db import connection
+from django.conf import settings
+from django.contrib import auth
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
 
 
 class ModelBackend(object):
@@ -27,40 +30,99 @@ class ModelBackend(object):
         groups.
         """
         if not hasattr(user_obj, '_group_perm_cache'):
-            cursor = connection.cursor()
-            # The SQL below works out to the following, after DB quoting:
-            # cursor.execute("""
-            #     SELECT ct."app_label", p."codename"
-            #     FROM "auth_permission" p, "auth_group_permissions" gp, "auth_user_groups" ug, "django_content_type" ct
-            #     WHERE p."id" = gp."permission_id"
-            #         AND gp."group_id" = ug."group_id"
-            #         AND ct."id" = p."content_type_id"
-            #         AND ug."user_id" = %s, [self.id])
-            qn = connection.ops.quote_name
-            sql = """
-                SELECT ct.%s, p.%s
-                FROM %s p, %s gp, %s ug, %s ct
-                WHERE p.%s = gp.%s
-                    AND gp.%s = ug.%s
-                    AND ct.%s = p.%s
-                    AND ug.%s = %%s""" % (
-                qn('app_label'), qn('codename'),
-                qn('auth_permission'), qn('auth_group_permissions'),
-                qn('auth_user_groups'), qn('django_content_type'),
-                qn('id'), qn('permission_id'),
-                qn('group_id'), qn('group_id'),
-                qn('id'), qn('content_type_id'),
-                qn('user_id'),)
-            cursor.execute(sql, [user_obj.id])
-            user_obj._group_perm_cache = set(["%s.%s" % (row[0], row[1]) for row in cursor.fetchall()])
+            self._load_permissions(user_obj)
         return user_obj._group_perm_cache
 
     def get_all_permissions(self, user_obj):
         if not hasattr(user_obj, '_perm_cache'):
-            user_obj._perm_cache = set([u"%s.%s" % (p.content_type.app_label, p.codename) for p in user_obj.user_permissions.select_related()])
-            user_obj._perm_cache.update(self.get_group_permissions(user_obj))
+            self._load_permissions(user_obj)
         return user_obj._perm_cache
 
+    def _load_permissions(self, user_obj):
+        """
+        Sets ``_perm_cache`` and ``_group_perm_cache`` on user_obj, from the
+        cache if ``settings.AUTH_PERMISSION_CACHE_TIMEOUT`` is set, otherwise
+        (or on a cache miss) from the database.
+        """
+        timeout = settings.AUTH_PERMISSION_CACHE_TIMEOUT
+        if timeout is None:
+            perms, group_perms = self._fetch_permissions(user_obj)
+        else:
+            # Cached permissions are stamped with the user's version, which
+            # changes when the user or its groups and permissions do, and
+            # with a global version, which changes when any group's
+            # permissions do.
+            key = auth.PERMISSION_CACHE_KEY % user_obj.id
+            version_key = auth.USER_VERSION_CACHE_KEY % user_obj.id
+            cached = cache.get_many([key, version_key, auth.PERMISSION_VERSION_CACHE_KEY])
+            versions = (cached.get(version_key), cached.get(auth.PERMISSION_VERSION_CACHE_KEY))
+            if None not in versions and key in cached and cached[key][0] == versions:
+                perms, group_perms = cached[key][1]
+            else:
+                versions = (auth.get_user_version(user_obj.id),
+                            auth.get_permission_version())
+                perms, group_perms = self._fetch_permissions(user_obj)
+                cache.set(key, (versions, (perms, group_perms)), timeout)
+        user_obj._perm_cache = set(perms)
+        user_obj._group_perm_cache = set(group_perms)
+
+    def _fetch_permissions(self, user_obj):
+        """
+        Returns the permission strings the user has directly and through
+        his/her groups, as a tuple of (all permissions, group permissions).
+        Both are fetched with a single query.
+        """
+        cursor = connection.cursor()
+        # The SQL below works out to the following, after DB quoting:
+        # cursor.execute("""
+        #     SELECT 0, ct."app_label", p."codename"
+        #     FROM "auth_permission" p, "auth_user_user_permissions" up, "django_content_type" ct
+        #     WHERE p."id" = up."permission_id"
+        #         AND ct."id" = p."content_type_id"
+        #         AND up."user_id" = %s
+        #     UNION ALL
+        #     SELECT 1, ct."app_label", p."codename"
+        #     FROM "auth_permission" p, "auth_group_permissions" gp, "auth_user_groups" ug, "django_content_type" ct
+        #     WHERE p."id" = gp."permission_id"
+        #         AND gp."group_id" = ug."group_id"
+        #         AND ct."id" = p."content_type_id"
+        #         AND ug."user_id" = %s, [self.id, self.id])
+        qn = connection.ops.quote_name
+        sql = """
+            SELECT 0, ct.%s, p.%s
+            FROM %s p, %s up, %s ct
+            WHERE p.%s = up.%s
+                AND ct.%s = p.%s
+                AND up.%s = %%s
+            UNION ALL
+            SELECT 1, ct.%s, p.%s
+            FROM %s p, %s gp, %s ug, %s ct
+            WHERE p.%s = gp.%s
+                AND gp.%s = ug.%s
+                AND ct.%s = p.%s
+                AND ug.%s = %%s""" % (
+            qn('app_label'), qn('codename'),
+            qn('auth_permission'), qn('auth_user_user_permissions'),
+            qn('django_content_type'),
+            qn('id'), qn('permission_id'),
+            qn('id'), qn('content_type_id'),
+            qn('user_id'),
+            qn('app_label'), qn('codename'),
+            qn('auth_permission'), qn('auth_group_permissions'),
+            qn('auth_user_groups'), qn('django_content_type'),
+            qn('id'), qn('permission_id'),
+            qn('group_id'), qn('group_id'),
+            qn('id'), qn('content_type_id'),
+            qn('user_id'),)
+        cursor.execute(sql, [user_obj.id, user_obj.id])
+        perms, group_perms = set(), set()
+        for from_group, app_label, codename in cursor.fetchall():
+            perm = u"%s.%s" % (app_label, codename)
+            perms.add(perm)
+            if from_group:
+                group_perms.add(perm)
+        return perms, group_perms
+
     def has_perm(self, user_obj, perm):
         return perm in self.get_all_permissions(user_obj)
 
@@ -4,6 +4,7 @@ import urllib
 from django.contrib import auth
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
+from django.db.models import signals
 from django.db.models.manager import EmptyManager
 from django.contrib.contenttypes.models import ContentType
 from django.utils.encoding import smart_str
@@ -93,6 +94,11 @@ class Group(models.Model):
     def __unicode__(self):
         return self.name
 
+def _cache_enabled():
+    from django.conf import settings
+    return (settings.AUTH_USER_CACHE_TIMEOUT is not None or
+            settings.AUTH_PERMISSION_CACHE_TIMEOUT is not None)
+
 class UserManager(models.Manager):
     def create_user(self, username, email, password=None):
         "Creates and saves a User with the given username, e-mail and password."
@@ -147,6 +153,11 @@ class User(models.Model):
     def __unicode__(self):
         return self.username
 
+    def save(self, *args, **kwargs):
+        super(User, self).save(*args, **kwargs)
+        if _cache_enabled():
+            auth.invalidate_user_version(self.pk)
+
     def get_absolute_url(self):
         return "/users/%s/" % urllib.quote(smart_str(self.username))
 
@@ -288,6 +299,46 @@ class User(models.Model):
                 raise SiteProfileNotAvailable
         return self._profile_cache
 
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Makes sure cached copies of a deleted user (see
+    ``AUTH_USER_CACHE_TIMEOUT``) and of its permissions are not used.
+    """
+    if _cache_enabled():
+        auth.invalidate_user_version(instance.pk)
+# Saves are handled by User.save(); deletions may happen in bulk through
+# QuerySet.delete(), which doesn't call User.delete().
+signals.post_delete.connect(invalidate_cached_user, sender=User)
+
+def invalidate_cached_permissions(sender, action, instance, reverse, pk_set, **kwargs):
+    """
+    Makes sure cached permissions (see ``AUTH_PERMISSION_CACHE_TIMEOUT``) are
+    not used once a user's permissions or groups, or a group's permissions,
+    have changed.
+    """
+    if not _cache_enabled() or not action.startswith('post_'):
+        return
+    if sender is Group.permissions.through or (reverse and pk_set is None):
+        # Potentially affects any number of users.
+        auth.invalidate_permission_version()
+    elif not reverse:
+        auth.invalidate_user_version(instance.pk)
+    else:
+        for user_id in pk_set:
+            auth.invalidate_user_version(user_id)
+signals.m2m_changed.connect(invalidate_cached_permissions,
+                            sender=User.groups.through)
+signals.m2m_changed.connect(invalidate_cached_permissions,
+                            sender=User.user_permissions.through)
+signals.m2m_changed.connect(invalidate_cached_permissions,
+                            sender=Group.permissions.through)
+
+def invalidate_all_cached_permissions(sender, instance, **kwargs):
+    if _cache_enabled():
+        auth.invalidate_permission_version()
+signals.post_delete.connect(invalidate_all_cached_permissions, sender=Group)
+signals.post_delete.connect(invalidate_all_cached_permissions, sender=Permission)
+
 class Message(models.Model):
     """
     The message system is a lightweight way to queue messages for given
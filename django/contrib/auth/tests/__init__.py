@@ -1,4 +1,5 @@
 from django.contrib.auth.tests.basic import BASIC_TESTS
+from django.contrib.auth.tests.cache import UserCacheTest
 from django.contrib.auth.tests.views \
         import PasswordResetTest, ChangePasswordTest, LoginTest, LogoutTest
 from django.contrib.auth.tests.forms import FORM_TESTS
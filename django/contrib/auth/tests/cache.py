@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.sessions.backends import signed_cookies
+from django.contrib.sessions.backends.db import SessionStore
+from django.http import HttpRequest
+from django.test import TestCase
+
+
+class UserCacheTest(TestCase):
+    """
+    Tests caching of the logged in user (``AUTH_USER_CACHE_TIMEOUT``).
+    """
+
+    def setUp(self):
+        self.old_timeout = settings.AUTH_USER_CACHE_TIMEOUT
+        settings.AUTH_USER_CACHE_TIMEOUT = 300
+        User.objects.create_user('cacheduser', 'cached@example.com', 'pw')
+        self.request = HttpRequest()
+        self.request.session = SessionStore()
+        auth.login(self.request, auth.authenticate(username='cacheduser',
+                                                   password='pw'))
+
+    def tearDown(self):
+        settings.AUTH_USER_CACHE_TIMEOUT = self.old_timeout
+
+    def test_cached_user(self):
+        user = auth.get_user(self.request)
+        self.assertEqual(user.username, 'cacheduser')
+        # An update that bypasses User.save() isn't seen...
+        User.objects.filter(pk=user.pk).update(first_name='Cached')
+        self.assertEqual(auth.get_user(self.request).first_name, '')
+        # ...but saving the user invalidates the cached copy.
+        User.objects.get(pk=user.pk).save()
+        self.assertEqual(auth.get_user(self.request).first_name, 'Cached')
+
+    def test_changing_session_key(self):
+        # The session key of signed cookie sessions changes whenever the
+        # session is saved, which mustn't defeat the cache.
+        request = HttpRequest()
+        request.session = signed_cookies.SessionStore()
+        auth.login(request, auth.authenticate(username='cacheduser', password='pw'))
+        user = auth.get_user(request)
+        User.objects.filter(pk=user.pk).update(first_name='Cached')
+        request.session['other'] = 'data'
+        request.session.save()
+        next_request = HttpRequest()
+        next_request.session = signed_cookies.SessionStore(request.session.session_key)
+        self.assertEqual(auth.get_user(next_request).first_name, '')
+
+    def test_logout(self):
+        auth.get_user(self.request)
+        auth.logout(self.request)
+        self.assert_(isinstance(auth.get_user(self.request), AnonymousUser))
+
+    def test_deleted_user(self):
+        auth.get_user(self.request).delete()
+        self.assert_(isinstance(auth.get_user(self.request), AnonymousUser))
+
+    def test_disabled(self):
+        settings.AUTH_USER_CACHE_TIMEOUT = None
+        user = auth.get_user(self.request)
+        User.objects.filter(pk=user.pk).update(first_name='Uncached')
+        self.assertEqual(auth.get_user(self.request).first_name, 'Uncached')
@@ -27,6 +27,36 @@ _HTML_TYPES = ('text/html', 'application/xhtml+xml')
 def _make_token(session_id):
     return md5_constructor(settings.SECRET_KEY + session_id).hexdigest()
 
+def _cookie_token(request):
+    """
+    Returns the CSRF token for the session cookie the request came with, or
+    None if there is none.
+    """
+    session_id = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if session_id is None:
+        return None
+    return _make_token(session_id)
+
+def get_token(request):
+    """
+    Returns the CSRF token to put in the forms of the response. It's computed
+    only once per request.
+
+    Without a session cookie, the token is made from the key of the new
+    session (request.session), which is then marked as modified so that the
+    session middleware sends its cookie with the response; the next POST
+    carries that cookie. None is returned if there's no session at all.
+    """
+    if not hasattr(request, '_csrf_token'):
+        csrf_token = _cookie_token(request)
+        if csrf_token is None:
+            session = getattr(request, 'session', None)
+            if session is not None:
+                csrf_token = _make_token(session.session_key)
+                session.modified = True
+        request._csrf_token = csrf_token
+    return request._csrf_token
+
 class CsrfViewMiddleware(object):
     """
     Middleware that requires a present and correct csrfmiddlewaretoken
@@ -40,13 +70,11 @@ class CsrfViewMiddleware(object):
             if request.is_ajax():
                 return None
 
-            try:
-                session_id = request.COOKIES[settings.SESSION_COOKIE_NAME]
-            except KeyError:
+            csrf_token = _cookie_token(request)
+            if csrf_token is None:
                 # No session, no check required
                 return None
 
-            csrf_token = _make_token(session_id)
             # check incoming token
             try:
                 request_csrf_token = request.POST['csrfmiddlewaretoken']
@@ -63,11 +91,17 @@ class CsrfResponseMiddleware(object):
     Middleware that post-processes a response to add a
     csrfmiddlewaretoken if the response/request have an active
     session.
+
+    Responses whose templates already emitted the token with the
+    ``{% csrf_token %}`` tag are left alone.
     """
     def process_response(self, request, response):
         if getattr(response, 'csrf_exempt', False):
             return response
 
+        if getattr(request, '_csrf_token_inserted', False):
+            return response
+
         csrf_token = None
         try:
             # This covers a corner case in which the outgoing response
@@ -79,15 +113,11 @@ class CsrfResponseMiddleware(object):
             cookie = response.cookies[settings.SESSION_COOKIE_NAME]
             csrf_token = _make_token(cookie.value)
         except KeyError:
-            # Normal case - look for existing session cookie
-            try:
-                session_id = request.COOKIES[settings.SESSION_COOKIE_NAME]
-                csrf_token = _make_token(session_id)
-            except KeyError:
-                # no incoming or outgoing cookie
-                pass
+            # Normal case - look for existing session cookie (if there's no
+            # incoming or outgoing cookie, the token stays None).
+            csrf_token = _cookie_token(request)
 
-        if csrf_token is not None and \
+        if csrf_token is not None and not response.streaming and \
                 response['Content-Type'].split(';')[0] in _HTML_TYPES:
 
             # ensure we don't add the 'id' attribute twice (HTML validity)
@@ -1,8 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import re
+
 from django.test import TestCase
+from django.test.client import Client
 from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.contrib.csrf import middleware
 from django.contrib.csrf.middleware import CsrfMiddleware, _make_token, csrf_exempt
+from django.contrib.csrf.context_processors import csrf
+from django.conf.urls.defaults import patterns
+from django.template import RequestContext, Template
 from django.conf import settings
 
 
@@ -15,6 +22,20 @@ def post_form_response():
 def test_view(request):
     return post_form_response()
 
+def login_view(request):
+    """
+    Starts a session when the form is displayed, as the auth login view does.
+    """
+    if request.method == 'POST':
+        return HttpResponse('Logged in')
+    request.session.set_test_cookie()
+    t = Template("{% load csrf %}<form method='post'>{% csrf_token %}</form>")
+    return HttpResponse(t.render(RequestContext(request, processors=[csrf])))
+
+urlpatterns = patterns('',
+    (r'^login/$', login_view),
+)
+
 class CsrfMiddlewareTest(TestCase):
 
     _session_id = "1"
@@ -142,3 +163,86 @@ class CsrfMiddlewareTest(TestCase):
         req.META['HTTP_X_REQUESTED_WITH'] = 'XMLHttpRequest'
         req2 = CsrfMiddleware().process_view(req, self.get_view(), (), {})
         self.assertEquals(None, req2)
+
+    # Check the template tag
+    def _render_token_template(self, req):
+        t = Template("{% load csrf %}<form method='post'>{% csrf_token %}</form>")
+        c = RequestContext(req, processors=[csrf])
+        return HttpResponse(t.render(c), mimetype="text/html")
+
+    def test_token_tag(self):
+        """
+        Check that the template tag emits the token and that the response
+        is then left alone by the post-processor
+        """
+        req = self._get_GET_session_request()
+        resp = self._render_token_template(req)
+        self._check_token_present(resp)
+        resp_content = resp.content
+        resp2 = CsrfMiddleware().process_response(req, resp)
+        self.assertEquals(resp_content, resp2.content)
+
+    def test_token_tag_no_session(self):
+        """
+        Check that the template tag outputs nothing if no session is active
+        """
+        req = self._get_GET_no_session_request()
+        resp = self._render_token_template(req)
+        self.assertNotContains(resp, "csrfmiddlewaretoken")
+        self.failIf(getattr(req, '_csrf_token_inserted', False))
+
+    def test_token_unused(self):
+        """
+        Check that the post-processor still rewrites responses whose
+        templates didn't use the tag, even with the context processor
+        """
+        req = self._get_GET_session_request()
+        RequestContext(req, processors=[csrf])
+        resp = self._get_post_form_response()
+        resp2 = CsrfMiddleware().process_response(req, resp)
+        self._check_token_present(resp2)
+
+    def test_token_tag_skips_rewrite(self):
+        """
+        Check that the post-processor doesn't even search large responses
+        for forms once the tag emitted the token
+        """
+        class FailingRegex(object):
+            def sub(self, repl, string):
+                raise AssertionError('The response was searched for forms.')
+        req = self._get_GET_session_request()
+        resp = self._render_token_template(req)
+        resp.content = resp.content + '<p>Lorem ipsum</p>' * 30000
+        old_re = middleware._POST_FORM_RE
+        middleware._POST_FORM_RE = FailingRegex()
+        try:
+            CsrfMiddleware().process_response(req, resp)
+        finally:
+            middleware._POST_FORM_RE = old_re
+
+class CsrfTokenNewSessionTest(TestCase):
+    urls = 'django.contrib.csrf.tests'
+
+    def setUp(self):
+        self.old_middleware = settings.MIDDLEWARE_CLASSES
+        settings.MIDDLEWARE_CLASSES = (
+            'django.contrib.sessions.middleware.SessionMiddleware',
+            'django.contrib.csrf.middleware.CsrfViewMiddleware',
+        )
+
+    def tearDown(self):
+        settings.MIDDLEWARE_CLASSES = self.old_middleware
+
+    def test_token_for_new_session(self):
+        """
+        Check that a form rendered while a session is started carries the
+        token that the next POST, with the new session cookie, is checked
+        against
+        """
+        client = Client()
+        response = client.get('/login/')
+        self.failUnless(settings.SESSION_COOKIE_NAME in response.cookies)
+        token = re.search(r"name='csrfmiddlewaretoken' value='(\w+)'", response.content).group(1)
+        self.assertEquals(403, client.post('/login/').status_code)
+        response = client.post('/login/', {'csrfmiddlewaretoken': token})
+        self.assertContains(response, 'Logged in')
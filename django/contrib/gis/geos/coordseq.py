@@ -3,6 +3,7 @@
  by GEOSGeometry to house the actual coordinates of the Point,
  LineString, and LinearRing geometries.
 """
+from array import array
 from ctypes import c_double, c_uint, byref
 from django.contrib.gis.geos.base import GEOSBase, numpy
 from django.contrib.gis.geos.error import GEOSException, GEOSIndexError
@@ -24,8 +25,8 @@ class GEOSCoordSeq(GEOSBase):
 
     def __iter__(self):
         "Iterates over each point in the coordinate sequence."
-        for i in xrange(self.size):
-            yield self[i]
+        for coords in self._coord_list():
+            yield coords
 
     def __len__(self):
         "Returns the number of points in the coordinate sequence."
@@ -77,6 +78,14 @@ class GEOSCoordSeq(GEOSBase):
         if dim < 0 or dim > 2:
             raise GEOSException('invalid ordinate dimension "%d"' % dim)
 
+    def _coord_list(self):
+        "Returns a list with the coordinate tuples of this sequence."
+        coords = self.packed
+        if self.packed_dims == 3:
+            return zip(coords[0::3], coords[1::3], coords[2::3])
+        else:
+            return zip(coords[0::2], coords[1::2])
+
     #### Ordinate getting and setting routines ####
     def getOrdinate(self, dimension, index):
         "Returns the value for the given dimension and index."
@@ -125,6 +134,12 @@ class GEOSCoordSeq(GEOSBase):
         "Returns the dimensions of this coordinate sequence."
         return capi.cs_getdims(self.ptr, byref(c_uint()))
 
+    @property
+    def packed_dims(self):
+        "Returns the number of values per coordinate in `packed`."
+        if self._z and self.dims == 3: return 3
+        else: return 2
+
     @property
     def hasz(self):
         """
@@ -146,11 +161,31 @@ class GEOSCoordSeq(GEOSBase):
         if self.hasz: substr = '%s,%s,%s '
         else: substr = '%s,%s,0 '
         return '<coordinates>%s</coordinates>' % \
-            ''.join([substr % self[i] for i in xrange(len(self))]).strip()
+            ''.join([substr % coords for coords in self._coord_list()]).strip()
+
+    @property
+    def packed(self):
+        """
+        Returns the coordinates of this sequence as a flat array of doubles,
+        e.g., array('d', [x0, y0, x1, y1, ...]), with the Z values included
+        when the sequence is 3D (see `packed_dims`).  The coordinates are
+        retrieved from GEOS with a single WKB write instead of one call per
+        ordinate.
+        """
+        # Imported here because the I/O module depends on this one.
+        from django.contrib.gis.geos.geometry import GEOSGeometry
+        from django.contrib.gis.geos.io import packed_writer, unpack_wkb
+        n = self.size
+        if n == 0: return array('d')
+        # Writing a temporary geometry made from a clone of this sequence.
+        cs = capi.cs_clone(self.ptr)
+        if n == 1: geom = GEOSGeometry(capi.create_point(cs))
+        else: geom = GEOSGeometry(capi.create_linestring(cs))
+        return unpack_wkb(packed_writer(self.packed_dims).write(geom))[0]
 
     @property
     def tuple(self):
         "Returns a tuple version of this coordinate sequence."
         n = self.size
         if n == 1: return self[0]
-        else: return tuple([self[i] for i in xrange(n)])
+        else: return tuple(self._coord_list())
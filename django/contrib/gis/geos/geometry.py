@@ -36,6 +36,9 @@ class GEOSGeometry(GEOSBase, ListMixin):
 
     ptr_type = GEOM_PTR
 
+    # The cached prepared geometry (see the `prepared` property).
+    _prepared = None
+
     #### Python 'magic' routines ####
     def __init__(self, geo_input, srid=None):
         """
@@ -61,13 +64,13 @@ class GEOSGeometry(GEOSBase, ListMixin):
             if wkt_m:
                 # Handling WKT input.
                 if wkt_m.group('srid'): srid = int(wkt_m.group('srid'))
-                g = wkt_r.read(wkt_m.group('wkt'))
+                g = wkt_r().read(wkt_m.group('wkt'))
             elif hex_regex.match(geo_input):
                 # Handling HEXEWKB input.
-                g = wkb_r.read(geo_input)
+                g = wkb_r().read(geo_input)
             elif gdal.GEOJSON and gdal.geometries.json_regex.match(geo_input):
                 # Handling GeoJSON input.
-                g = wkb_r.read(gdal.OGRGeometry(geo_input).wkb)
+                g = wkb_r().read(gdal.OGRGeometry(geo_input).wkb)
             else:
                 raise ValueError('String or unicode input unrecognized as WKT EWKT, and HEXEWKB.')
         elif isinstance(geo_input, GEOM_PTR):
@@ -75,7 +78,7 @@ class GEOSGeometry(GEOSBase, ListMixin):
             g = geo_input
         elif isinstance(geo_input, buffer):
             # When the input is a buffer (WKB).
-            g = wkb_r.read(geo_input)
+            g = wkb_r().read(geo_input)
         elif isinstance(geo_input, GEOSGeometry):
             g = capi.geom_clone(geo_input.ptr)
         else:
@@ -142,7 +145,7 @@ class GEOSGeometry(GEOSBase, ListMixin):
     def __setstate__(self, state):
         # Instantiating from the tuple state that was pickled.
         wkb, srid = state
-        ptr = capi.from_wkb(wkb, len(wkb))
+        ptr = wkb_r().read(buffer(wkb))
         if not ptr: raise GEOSException('Invalid Geometry loaded from pickled state.')
         self.ptr = ptr
         self._post_init(srid)
@@ -342,6 +345,29 @@ class GEOSGeometry(GEOSBase, ListMixin):
         """
         return capi.geos_within(self.ptr, other.ptr)
 
+    #### Bulk predicates. ####
+    def contains_many(self, geoms):
+        """
+        Returns a list with the result of `contains` for each of the given
+        geometries or coordinate tuples.  This is a lot faster than calling
+        `contains` in a loop: the prepared version of this Geometry is used
+        when available, and no Point objects are created for the coordinates.
+        """
+        if GEOS_PREPARE:
+            return self.prepared.contains_many(geoms)
+        else:
+            return predicate_many(capi.geos_contains, self.ptr, geoms)
+
+    def intersects_many(self, geoms):
+        """
+        Returns a list with the result of `intersects` for each of the given
+        geometries or coordinate tuples (see `contains_many`).
+        """
+        if GEOS_PREPARE:
+            return self.prepared.intersects_many(geoms)
+        else:
+            return predicate_many(capi.geos_intersects, self.ptr, geoms)
+
     #### SRID Routines ####
     def get_srid(self):
         "Gets the SRID for the geometry, returns None if no SRID is set."
@@ -364,7 +390,7 @@ class GEOSGeometry(GEOSBase, ListMixin):
     @property
     def wkt(self):
         "Returns the WKT (Well-Known Text) of the Geometry."
-        return wkt_w.write(self)
+        return wkt_w().write(self)
 
     @property
     def hex(self):
@@ -375,7 +401,7 @@ class GEOSGeometry(GEOSBase, ListMixin):
         """
         # A possible faster, all-python, implementation:
         #  str(self.wkb).encode('hex')
-        return wkb_w.write_hex(self)
+        return wkb_w().write_hex(self)
 
     @property
     def json(self):
@@ -392,7 +418,7 @@ class GEOSGeometry(GEOSBase, ListMixin):
     @property
     def wkb(self):
         "Returns the WKB of the Geometry as a buffer."
-        return wkb_w.write(self)
+        return wkb_w().write(self)
 
     @property
     def kml(self):
@@ -404,12 +430,17 @@ class GEOSGeometry(GEOSBase, ListMixin):
     def prepared(self):
         """
         Returns a PreparedGeometry corresponding to this geometry -- it is
-        optimized for the contains, intersects, and covers operations.
+        optimized for the contains, intersects, and covers operations.  It is
+        cached, and only prepared again once this geometry has been modified.
         """
-        if GEOS_PREPARE:
-            return PreparedGeometry(self)
-        else:
+        if not GEOS_PREPARE:
             raise GEOSException('GEOS 3.1+ required for prepared geometry support.')
+        ptr = self.ptr
+        if self._prepared is None or self._prepared[0] is not ptr:
+            # Preparing a clone, so that modifying or deleting this geometry
+            # can't invalidate a prepared geometry that is still in use.
+            self._prepared = (ptr, PreparedGeometry(self.clone()))
+        return self._prepared[1]
 
     #### GDAL-specific output routines ####
     @property
@@ -454,7 +485,7 @@ class GEOSGeometry(GEOSBase, ListMixin):
             g = gdal.OGRGeometry(self.wkb, srid)
             g.transform(ct)
             # Getting a new GEOS pointer
-            ptr = wkb_r.read(g.wkb)
+            ptr = wkb_r().read(g.wkb)
             if clone:
                 # User wants a cloned transformed geometry returned.
                 return GEOSGeometry(ptr, srid=g.srid)
@@ -600,6 +631,36 @@ class GEOSGeometry(GEOSBase, ListMixin):
         "Clones this Geometry."
         return GEOSGeometry(capi.geom_clone(self.ptr), srid=self.srid)
 
+def predicate_many(func, ptr, geoms):
+    """
+    Returns a list with the results of the binary predicate `func` between
+    the given geometry pointer and each of the geometries or coordinate tuples
+    in `geoms`.  Coordinate tuples are turned into GEOS points directly, which
+    avoids the overhead of creating a Point object for each of them.
+    """
+    # Looking up the prototypes once, as this is called for large sequences.
+    create_cs, create_point, destroy_geom = capi.create_cs, capi.create_point, capi.destroy_geom
+    cs_setx, cs_sety, cs_setz = capi.cs_setx, capi.cs_sety, capi.cs_setz
+    results = []
+    append = results.append
+    for geom in geoms:
+        if isinstance(geom, GEOSGeometry):
+            append(func(ptr, geom.ptr))
+            continue
+        ndim = len(geom)
+        if ndim < 2 or ndim > 3:
+            raise TypeError('Invalid point dimension: %s' % str(ndim))
+        cs = create_cs(1, ndim)
+        cs_setx(cs, 0, float(geom[0]))
+        cs_sety(cs, 0, float(geom[1]))
+        if ndim == 3: cs_setz(cs, 0, float(geom[2]))
+        point = create_point(cs)
+        try:
+            append(func(ptr, point))
+        finally:
+            destroy_geom(point)
+    return results
+
 # Class mapping dictionary.  Has to be at the end to avoid import
 # conflicts with GEOSGeometry.
 from django.contrib.gis.geos.linestring import LineString, LinearRing
@@ -616,7 +677,7 @@ GEOS_CLASSES = {0 : Point,
                 7 : GeometryCollection,
                 }
 
-# Similarly, import the GEOS I/O instances here to avoid conflicts.
+# Similarly, import the GEOS I/O functions here to avoid conflicts.
 from django.contrib.gis.geos.io import wkt_r, wkt_w, wkb_r, wkb_w
 
 # If supported, import the PreparedGeometry class.
@@ -3,6 +3,8 @@ Module that holds classes for performing I/O operations on GEOS geometry
 objects.  Specifically, this has Python implementations of WKB/WKT
 reader and writer classes.
 """
+import struct, sys, threading
+from array import array
 from ctypes import byref, c_size_t
 from django.contrib.gis.geos.base import GEOSBase
 from django.contrib.gis.geos.error import GEOSException
@@ -116,8 +118,115 @@ class WKBWriter(IOBase):
 
     srid = property(_get_include_srid, _set_include_srid)
 
-# Instances of the WKT and WKB reader/writer objects.
-wkt_r = _WKTReader()
-wkt_w = WKTWriter()
-wkb_r = _WKBReader()
-wkb_w = WKBWriter()
+### Thread-local reader/writer instances ###
+
+# The GEOS reader and writer objects may not be used by several threads at
+# once, so each thread gets its own instances -- created on first use and
+# then reused, instead of being created for every geometry.
+class ThreadLocalIO(threading.local):
+    def __init__(self):
+        self.wkt_r = None
+        self.wkt_w = None
+        self.wkb_r = None
+        self.wkb_w = None
+        # The packed coordinates writers, keyed by output dimension.
+        self.packed_w = {}
+
+thread_context = ThreadLocalIO()
+
+def wkt_r():
+    "Returns the WKT reader (returning pointers) of the current thread."
+    if thread_context.wkt_r is None: thread_context.wkt_r = _WKTReader()
+    return thread_context.wkt_r
+
+def wkt_w():
+    "Returns the WKT writer of the current thread."
+    if thread_context.wkt_w is None: thread_context.wkt_w = WKTWriter()
+    return thread_context.wkt_w
+
+def wkb_r():
+    "Returns the WKB reader (returning pointers) of the current thread."
+    if thread_context.wkb_r is None: thread_context.wkb_r = _WKBReader()
+    return thread_context.wkb_r
+
+def wkb_w():
+    "Returns the WKB writer of the current thread."
+    if thread_context.wkb_w is None: thread_context.wkb_w = WKBWriter()
+    return thread_context.wkb_w
+
+### Packed coordinates ###
+
+# Packed coordinates are flat arrays of doubles, e.g., array('d', [x0, y0,
+# x1, y1, ...]), that are moved in and out of GEOS as WKB with a single call.
+# The WKB uses the native byte order, so that the coordinates may be copied
+# from and to it directly.
+WKB_NATIVE = int(sys.byteorder == 'little')
+WKB_HAS_Z = 0x80000000
+
+def packed_writer(dims):
+    """
+    Returns the WKBWriter of the current thread that writes native WKB with
+    the given dimension.
+    """
+    writer = thread_context.packed_w.get(dims)
+    if writer is None:
+        writer = WKBWriter()
+        writer.byteorder = WKB_NATIVE
+        writer.outdim = dims
+        thread_context.packed_w[dims] = writer
+    return writer
+
+def pack_wkb(geom_type, rings, dims):
+    """
+    Returns the native WKB for a LineString (`geom_type` 2) or a Polygon
+    (`geom_type` 3) with the given sequence of packed coordinates (a single
+    one for LineStrings).
+    """
+    if dims not in (2, 3): raise TypeError('Invalid coordinate dimension: %s' % str(dims))
+    if dims == 3: geom_type |= WKB_HAS_Z
+    parts = [struct.pack('=BI', WKB_NATIVE, geom_type)]
+    if geom_type & 0xff == 3:
+        parts.append(struct.pack('=I', len(rings)))
+    for coords in rings:
+        if not isinstance(coords, array) or coords.typecode != 'd':
+            coords = array('d', coords)
+        if len(coords) % dims:
+            raise TypeError('Number of packed coordinates is not a multiple of %d.' % dims)
+        parts.append(struct.pack('=I', len(coords) // dims))
+        parts.append(coords.tostring())
+    return ''.join(parts)
+
+def unpack_wkb(wkb):
+    """
+    Returns the coordinates of the given Point, LineString, or Polygon WKB
+    (as written by a `packed_writer`) as a list of packed coordinates: one
+    per ring for Polygons, a single one otherwise.
+    """
+    wkb = str(wkb)
+    geom_type = struct.unpack('=I', wkb[1:5])[0]
+    if geom_type & WKB_HAS_Z: dims = 3
+    else: dims = 2
+    geom_type &= 0xff
+    if geom_type == 1:
+        nrings, offset = None, 5
+    elif geom_type == 2:
+        nrings, offset = 1, 5
+    elif geom_type == 3:
+        nrings, offset = struct.unpack('=I', wkb[5:9])[0], 9
+    else:
+        raise GEOSException('Cannot unpack coordinates of WKB geometry type %d.' % geom_type)
+
+    if nrings is None:
+        # A Point has no number of coordinates.
+        coords = array('d')
+        coords.fromstring(wkb[offset:])
+        return [coords]
+    rings = []
+    for i in xrange(nrings):
+        size = struct.unpack('=I', wkb[offset:offset + 4])[0] * dims * 8
+        offset += 4
+        coords = array('d')
+        coords.fromstring(wkb[offset:offset + size])
+        rings.append(coords)
+        offset += size
+    return rings
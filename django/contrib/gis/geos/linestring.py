@@ -1,7 +1,9 @@
+from array import array
 from django.contrib.gis.geos.base import numpy
 from django.contrib.gis.geos.coordseq import GEOSCoordSeq
 from django.contrib.gis.geos.error import GEOSException
 from django.contrib.gis.geos.geometry import GEOSGeometry
+from django.contrib.gis.geos.io import pack_wkb, wkb_r
 from django.contrib.gis.geos.point import Point
 from django.contrib.gis.geos import prototypes as capi
 
@@ -49,21 +51,19 @@ class LineString(GEOSGeometry):
         else:
             raise TypeError('Invalid initialization input for LineStrings.')
 
-        # Creating a coordinate sequence object because it is easier to
-        # set the points using GEOSCoordSeq.__setitem__().
-        cs = GEOSCoordSeq(capi.create_cs(ncoords, ndim), z=bool(ndim==3))
-
+        # Packing the coordinates, so that the geometry may be created
+        # with a single WKB read.
+        packed = array('d')
         for i in xrange(ncoords):
-            if numpy_coords: cs[i] = coords[i,:]
-            elif isinstance(coords[i], Point): cs[i] = coords[i].tuple
-            else: cs[i] = coords[i]
+            if numpy_coords: packed.extend(coords[i,:])
+            elif isinstance(coords[i], Point): packed.extend(coords[i].tuple)
+            else: packed.extend(coords[i])
 
         # If SRID was passed in with the keyword arguments
         srid = kwargs.get('srid', None)
 
-        # Calling the base geometry initialization with the returned pointer
-        #  from the function.
-        super(LineString, self).__init__(self._init_func(cs.ptr), srid=srid)
+        # Calling the base geometry initialization with the returned pointer.
+        super(LineString, self).__init__(self._packed_ptr(packed, ndim), srid=srid)
 
     def __iter__(self):
         "Allows iteration over this LineString."
@@ -100,6 +100,7 @@ class LineString(GEOSGeometry):
     def _set_single(self, index, value):
         self._checkindex(index)
         self._cs[index] = value
+        self._prepared = None
 
     def _checkdim(self, dim):
         if dim not in (2, 3): raise TypeError('Dimension mismatch.')
@@ -111,6 +112,34 @@ class LineString(GEOSGeometry):
         return self._cs.tuple
     coords = tuple
 
+    @property
+    def packed(self):
+        """
+        Returns the coordinates as a flat array of doubles, e.g.,
+        array('d', [x0, y0, x1, y1, ...]).  See GEOSCoordSeq.packed.
+        """
+        return self._cs.packed
+
+    @classmethod
+    def from_packed(cls, coords, dims=2, srid=None):
+        """
+        Constructs a LineString (or LinearRing) from a flat sequence of
+        coordinates, like the array('d') returned by `packed`.  The geometry
+        is created from WKB with a single GEOS call instead of setting each
+        ordinate on a coordinate sequence.
+        """
+        return GEOSGeometry(cls._packed_ptr(coords, dims), srid=srid)
+
+    @classmethod
+    def _packed_ptr(cls, coords, dims):
+        "Returns a pointer to a new geometry of this type with the packed coordinates."
+        ptr = wkb_r().read(buffer(pack_wkb(2, [coords], dims)))
+        if cls._init_func is not capi.create_linestring:
+            # WKB has no LinearRing type.
+            line = GEOSGeometry(ptr)
+            ptr = cls._init_func(capi.cs_clone(line._cs.ptr))
+        return ptr
+
     def _listarr(self, func):
         """
         Internal routine that returns a sequence (list) corresponding with
@@ -120,10 +149,24 @@ class LineString(GEOSGeometry):
         if numpy: return numpy.array(lst) # ARRRR!
         else: return lst
 
+    def _packed_listarr(self, dim=None):
+        """
+        Like `_listarr`, but built from the packed coordinates: returns the
+        given ordinate of all the points, or all the coordinates when `dim`
+        is None.
+        """
+        coords, dims = self._cs.packed, self._cs.packed_dims
+        if dim is None:
+            lst = [tuple(coords[i:i + dims]) for i in xrange(0, len(coords), dims)]
+        else:
+            lst = coords[dim::dims].tolist()
+        if numpy: return numpy.array(lst)
+        else: return lst
+
     @property
     def array(self):
         "Returns a numpy array for the LineString."
-        return self._listarr(self._cs.__getitem__)
+        return self._packed_listarr()
 
     @property
     def merged(self):
@@ -133,18 +176,18 @@ class LineString(GEOSGeometry):
     @property
     def x(self):
         "Returns a list or numpy array of the X variable."
-        return self._listarr(self._cs.getX)
+        return self._packed_listarr(0)
 
     @property
     def y(self):
         "Returns a list or numpy array of the Y variable."
-        return self._listarr(self._cs.getY)
+        return self._packed_listarr(1)
 
     @property
     def z(self):
         "Returns a list or numpy array of the Z variable."
         if not self.hasz: return None
-        else: return self._listarr(self._cs.getZ)
+        else: return self._packed_listarr(2)
 
 # LinearRings are LineStrings used within Polygons.
 class LinearRing(LineString):
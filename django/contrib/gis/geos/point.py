@@ -64,6 +64,7 @@ class Point(GEOSGeometry):
 
     def _set_single(self, index, value):
         self._cs.setOrdinate(index, 0, value)
+        self._prepared = None
 
     def __iter__(self):
         "Allows iteration over coordinates of this Point."
@@ -93,6 +94,7 @@ class Point(GEOSGeometry):
     def set_x(self, value):
         "Sets the X component of the Point."
         self._cs.setOrdinate(0, 0, value)
+        self._prepared = None
 
     def get_y(self):
         "Returns the Y component of the Point."
@@ -101,6 +103,7 @@ class Point(GEOSGeometry):
     def set_y(self, value):
         "Sets the Y component of the Point."
         self._cs.setOrdinate(1, 0, value)
+        self._prepared = None
 
     def get_z(self):
         "Returns the Z component of the Point."
@@ -113,6 +116,7 @@ class Point(GEOSGeometry):
         "Sets the Z component of the Point."
         if self.hasz:
             self._cs.setOrdinate(2, 0, value)
+            self._prepared = None
         else:
             raise GEOSException('Cannot set Z on 2D Point.')
 
@@ -129,6 +133,7 @@ class Point(GEOSGeometry):
     def set_coords(self, tup):
         "Sets the coordinates of the point with the given tuple."
         self._cs[0] = tup
+        self._prepared = None
 
     # The tuple and coords properties
     tuple = property(get_coords, set_coords)
@@ -1,6 +1,7 @@
 from ctypes import c_uint, byref
 from django.contrib.gis.geos.error import GEOSIndexError
 from django.contrib.gis.geos.geometry import GEOSGeometry
+from django.contrib.gis.geos.io import pack_wkb, packed_writer, unpack_wkb, wkb_r
 from django.contrib.gis.geos.libgeos import get_pointer_arr, GEOM_PTR
 from django.contrib.gis.geos.linestring import LinearRing
 from django.contrib.gis.geos import prototypes as capi
@@ -59,6 +60,25 @@ class Polygon(GEOSGeometry):
         return GEOSGeometry( 'POLYGON((%s %s, %s %s, %s %s, %s %s, %s %s))' %  (
                 x0, y0, x0, y1, x1, y1, x1, y0, x0, y0) )
 
+    @classmethod
+    def from_packed(cls, rings, dims=2, srid=None):
+        """
+        Constructs a Polygon from a sequence of rings given as flat sequences
+        of coordinates (the exterior ring first), like the arrays returned by
+        `packed`.  The geometry is created from WKB with a single GEOS call.
+        """
+        return GEOSGeometry(wkb_r().read(buffer(pack_wkb(3, rings, dims))), srid=srid)
+
+    @property
+    def packed(self):
+        """
+        Returns a list with the coordinates of each ring (the exterior ring
+        first) as a flat array of doubles.  See GEOSCoordSeq.packed.
+        """
+        if self.hasz: dims = 3
+        else: dims = 2
+        return unpack_wkb(packed_writer(dims).write(self))
+
     ### These routines are needed for list-like operation w/ListMixin ###
     def _create_polygon(self, length, items):
         # Instantiate LinearRing objects if necessary, but don't clone them yet
@@ -1,5 +1,5 @@
 from django.contrib.gis.geos.base import GEOSBase
-from django.contrib.gis.geos.geometry import GEOSGeometry
+from django.contrib.gis.geos.geometry import GEOSGeometry, predicate_many
 from django.contrib.gis.geos.prototypes import prepared as capi
 
 class PreparedGeometry(GEOSBase):
@@ -12,6 +12,9 @@ class PreparedGeometry(GEOSBase):
 
     def __init__(self, geom):
         if not isinstance(geom, GEOSGeometry): raise TypeError
+        # The prepared geometry refers to the original one, so keep it
+        # from being garbage collected.
+        self._base_geom = geom
         self.ptr = capi.geos_prepare(geom.ptr)
 
     def __del__(self):
@@ -28,3 +31,17 @@ class PreparedGeometry(GEOSBase):
 
     def intersects(self, other):
         return capi.prepared_intersects(self.ptr, other.ptr)
+
+    def contains_many(self, geoms):
+        """
+        Returns a list with the result of `contains` for each of the given
+        geometries or coordinate tuples.
+        """
+        return predicate_many(capi.prepared_contains, self.ptr, geoms)
+
+    def intersects_many(self, geoms):
+        """
+        Returns a list with the result of `intersects` for each of the given
+        geometries or coordinate tuples.
+        """
+        return predicate_many(capi.prepared_intersects, self.ptr, geoms)
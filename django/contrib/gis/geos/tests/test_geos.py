@@ -459,6 +459,33 @@ class GEOSTest(unittest.TestCase):
                         cs[i] = tset
                         self.assertEqual(tset[j], cs[i][j])
 
+    def test08b_packed_coords(self):
+        "Testing packed coordinates."
+        from array import array
+        for p in polygons:
+            poly = fromstr(p.wkt)
+            rings = poly.packed
+            self.assertEqual(len(poly), len(rings))
+            for ring, coords in zip(poly, rings):
+                cs = ring.coord_seq
+                self.assertEqual(cs.packed_dims * len(cs), len(coords))
+                self.assertEqual(array('d', [x for c in cs.tuple for x in c]), coords)
+                self.assertEqual(coords, ring.packed)
+                self.assertEqual(ring, LinearRing.from_packed(coords))
+            self.assertEqual(poly, Polygon.from_packed(rings))
+
+        ls = LineString.from_packed([0, 0, 1, 1, 2, 3], srid=4326)
+        self.assertEqual(True, isinstance(ls, LineString))
+        self.assertEqual(4326, ls.srid)
+        self.assertEqual(((0, 0), (1, 1), (2, 3)), ls.tuple)
+        self.assertEqual([(0, 0), (1, 1), (2, 3)], list(ls.coord_seq))
+        ls3d = LineString.from_packed(array('d', [0, 0, 0, 1, 1, 1]), dims=3)
+        self.assertEqual(True, ls3d.hasz)
+        self.assertEqual(((0, 0, 0), (1, 1, 1)), ls3d.tuple)
+        self.assertEqual(array('d', [1, 2]), Point(1, 2).coord_seq.packed)
+        self.assertRaises(TypeError, LineString.from_packed, [0, 0, 1])
+        self.assertRaises(TypeError, LineString.from_packed, [0, 0, 1, 1], dims=4)
+
     def test09_relate_pattern(self):
         "Testing relate() and relate_pattern()."
         g = fromstr('POINT (0 0)')
@@ -865,6 +892,16 @@ class GEOSTest(unittest.TestCase):
             self.assertEqual(mpoly.intersects(pnt), prep.intersects(pnt))
             self.assertEqual(c, prep.covers(pnt))
 
+        # The prepared geometry is cached until the geometry is modified.
+        self.assertEqual(True, prep is mpoly.prepared)
+        poly = mpoly[0]
+        prep = poly.prepared
+        poly[0] = LinearRing((0, 0), (0, 10), (10, 10), (10, 0), (0, 0))
+        self.assertEqual(False, prep is poly.prepared)
+        self.assertEqual(True, poly.prepared.contains(Point(7.5, 7.5)))
+        del poly
+        self.assertEqual(True, prep.contains(Point(2.5, 2.5)))
+
     def test26_line_merge(self):
         "Testing line merge support"
         ref_geoms = (fromstr('LINESTRING(1 1, 1 1, 3 3)'),
@@ -876,6 +913,23 @@ class GEOSTest(unittest.TestCase):
         for geom, merged in zip(ref_geoms, ref_merged):
             self.assertEqual(merged, geom.merged)
 
+    def test27_predicates_many(self):
+        "Testing the bulk predicates."
+        mpoly = GEOSGeometry('MULTIPOLYGON(((0 0,0 5,5 5,5 0,0 0)),((5 5,5 10,10 10,10 5,5 5)))')
+        coords = [(5, 5), (7.5, 7.5), (2.5, 7.5), (10, 7.5), (2, 2, 1)]
+        geoms = [Point(*c) for c in coords] + [LineString((2.5, 2.5), (7.5, 2.5))]
+        for many, single in ((mpoly.contains_many, mpoly.contains),
+                             (mpoly.intersects_many, mpoly.intersects)):
+            self.assertEqual([single(g) for g in geoms], many(geoms))
+            self.assertEqual([single(Point(*c)) for c in coords], many(coords))
+            self.assertEqual([], many([]))
+        self.assertEqual([False, True, False, False, True], mpoly.contains_many(coords))
+        self.assertRaises(TypeError, mpoly.contains_many, [(1,)])
+        if GEOS_PREPARE:
+            prep = mpoly.prepared
+            self.assertEqual(mpoly.contains_many(geoms), prep.contains_many(geoms))
+            self.assertEqual(mpoly.intersects_many(coords), prep.intersects_many(coords))
+
 def suite():
     s = unittest.TestSuite()
     s.addTest(unittest.makeSuite(GEOSTest))
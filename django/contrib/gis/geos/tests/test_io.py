@@ -1,4 +1,4 @@
-import binascii, ctypes, unittest
+import binascii, ctypes, threading, unittest
 from django.contrib.gis.geos import GEOSGeometry, WKTReader, WKTWriter, WKBReader, WKBWriter, geos_version_info
 
 class GEOSIOTest(unittest.TestCase):
@@ -103,6 +103,29 @@ class GEOSIOTest(unittest.TestCase):
             self.assertEqual(hex3d_srid, wkb_w.write_hex(g))
             self.assertEqual(wkb3d_srid, wkb_w.write(g))
 
+    def test04_thread_local(self):
+        "Testing the per-thread reader and writer instances."
+        from django.contrib.gis.geos import io
+        readers = io.wkb_r(), io.wkt_r(), io.wkb_w(), io.wkt_w()
+        self.assertEqual(readers, (io.wkb_r(), io.wkt_r(), io.wkb_w(), io.wkt_w()))
+
+        g = GEOSGeometry('LINESTRING (0 0, 1 1, 2 3)')
+        results = []
+        def worker():
+            results.append((io.wkb_r(), io.wkt_w()))
+            for i in xrange(100):
+                h = GEOSGeometry(g.hex)
+                results.append(GEOSGeometry(h.wkt) == g)
+        threads = [threading.Thread(target=worker) for i in xrange(4)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        self.assertEqual([True] * 400, [r for r in results if r is True])
+        instances = [r for r in results if r is not True]
+        self.assertEqual(4, len(instances))
+        for wkb_r, wkt_w in instances:
+            self.assertEqual(False, wkb_r is readers[0])
+            self.assertEqual(False, wkt_w is readers[3])
+
 def suite():
     s = unittest.TestSuite()
     s.addTest(unittest.makeSuite(GEOSIOTest))
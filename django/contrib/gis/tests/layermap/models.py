@@ -23,6 +23,17 @@ class City(models.Model):
     point = models.PointField()
     objects = models.GeoManager()
 
+class CensusCity(models.Model):
+    name = models.CharField(max_length=25)
+    population = models.IntegerField(unique=True)
+    point = models.PointField()
+    objects = models.GeoManager()
+
+class ProjectedCity(models.Model):
+    name = models.CharField(max_length=25)
+    point = models.PointField(srid=32140) # NAD83 / Texas South Central
+    objects = models.GeoManager()
+
 class Interstate(models.Model):
     name = models.CharField(max_length=20)
     length = models.DecimalField(max_digits=6, decimal_places=2)
@@ -46,6 +57,15 @@ city_mapping = {'name' : 'Name',
                 'point' : 'POINT',
                 }
 
+census_mapping = {'name' : 'Name',
+                  'population' : 'Population',
+                  'point' : 'POINT',
+                  }
+
+proj_mapping = {'name' : 'Name',
+                'point' : 'POINT',
+                }
+
 inter_mapping = {'name' : 'Name',
                  'length' : 'Length',
                  'path' : 'LINESTRING',
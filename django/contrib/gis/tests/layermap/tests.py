@@ -1,10 +1,12 @@
 import os, unittest
 from copy import copy
 from decimal import Decimal
-from models import City, County, CountyFeat, Interstate, State, city_mapping, co_mapping, cofeat_mapping, inter_mapping
+from models import City, CensusCity, County, CountyFeat, Interstate, ProjectedCity, State, \
+     census_mapping, city_mapping, co_mapping, cofeat_mapping, inter_mapping, proj_mapping
 from django.contrib.gis.db.backend import SpatialBackend
 from django.contrib.gis.utils.layermapping import LayerMapping, LayerMapError, InvalidDecimal, MissingForeignKey
 from django.contrib.gis.gdal import DataSource
+from django.db import transaction
 
 shp_path = os.path.dirname(__file__)
 city_shp = os.path.join(shp_path, '../data/cities/cities.shp')
@@ -242,6 +244,81 @@ class LayerMapTest(unittest.TestCase):
             lm.save(step=st, strict=True)
             self.county_helper(county_feat=False)
 
+    def test06_batch_size(self):
+        "Tests the `batch_size` keyword of .save()."
+        # The unique models are retrieved for a whole batch at a time, and
+        # features of the same batch for the same unique model are merged.
+        for bs in (1, 3, 1000):
+            County.objects.all().delete()
+            CountyFeat.objects.all().delete()
+            lm = LayerMapping(County, co_shp, co_mapping, transform=False, unique='name')
+            lm.save(silent=True, strict=True, batch_size=bs)
+            lm = LayerMapping(CountyFeat, co_shp, cofeat_mapping, transform=False)
+            lm.save(silent=True, strict=True, batch_size=bs)
+            self.county_helper()
+
+        # Bulk mode along with the `step` keyword.
+        County.objects.all().delete()
+        lm = LayerMapping(County, co_shp, co_mapping, transform=False, unique='name')
+        lm.save(step=4, strict=True, batch_size=3)
+        self.county_helper(county_feat=False)
+
+        # Invalid features are still reported when not in `strict` mode.
+        Interstate.objects.all().delete()
+        lm = LayerMapping(Interstate, inter_shp, inter_mapping)
+        lm.save(silent=True, batch_size=10)
+        self.assertEqual(2, Interstate.objects.count())
+
+        if not SpatialBackend.mysql:
+            # Geometries are transformed by the database when the source SRID
+            # is known to it.
+            ProjectedCity.objects.all().delete()
+            lm = LayerMapping(ProjectedCity, city_shp, proj_mapping, source_srs=4326)
+            self.failUnless(lm.can_db_transform())
+            lm.save(strict=True, batch_size=2)
+            self.assertEqual(3, ProjectedCity.objects.count())
+            for feat in DataSource(city_shp)[0]:
+                city = ProjectedCity.objects.get(name=feat['Name'].value)
+                geom = feat.geom
+                geom.transform(32140)
+                self.assertAlmostEqual(geom.x, city.point.x, 3)
+                self.assertAlmostEqual(geom.y, city.point.y, 3)
+
+    def test07_batch_constraint(self):
+        "Tests a batch whose INSERT fails on a constraint."
+        # The MySQL spatial tables (MyISAM) can't roll back the rows of the
+        # failed INSERT.
+        if SpatialBackend.mysql: return
+        ds = DataSource(city_shp)
+        feats = list(ds[0])
+        for mode in ('commit_on_success', 'autocommit'):
+            # The last feature of the batch has the population of an existing
+            # city, so the rows inserted before it must not be kept when
+            # falling back on saving the models one at a time.
+            CensusCity.objects.all().delete()
+            CensusCity.objects.create(name='Existing', population=feats[-1]['Population'].value,
+                                      point='POINT(0 0)')
+            lm = LayerMapping(CensusCity, ds, census_mapping, transaction_mode=mode)
+            lm.save(silent=True, batch_size=10)
+            self.assertEqual(len(feats), CensusCity.objects.count())
+            for feat in feats[:-1]:
+                self.assertEqual(1, CensusCity.objects.filter(name=feat['Name'].value).count())
+            self.assertEqual(0, CensusCity.objects.filter(name=feats[-1]['Name'].value).count())
+
+        # In the 'commit_on_success' mode, the batches saved before the
+        # failing one are rolled back along with it.
+        CensusCity.objects.exclude(name='Existing').delete()
+        lm = LayerMapping(CensusCity, ds, census_mapping)
+        self.assertRaises(Exception, lm.save, silent=True, strict=True, batch_size=1)
+        self.assertEqual(1, CensusCity.objects.count())
+
+        # Batches are committed in the 'autocommit' mode.
+        CensusCity.objects.all().delete()
+        lm = LayerMapping(CensusCity, ds, census_mapping, transaction_mode='autocommit')
+        lm.save(strict=True, batch_size=10)
+        transaction.rollback()
+        self.assertEqual(len(feats), CensusCity.objects.count())
+
 def suite():
     s = unittest.TestSuite()
     s.addTest(unittest.makeSuite(LayerMapTest))
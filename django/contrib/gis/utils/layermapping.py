@@ -107,6 +107,7 @@ Example:
  specify one.
 """
 import sys
+import time
 from datetime import date, datetime
 from decimal import Decimal
 from django.core.exceptions import ObjectDoesNotExist
@@ -116,7 +117,9 @@ from django.contrib.gis.gdal import CoordTransform, DataSource, \
     OGRException, OGRGeometry, OGRGeomType, SpatialReference
 from django.contrib.gis.gdal.field import \
     OFTDate, OFTDateTime, OFTInteger, OFTReal, OFTString, OFTTime
-from django.db import models, transaction
+from django.db import connection, models, transaction
+from django.db.models.query import execute_insert_many
+from django.db.models.sql import InsertQuery
 from django.contrib.localflavor.us.models import USStateField
 
 # LayerMapping exceptions.
@@ -126,6 +129,10 @@ class InvalidDecimal(LayerMapError): pass
 class InvalidInteger(LayerMapError): pass
 class MissingForeignKey(LayerMapError): pass
 
+# Raised when the INSERT of a batch fails inside a transaction that can only
+# be rolled back as a whole (see LayerMapping.save()).
+class _BatchInsertFailed(Exception): pass
+
 class LayerMapping(object):
     "A class that maps OGR Layers to GeoDjango Models."
     
@@ -156,6 +163,9 @@ class LayerMapping(object):
         models.PositiveSmallIntegerField : (OFTInteger, OFTReal, OFTString),
         }
 
+    # The number of unique models retrieved by each query in bulk mode.
+    UNIQUE_LOOKUP_SIZE = 100
+
     # The acceptable transaction modes.
     TRANSACTION_MODES = {'autocommit' : transaction.autocommit,
                          'commit_on_success' : transaction.commit_on_success,
@@ -226,6 +236,10 @@ class LayerMapping(object):
             self.transaction_mode = transaction_mode
         else:
             raise LayerMapError('Unrecognized transaction mode: %s' % transaction_mode)
+
+        # Related models retrieved for ForeignKey mappings, only kept
+        # while saving in bulk mode.
+        self.fk_cache = None
     
     #### Checking routines used during initialization ####
     def check_fid_range(self, fid_range):
@@ -358,10 +372,11 @@ class LayerMapping(object):
             raise TypeError('Unique keyword argument must be set with a tuple, list, or string.')
 
     #### Keyword argument retrieval routines ####
-    def feature_kwargs(self, feat):
+    def feature_kwargs(self, feat, db_transform=False):
         """
         Given an OGR Feature, this will return a dictionary of keyword arguments
-        for constructing the mapped model.
+        for constructing the mapped model.  If `db_transform` is set, the
+        geometry is left for the database to transform (see `verify_geom`).
         """
         # The keyword arguments for model construction.
         kwargs = {}
@@ -373,7 +388,7 @@ class LayerMapping(object):
             
             if isinstance(model_field, GeometryField):
                 # Verify OGR geometry.
-                val = self.verify_geom(feat.geom, model_field)
+                val = self.verify_geom(feat.geom, model_field, db_transform)
             elif isinstance(model_field, models.base.ModelBase):
                 # The related _model_, not a field was passed in -- indicating
                 # another mapping for the related Model.
@@ -399,6 +414,58 @@ class LayerMapping(object):
         else:
             return dict((fld, kwargs[fld]) for fld in self.unique)
 
+    def unique_fields(self):
+        "Returns the list of the field names given with the `unique` keyword."
+        if isinstance(self.unique, basestring):
+            return [self.unique]
+        else:
+            return list(self.unique)
+
+    def unique_key(self, values):
+        """
+        Returns a hashable key for the given unique field values (as in the
+        feature keyword arguments, but related models may be given by their
+        primary key), so that features and retrieved models can be compared.
+        """
+        key = []
+        for fld in self.unique_fields():
+            val = values[fld]
+            if isinstance(self.fields[fld], GeometryField):
+                # Normalizing the WKT (OGR and GEOS format it differently).
+                val = SpatialBackend.Geometry(str(val)).wkt
+            elif isinstance(val, models.Model):
+                val = val.pk
+            key.append(val)
+        return tuple(key)
+
+    def unique_models(self, kwargs_list):
+        """
+        Given a list of feature keyword arguments, returns a dictionary of the
+        existing unique models they correspond to, keyed by `unique_key`.  The
+        models are retrieved with a query for every `UNIQUE_LOOKUP_SIZE`
+        features, rather than one for each.
+        """
+        fields = self.unique_fields()
+        attnames = {}
+        for fld in fields:
+            attnames[fld] = self.model._meta.get_field(fld).attname
+
+        found = {}
+        for i in xrange(0, len(kwargs_list), self.UNIQUE_LOOKUP_SIZE):
+            chunk = kwargs_list[i:i + self.UNIQUE_LOOKUP_SIZE]
+            if len(fields) == 1 and not isinstance(self.fields[fields[0]], GeometryField):
+                qs = self.model.objects.filter(**{'%s__in' % fields[0] : 
+                                                  [kwargs[fields[0]] for kwargs in chunk]})
+            else:
+                q = models.Q(**self.unique_kwargs(chunk[0]))
+                for kwargs in chunk[1:]:
+                    q |= models.Q(**self.unique_kwargs(kwargs))
+                qs = self.model.objects.filter(q)
+            for m in qs:
+                values = dict((fld, getattr(m, attnames[fld])) for fld in fields)
+                found[self.unique_key(values)] = m
+        return found
+
     #### Verification routines used in constructing model keyword arguments. ####
     def verify_ogr_field(self, ogr_field, model_field):
         """
@@ -461,26 +528,35 @@ class LayerMapping(object):
         this routine will retrieve the related model for the ForeignKey
         mapping.
         """
-        # TODO: It is expensive to retrieve a model for every record --
-        #  explore if an efficient mechanism exists for caching related 
-        #  ForeignKey models.
-
         # Constructing and verifying the related model keyword arguments.
         fk_kwargs = {}
         for field_name, ogr_name in rel_mapping.items():
             fk_kwargs[field_name] = self.verify_ogr_field(feat[ogr_name], rel_model._meta.get_field(field_name))
 
+        # In bulk mode, related models are only retrieved once.
+        if self.fk_cache is not None:
+            cache_key = (rel_model, tuple(sorted(fk_kwargs.items())))
+            if cache_key in self.fk_cache:
+                return self.fk_cache[cache_key]
+
         # Attempting to retrieve and return the related model.
         try:
-            return rel_model.objects.get(**fk_kwargs)
+            rel_obj = rel_model.objects.get(**fk_kwargs)
         except ObjectDoesNotExist:
             raise MissingForeignKey('No ForeignKey %s model found with keyword arguments: %s' % (rel_model.__name__, fk_kwargs))
+        if self.fk_cache is not None:
+            self.fk_cache[cache_key] = rel_obj
+        return rel_obj
             
-    def verify_geom(self, geom, model_field):
+    def verify_geom(self, geom, model_field, db_transform=False):
         """
         Verifies the geometry -- will construct and return a GeometryCollection
         if necessary (for example if the model field is MultiPolygonField while
         the mapped shapefile only contains Polygons).
+
+        If `db_transform` is set, the geometry is not transformed; it is
+        returned as EWKT in the SRID of the source, which the database will
+        transform when the model is inserted.
         """
         if self.make_multi(geom.geom_type, model_field):
             # Constructing a multi-geometry type to contain the single geometry
@@ -493,12 +569,67 @@ class LayerMapping(object):
         # Transforming the geometry with our Coordinate Transformation object,
         # but only if the class variable `transform` is set w/a CoordTransform 
         # object.
-        if self.transform: g.transform(self.transform)
+        if self.transform:
+            if db_transform:
+                return 'SRID=%s;%s' % (self.source_srs.srid, g.wkt)
+            g.transform(self.transform)
         
         # Returning the WKT of the geometry.
         return g.wkt
 
     #### Other model methods ####
+    def add_geometries(self, m, kwargs):
+        """
+        Adds the geometries from the feature keyword arguments into the
+        geometry collection of the given unique model.
+        """
+        # Getting the geometry (in OGR form), creating one from the kwargs 
+        # WKT, adding in additional geometries, and update the attribute 
+        # with the just-updated geometry WKT.
+        geom = getattr(m, self.geom_field).ogr
+        new = OGRGeometry(kwargs[self.geom_field])
+        for g in new: geom.add(g) 
+        setattr(m, self.geom_field, geom.wkt)
+
+    def can_db_transform(self):
+        """
+        Returns True if the coordinate transformation may be left to the
+        database when saving in bulk mode -- the SRID of the source must be
+        known to it.
+        """
+        from django.contrib.gis.models import SpatialRefSys
+        if not self.transform or self.unique:
+            return False
+        srid = self.source_srs.srid
+        return srid is not None and SpatialRefSys.objects.filter(srid=srid).count() > 0
+
+    def insert_models(self, instances):
+        """
+        Inserts the given new model instances using a multi-row INSERT (or
+        executemany(), for databases that can't insert several rows at once)
+        for every combination of SQL placeholders among them, rather than a
+        query for each.  Signals are not sent.
+        """
+        fields = [f for f in self.model._meta.local_fields
+                  if not (isinstance(f, models.AutoField) and f.name not in self.mapping)]
+        groups, order = {}, []
+        for m in instances:
+            values = [f.get_db_prep_save(f.pre_save(m, True)) for f in fields]
+            # Geometry fields may need a placeholder that depends on the value
+            # (e.g., one transforming it).
+            placeholders = tuple([hasattr(f, 'get_placeholder') and f.get_placeholder(val) or '%s'
+                                  for f, val in zip(fields, values)])
+            if placeholders not in groups:
+                groups[placeholders] = (values, [])
+                order.append(placeholders)
+            groups[placeholders][1].append([val for val, ph in zip(values, placeholders) if '%s' in ph])
+
+        for placeholders in order:
+            values, rows = groups[placeholders]
+            query = InsertQuery(self.model, connection)
+            query.insert_values(zip(fields, values))
+            execute_insert_many(query.as_sql()[0], rows)
+
     def coord_transform(self):
         "Returns the coordinate transformation object."
         from django.contrib.gis.models import SpatialRefSys
@@ -538,7 +669,8 @@ class LayerMapping(object):
                 model_field.__class__.__name__ == 'Multi%s' % geom_type.django)
 
     def save(self, verbose=False, fid_range=False, step=False, 
-             progress=False, silent=False, stream=sys.stdout, strict=False):
+             progress=False, silent=False, stream=sys.stdout, strict=False,
+             batch_size=None):
         """
         Saves the contents from the OGR DataSource Layer into the database
         according to the mapping dictionary given at initialization. 
@@ -561,7 +693,8 @@ class LayerMapping(object):
 
          progress:
            When this keyword is set, status information will be printed giving 
-           the number of features processed and sucessfully saved.  By default, 
+           the number of features processed and sucessfully saved, and the
+           number of features processed per second.  By default, 
            progress information will pe printed every 1000 features processed, 
            however, this default may be overridden by setting this keyword with an 
            integer for the desired interval.
@@ -577,6 +710,20 @@ class LayerMapping(object):
          strict:
            Execution of the model mapping will cease upon the first error 
            encountered.  The default behavior is to attempt to continue.
+
+         batch_size:
+           If set with an integer, features are saved in bulk, that many at a
+           time: new models are inserted with multi-row INSERTs, the models
+           for the `unique` keyword are retrieved with a few queries per batch,
+           and related models for ForeignKey mappings are only retrieved once.
+           When the SRID of the source is known to the database (and `unique`
+           is not used), the coordinate transformation is also done by the
+           database as the rows are inserted.  Model `save` methods are not
+           called and no signals are sent for the inserted models.  If the
+           INSERT of a batch fails, its models are saved one at a time; in
+           the 'commit_on_success' transaction mode, on databases without
+           savepoints (e.g., MySQL and SQLite), the whole transaction is
+           rolled back and all of its features are saved one at a time.
         """
         # Getting the default Feature ID range.
         default_range = self.check_fid_range(fid_range)
@@ -588,102 +735,224 @@ class LayerMapping(object):
             else:
                 progress_interval = progress
 
+        if batch_size:
+            db_transform = self.can_db_transform()
+            self.fk_cache = {}
+        else:
+            db_transform = False
+        start_time = time.time()
+
+        def _save_model(m, fid, kwargs, is_update, savepoint=False):
+            """
+            Saves a single model, returning whether it was saved.  If
+            `savepoint` is set, a failed save is rolled back to a savepoint
+            (where the database has them), so that the following saves
+            still work in the same transaction (e.g., on PostgreSQL).
+            """
+            sid = None
+            if savepoint and transaction.is_managed() and connection.features.uses_savepoints:
+                sid = transaction.savepoint()
+            try:
+                # Attempting to save.
+                m.save()
+                if sid: transaction.savepoint_commit(sid)
+                if verbose: stream.write('%s: %s\n' % (is_update and 'Updated' or 'Saved', m))
+                return True
+            except SystemExit:
+                raise
+            except Exception, msg:
+                if sid:
+                    transaction.savepoint_rollback(sid)
+                elif self.transaction_mode == 'autocommit':
+                    # Rolling back the transaction so that other model saves
+                    # will work.
+                    transaction.rollback_unless_managed()
+                if strict: 
+                    # Bailing out if the `strict` keyword is set.
+                    if not silent:
+                        stream.write('Failed to save the feature (id: %s) into the model with the keyword arguments:\n' % fid)
+                        stream.write('%s\n' % kwargs)
+                    raise
+                elif not silent:
+                    stream.write('Failed to save %s:\n %s\nContinuing\n' % (kwargs, msg))
+                return False
+
+        def _save_batch(batch):
+            """
+            Saves a batch of (feature ID, keyword arguments) pairs, returning
+            the number of features saved.
+            """
+            # Each entry is a list of the feature ID, keyword arguments, model,
+            # whether it's an update, and the number of features it holds.
+            entries = []
+            if self.unique:
+                existing = self.unique_models([kwargs for fid, kwargs in batch])
+                by_key = {}
+                for fid, kwargs in batch:
+                    key = self.unique_key(kwargs)
+                    if key in by_key:
+                        # Another feature of the batch for the same model.
+                        entry = by_key[key]
+                        self.add_geometries(entry[2], kwargs)
+                        entry[4] += 1
+                    elif key in existing:
+                        m = existing[key]
+                        self.add_geometries(m, kwargs)
+                        entry = by_key[key] = [fid, kwargs, m, True, 1]
+                        entries.append(entry)
+                    else:
+                        entry = by_key[key] = [fid, kwargs, self.model(**kwargs), False, 1]
+                        entries.append(entry)
+            else:
+                entries = [[fid, kwargs, self.model(**kwargs), False, 1] for fid, kwargs in batch]
+
+            num_saved = 0
+            new = []
+            for entry in entries:
+                fid, kwargs, m, is_update, count = entry
+                if is_update:
+                    if _save_model(m, fid, kwargs, True): num_saved += count
+                else:
+                    new.append(entry)
+            if not new:
+                return num_saved
+
+            if self.model._meta.parents:
+                # Models with parents need the inserts done by `save`.
+                inserted = False
+            else:
+                # The rows of an INSERT failing midway have to be discarded
+                # before saving the models one at a time.  That's done with a
+                # savepoint where the database has them.  Otherwise, a
+                # managed transaction can only be rolled back as a whole,
+                # after which _save_range() starts it over without batches.
+                sid = None
+                if transaction.is_managed() and connection.features.uses_savepoints:
+                    sid = transaction.savepoint()
+                try:
+                    self.insert_models([entry[2] for entry in new])
+                    if sid: transaction.savepoint_commit(sid)
+                    transaction.commit_unless_managed()
+                    inserted = True
+                except SystemExit:
+                    raise
+                except Exception:
+                    if sid:
+                        transaction.savepoint_rollback(sid)
+                    else:
+                        transaction.rollback()
+                        if transaction.is_managed():
+                            raise _BatchInsertFailed
+                    inserted = False
+
+            if inserted:
+                for fid, kwargs, m, is_update, count in new:
+                    num_saved += count
+                    if verbose: stream.write('Saved: %s\n' % m)
+            else:
+                # Falling back on saving the models one at a time, which also
+                # reports the ones that can't be saved.
+                failed = not self.model._meta.parents
+                for fid, kwargs, m, is_update, count in new:
+                    if _save_model(m, fid, kwargs, False, failed): num_saved += count
+            return num_saved
+
         # Defining the 'real' save method, utilizing the transaction 
         # decorator created during initialization.
         @self.transaction_decorator
-        def _save(feat_range=default_range, num_feat=0, num_saved=0):
+        def _save(feat_range=default_range, num_feat=0, num_saved=0, batched=bool(batch_size)):
             if feat_range:
                 layer_iter = self.layer[feat_range]
             else:
                 layer_iter = self.layer
 
+            batch = []
             for feat in layer_iter:
                 num_feat += 1
                 # Getting the keyword arguments
                 try:
-                    kwargs = self.feature_kwargs(feat)
+                    kwargs = self.feature_kwargs(feat, db_transform)
                 except LayerMapError, msg:
                     # Something borked the validation
                     if strict: raise
                     elif not silent: 
                         stream.write('Ignoring Feature ID %s because: %s\n' % (feat.fid, msg))
                 else:
-                    # Constructing the model using the keyword args
-                    is_update = False
-                    if self.unique:
-                        # If we want unique models on a particular field, handle the
-                        # geometry appropriately.
-                        try:
-                            # Getting the keyword arguments and retrieving
-                            # the unique model.
-                            u_kwargs = self.unique_kwargs(kwargs)
-                            m = self.model.objects.get(**u_kwargs)
-                            is_update = True
-                                
-                            # Getting the geometry (in OGR form), creating 
-                            # one from the kwargs WKT, adding in additional 
-                            # geometries, and update the attribute with the 
-                            # just-updated geometry WKT.
-                            geom = getattr(m, self.geom_field).ogr
-                            new = OGRGeometry(kwargs[self.geom_field])
-                            for g in new: geom.add(g) 
-                            setattr(m, self.geom_field, geom.wkt)
-                        except ObjectDoesNotExist:
-                            # No unique model exists yet, create.
-                            m = self.model(**kwargs)
+                    if batched:
+                        batch.append((feat.fid, kwargs))
+                        if len(batch) >= batch_size:
+                            num_saved += _save_batch(batch)
+                            batch = []
                     else:
-                        m = self.model(**kwargs)
+                        # Constructing the model using the keyword args
+                        is_update = False
+                        if self.unique:
+                            # If we want unique models on a particular field, handle the
+                            # geometry appropriately.
+                            try:
+                                # Getting the keyword arguments and retrieving
+                                # the unique model.
+                                u_kwargs = self.unique_kwargs(kwargs)
+                                m = self.model.objects.get(**u_kwargs)
+                                is_update = True
+                                self.add_geometries(m, kwargs)
+                            except ObjectDoesNotExist:
+                                # No unique model exists yet, create.
+                                m = self.model(**kwargs)
+                        else:
+                            m = self.model(**kwargs)
 
-                    try:
-                        # Attempting to save.
-                        m.save()
-                        num_saved += 1
-                        if verbose: stream.write('%s: %s\n' % (is_update and 'Updated' or 'Saved', m))
-                    except SystemExit:
-                        raise
-                    except Exception, msg:
-                        if self.transaction_mode == 'autocommit':
-                            # Rolling back the transaction so that other model saves
-                            # will work.
-                            transaction.rollback_unless_managed()
-                        if strict: 
-                            # Bailing out if the `strict` keyword is set.
-                            if not silent:
-                                stream.write('Failed to save the feature (id: %s) into the model with the keyword arguments:\n' % feat.fid)
-                                stream.write('%s\n' % kwargs)
-                            raise
-                        elif not silent:
-                            stream.write('Failed to save %s:\n %s\nContinuing\n' % (kwargs, msg))
+                        if _save_model(m, feat.fid, kwargs, is_update): num_saved += 1
 
                 # Printing progress information, if requested.
                 if progress and num_feat % progress_interval == 0:
-                    stream.write('Processed %d features, saved %d ...\n' % (num_feat, num_saved))
+                    stream.write('Processed %d features, saved %d (%.1f features/s) ...\n' % 
+                                 (num_feat, num_saved, num_feat / max(time.time() - start_time, 1e-6)))
         
+            if batch:
+                num_saved += _save_batch(batch)
+
             # Only used for status output purposes -- incremental saving uses the
             # values returned here.
             return num_saved, num_feat
 
-        nfeat = self.layer.num_feat
-        if step and isinstance(step, int) and step < nfeat:
-            # Incremental saving is requested at the given interval (step) 
-            if default_range: 
-                raise LayerMapError('The `step` keyword may not be used in conjunction with the `fid_range` keyword.')
-            beg, num_feat, num_saved = (0, 0, 0)
-            indices = range(step, nfeat, step)
-            n_i = len(indices)
-
-            for i, end in enumerate(indices):
-                # Constructing the slice to use for this step; the last slice is
-                # special (e.g, [100:] instead of [90:100]).
-                if i+1 == n_i: step_slice = slice(beg, None)
-                else: step_slice = slice(beg, end)
-            
-                try:
-                    num_feat, num_saved = _save(step_slice, num_feat, num_saved)
-                    beg = end
-                except:
-                    stream.write('%s\nFailed to save slice: %s\n' % ('=-' * 20, step_slice))
-                    raise
-        else:
-            # Otherwise, just calling the previously defined _save() function.
-            _save()
+        def _save_range(feat_range=default_range, num_feat=0, num_saved=0):
+            try:
+                return _save(feat_range, num_feat, num_saved)
+            except _BatchInsertFailed:
+                # The transaction has been rolled back; saving its features
+                # again one model at a time reports the ones that fail.
+                return _save(feat_range, num_feat, num_saved, False)
+
+        try:
+            nfeat = self.layer.num_feat
+            if step and isinstance(step, int) and step < nfeat:
+                # Incremental saving is requested at the given interval (step) 
+                if default_range: 
+                    raise LayerMapError('The `step` keyword may not be used in conjunction with the `fid_range` keyword.')
+                beg, num_feat, num_saved = (0, 0, 0)
+                indices = range(step, nfeat, step)
+                n_i = len(indices)
+
+                for i, end in enumerate(indices):
+                    # Constructing the slice to use for this step; the last slice is
+                    # special (e.g, [100:] instead of [90:100]).
+                    if i+1 == n_i: step_slice = slice(beg, None)
+                    else: step_slice = slice(beg, end)
+                
+                    try:
+                        num_saved, num_feat = _save_range(step_slice, num_feat, num_saved)
+                        beg = end
+                    except:
+                        stream.write('%s\nFailed to save slice: %s\n' % ('=-' * 20, step_slice))
+                        raise
+            else:
+                # Otherwise, just calling the previously defined _save() function.
+                num_saved, num_feat = _save_range()
+        finally:
+            self.fk_cache = None
+
+        if progress:
+            elapsed = time.time() - start_time
+            stream.write('Saved %d of %d features in %.1fs (%.1f features/s).\n' % 
+                         (num_saved, num_feat, elapsed, num_feat / max(elapsed, 1e-6)))
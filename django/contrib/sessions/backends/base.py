@@ -33,6 +33,7 @@ class SessionBase(object):
     """
     TEST_COOKIE_NAME = 'testcookie'
     TEST_COOKIE_VALUE = 'worked'
+    REFRESHED_KEY = '_session_refreshed'
 
     def __init__(self, session_key=None):
         self._session_key = session_key
@@ -53,11 +54,13 @@ class SessionBase(object):
         del self._session[key]
         self.modified = True
 
+    # The bookkeeping of mark_refreshed() is stored with the session data, but
+    # isn't part of what keys(), items() and friends return.
     def keys(self):
-        return self._session.keys()
+        return [k for k in self._session.keys() if k != self.REFRESHED_KEY]
 
     def items(self):
-        return self._session.items()
+        return [(k, v) for k, v in self._session.items() if k != self.REFRESHED_KEY]
 
     def get(self, key, default=None):
         return self._session.get(key, default)
@@ -109,16 +112,16 @@ class SessionBase(object):
         return self._session.has_key(key)
 
     def values(self):
-        return self._session.values()
+        return [v for k, v in self.items()]
 
     def iterkeys(self):
-        return self._session.iterkeys()
+        return iter(self.keys())
 
     def itervalues(self):
-        return self._session.itervalues()
+        return iter(self.values())
 
     def iteritems(self):
-        return self._session.iteritems()
+        return iter(self.items())
 
     def clear(self):
         # To avoid unnecessary persistent storage accesses, we set up the
@@ -219,6 +222,34 @@ class SessionBase(object):
             value = datetime.now() + value
         self['_session_expiry'] = value
 
+    def expiry_refresh_due(self):
+        """
+        Returns ``True`` if saving the session to push back its expiry is
+        worthwhile. Unless ``settings.SESSION_REFRESH_THRESHOLD`` is set, that
+        is always the case; otherwise only once fewer than that many seconds
+        remain until the session expires.
+        """
+        threshold = settings.SESSION_REFRESH_THRESHOLD
+        if threshold is None:
+            return True
+        refreshed = self._session.get(self.REFRESHED_KEY)
+        if refreshed is None:
+            return True
+        expiry = self.get('_session_expiry')
+        if isinstance(expiry, datetime):
+            # A fixed expiry date can't be pushed back.
+            return False
+        remaining = refreshed + self.get_expiry_age() - time.time()
+        return remaining < threshold
+
+    def mark_refreshed(self):
+        """
+        Records the time at which the session's expiry was last pushed back,
+        for ``expiry_refresh_due()``. It's kept under a reserved key that
+        ``keys()``, ``items()`` and the like leave out.
+        """
+        self[self.REFRESHED_KEY] = int(time.time())
+
     def get_expire_at_browser_close(self):
         """
         Returns ``True`` if the session is set to expire when the browser
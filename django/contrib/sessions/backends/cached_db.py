@@ -2,20 +2,38 @@
 Cached, database-backed sessions.
 """
 
+# The pure Python pickler is used for digests because cPickle's output
+# depends on reference counts, so equal data doesn't always pickle the same.
+import pickle
+import time
+
 from django.conf import settings
 from django.contrib.sessions.backends.db import SessionStore as DBStore
 from django.core.cache import cache
+from django.utils.hashcompat import md5_constructor
 
 class SessionStore(DBStore):
     """
     Implements cached, database backed sessions.
+
+    By default every save is written through to the database. If
+    ``settings.SESSION_CACHED_DB_WRITE_INTERVAL`` is set to a number of
+    seconds, saves that don't change the session data only update the cache,
+    and the database row is refreshed at most once per interval.
     """
 
     def __init__(self, session_key=None):
+        # Digest of the data last written to the database, and when that
+        # write happened. Only used in write-behind mode.
+        self._db_digest = None
+        self._db_flushed = None
         super(SessionStore, self).__init__(session_key)
 
     def load(self):
         data = cache.get(self.session_key, None)
+        if isinstance(data, tuple):
+            # Write-behind entries also record the state of the database row.
+            data, self._db_digest, self._db_flushed = data
         if data is None:
             data = super(SessionStore, self).load()
             cache.set(self.session_key, data, settings.SESSION_COOKIE_AGE)
@@ -25,8 +43,23 @@ class SessionStore(DBStore):
         return super(SessionStore, self).exists(session_key)
 
     def save(self, must_create=False):
-        super(SessionStore, self).save(must_create)
-        cache.set(self.session_key, self._session, settings.SESSION_COOKIE_AGE)
+        interval = settings.SESSION_CACHED_DB_WRITE_INTERVAL
+        if interval is None or must_create:
+            super(SessionStore, self).save(must_create)
+            cache.set(self.session_key, self._session, settings.SESSION_COOKIE_AGE)
+            # The row may not hold the current data (e.g. after cycle_key()),
+            # so make sure the next write-behind save flushes.
+            self._db_digest = self._db_flushed = None
+            return
+        data = self._get_session()
+        digest = md5_constructor(pickle.dumps(data, pickle.HIGHEST_PROTOCOL)).hexdigest()
+        now = time.time()
+        if (digest != self._db_digest or self._db_flushed is None
+                or now - self._db_flushed >= interval):
+            super(SessionStore, self).save(must_create)
+            self._db_digest, self._db_flushed = digest, now
+        cache.set(self.session_key, (data, self._db_digest, self._db_flushed),
+                  settings.SESSION_COOKIE_AGE)
 
     def delete(self, session_key=None):
         super(SessionStore, self).delete(session_key)
@@ -39,4 +72,4 @@ class SessionStore(DBStore):
         """
         self.clear()
         self.delete(self.session_key)
-        self.create()
\ No newline at end of file
+        self.create()
@@ -0,0 +1,188 @@
+"""
+Cookie-based session store.
+
+The whole session dictionary is serialized as JSON, signed with
+``settings.SECRET_KEY`` and sent to the client as the session cookie value, so
+no server-side storage is needed at all. Browsers limit cookies to roughly
+4KB, so this backend is only suitable for small sessions.
+
+Session values must be JSON serializable (``datetime`` objects are supported
+too). Keep in mind that anybody who knows ``SECRET_KEY`` can forge sessions,
+and so log in as any user.
+"""
+
+import base64
+import hmac
+import time
+import zlib
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
+from django.utils import simplejson
+from django.utils.crypto import constant_time_compare
+from django.utils.hashcompat import sha_constructor, sha_hmac
+
+SEPARATOR = '.'
+
+# Browsers ignore cookies larger than this (name, value and '=' included).
+MAX_COOKIE_SIZE = 4093
+
+def _json_default(obj):
+    "Serializes datetimes, which JSON doesn't support, as tagged objects."
+    if isinstance(obj, datetime):
+        return {'__datetime__': [obj.year, obj.month, obj.day, obj.hour,
+                                 obj.minute, obj.second, obj.microsecond]}
+    raise TypeError('%r is not JSON serializable' % (obj,))
+
+def _json_object_hook(obj):
+    "Reverses _json_default()."
+    if obj.keys() == ['__datetime__']:
+        return datetime(*obj['__datetime__'])
+    return obj
+
+class SessionStore(SessionBase):
+    """
+    Stores the session data in a signed cookie.
+    """
+    # The serialized data the session key was last computed from.
+    _signed_data = None
+
+    def load(self):
+        """
+        Unsigns the session key (the cookie value) and returns the session
+        dictionary. If the cookie has been tampered with or has expired, an
+        empty session is returned instead.
+        """
+        data = self._unsign(self._session_key)
+        if data is None:
+            self.create()
+            return {}
+        return data
+
+    def create(self):
+        """
+        There's nothing to create on the server; just make sure the cookie
+        gets (re)sent with the response.
+        """
+        self.modified = True
+
+    def save(self, must_create=False):
+        """
+        The session data lives in the cookie, so saving only computes the
+        signed session key that the middleware will send to the client. The
+        key is only recomputed once the data has changed since the last save.
+
+        Raises ``ValueError`` if the resulting cookie is too large for
+        browsers to keep, rather than letting them drop it silently.
+        """
+        serialized = self._serialize(self._session)
+        if self._session_key is None or serialized != self._signed_data:
+            session_key = self._sign(serialized)
+            size = len(settings.SESSION_COOKIE_NAME) + 1 + len(session_key)
+            if size > MAX_COOKIE_SIZE:
+                raise ValueError('The session cookie would be %d bytes long, but '
+                                 'browsers only accept %d bytes.' % (size, MAX_COOKIE_SIZE))
+            self._session_key = session_key
+            self._signed_data = serialized
+        self.modified = True
+
+    def exists(self, session_key=None):
+        """
+        Session keys are generated from the data itself, so they can never
+        collide.
+        """
+        return False
+
+    def delete(self, session_key=None):
+        """
+        Empties the session; the next response carries an empty cookie.
+        """
+        self._session_key = ''
+        self._signed_data = None
+        self._session_cache = {}
+        self.modified = True
+
+    def cycle_key(self):
+        """
+        The key is derived from the (signed) data, so simply re-sign it.
+        """
+        self._signed_data = None
+        self.save()
+
+    def _get_session_key(self):
+        """
+        Most session backends don't need to override this method, but this one
+        does: the session key *is* the signed, serialized session data. It's
+        computed by ``save()`` (here, if the session has no key yet), so it
+        doesn't change between saves.
+        """
+        if self._session_key is None:
+            self.save()
+        return self._session_key
+
+    session_key = property(_get_session_key, SessionBase._set_session_key)
+
+    def _signature(self, value):
+        key = sha_constructor('django.contrib.sessions.backends.signed_cookies'
+                              + settings.SECRET_KEY).digest()
+        return hmac.new(key, value, sha_hmac).hexdigest()
+
+    def _serialize(self, session_dict):
+        return simplejson.dumps(session_dict, separators=(',', ':'),
+                                default=_json_default)
+
+    def _sign(self, serialized):
+        """
+        Returns the ``serialized`` session data, compressed and encoded as a
+        cookie safe string, together with a timestamp and an HMAC of both.
+        """
+        compressed = zlib.compress(serialized)
+        if len(compressed) < len(serialized) - 1:
+            data = '.' + base64.urlsafe_b64encode(compressed).rstrip('=')
+        else:
+            data = base64.urlsafe_b64encode(serialized).rstrip('=')
+        value = '%s%s%x' % (data, SEPARATOR, int(time.time()))
+        return '%s%s%s' % (value, SEPARATOR, self._signature(value))
+
+    def _unsign(self, session_key):
+        """
+        Reverses ``_sign()``. Returns ``None`` if the signature doesn't match
+        or the session has expired.
+        """
+        if not session_key:
+            return None
+        try:
+            session_key = str(session_key)
+            value, signature = session_key.rsplit(SEPARATOR, 1)
+            data, timestamp = value.rsplit(SEPARATOR, 1)
+            timestamp = int(timestamp, 16)
+        except (UnicodeError, ValueError):
+            return None
+        if not constant_time_compare(self._signature(value), signature):
+            return None
+        compressed = data.startswith('.')
+        if compressed:
+            data = data[1:]
+        try:
+            data = base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+            if compressed:
+                data = zlib.decompress(data)
+            session_dict = simplejson.loads(data, object_hook=_json_object_hook)
+        # Decoding can cause a variety of exceptions. If something happens,
+        # just treat it as an empty session.
+        except:
+            return None
+        if not isinstance(session_dict, dict):
+            return None
+        if self._expired(session_dict, timestamp):
+            return None
+        return session_dict
+
+    def _expired(self, session_dict, timestamp):
+        expiry = session_dict.get('_session_expiry')
+        if isinstance(expiry, datetime):
+            return expiry < datetime.now()
+        if not expiry:   # Checks both None and 0 cases
+            expiry = settings.SESSION_COOKIE_AGE
+        return time.time() - timestamp > expiry
@@ -24,7 +24,8 @@ class SessionMiddleware(object):
         else:
             if accessed:
                 patch_vary_headers(response, ('Cookie',))
-            if modified or settings.SESSION_SAVE_EVERY_REQUEST:
+            if modified or (settings.SESSION_SAVE_EVERY_REQUEST and
+                            request.session.expiry_refresh_due()):
                 if request.session.get_expire_at_browser_close():
                     max_age = None
                     expires = None
@@ -32,6 +33,8 @@ class SessionMiddleware(object):
                     max_age = request.session.get_expiry_age()
                     expires_time = time.time() + max_age
                     expires = cookie_date(expires_time)
+                if settings.SESSION_REFRESH_THRESHOLD is not None:
+                    request.session.mark_refreshed()
                 # Save the session data and refresh the client cookie.
                 request.session.save()
                 response.set_cookie(settings.SESSION_COOKIE_NAME,
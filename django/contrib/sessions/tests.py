@@ -5,6 +5,7 @@ r"""
 >>> from django.contrib.sessions.backends.cache import SessionStore as CacheSession
 >>> from django.contrib.sessions.backends.cached_db import SessionStore as CacheDBSession
 >>> from django.contrib.sessions.backends.file import SessionStore as FileSession
+>>> from django.contrib.sessions.backends.signed_cookies import SessionStore as CookieSession
 >>> from django.contrib.sessions.backends.base import SessionBase
 >>> from django.contrib.sessions.models import Session
 
@@ -76,6 +77,49 @@ True
 >>> cdb_session.exists(cdb_session.session_key)
 False
 
+# Write-behind mode only writes unchanged data to the database once per
+# interval, but always writes changed data.
+>>> original_write_interval = settings.SESSION_CACHED_DB_WRITE_INTERVAL
+>>> settings.SESSION_CACHED_DB_WRITE_INTERVAL = 3600
+>>> cdb_session = CacheDBSession()
+>>> cdb_session['cat'] = 'dog'
+>>> cdb_session.save()
+>>> key = cdb_session.session_key
+>>> Session.objects.get(pk=key).get_decoded()
+{'cat': 'dog'}
+>>> Session.objects.filter(pk=key).update(session_data='stale')
+1
+>>> cdb_session = CacheDBSession(key)
+>>> cdb_session['cat']
+'dog'
+>>> cdb_session.save()
+>>> Session.objects.get(pk=key).session_data
+u'stale'
+>>> cdb_session['cat'] = 'mouse'
+>>> cdb_session.save()
+>>> Session.objects.get(pk=key).get_decoded()
+{'cat': 'mouse'}
+>>> CacheDBSession(key)['cat']
+'mouse'
+
+# Once the interval has passed, unchanged data is written again.
+>>> settings.SESSION_CACHED_DB_WRITE_INTERVAL = 0
+>>> Session.objects.filter(pk=key).update(session_data='stale')
+1
+>>> cdb_session = CacheDBSession(key)
+>>> cdb_session.save()
+>>> Session.objects.get(pk=key).get_decoded()
+{'cat': 'mouse'}
+
+# A cycled key always gets the current data written.
+>>> settings.SESSION_CACHED_DB_WRITE_INTERVAL = 3600
+>>> cdb_session.cycle_key()
+>>> cdb_session.save()
+>>> Session.objects.get(pk=cdb_session.session_key).get_decoded()
+{'cat': 'mouse'}
+>>> cdb_session.delete()
+>>> settings.SESSION_CACHED_DB_WRITE_INTERVAL = original_write_interval
+
 #
 # File session tests.
 #
@@ -193,6 +237,79 @@ True
 >>> cache_session.save()
 >>> cache_session.delete(cache_session.session_key)
 
+#
+# Signed cookie tests
+#
+
+>>> cookie_session = CookieSession()
+>>> cookie_session.modified
+False
+>>> cookie_session['cat'] = "dog"
+>>> cookie_session.modified
+True
+>>> cookie_session.pop('cat')
+'dog'
+>>> cookie_session.pop('some key', 'does not exist')
+'does not exist'
+>>> cookie_session['foo'] = 'bar'
+>>> cookie_session.save()
+>>> key = cookie_session.session_key
+>>> CookieSession(key)['foo']
+u'bar'
+>>> cookie_session.exists(key)
+False
+
+# The cookie can't be tampered with.
+>>> CookieSession(key[:-1] + 'x').get('foo')
+>>> CookieSession('garbage').get('foo')
+>>> CookieSession(u'\xe9t\xe9.1.2').get('foo')
+
+# The key only changes when the session is saved with different data.
+>>> cookie_session.session_key == key
+True
+>>> cookie_session.save()
+>>> cookie_session.session_key == key
+True
+
+# Large, compressible sessions are compressed.
+>>> cookie_session['long'] = 'x' * 1000
+>>> cookie_session.save()
+>>> len(cookie_session.session_key) < 1000
+True
+>>> CookieSession(cookie_session.session_key)['long'] == 'x' * 1000
+True
+
+# Sessions that don't fit in a cookie can't be saved.
+>>> import random
+>>> cookie_session['long'] = ''.join([random.choice('abcdef') for i in range(8000)])
+>>> cookie_session.save()
+Traceback (most recent call last):
+...
+ValueError: The session cookie would be ... bytes long, but browsers only accept 4093 bytes.
+>>> del cookie_session['long']
+
+# Expiry datetimes survive the round trip.
+>>> from datetime import datetime
+>>> expiry = datetime(2030, 1, 1, 12, 30, 0, 500)
+>>> cookie_session.set_expiry(expiry)
+>>> cookie_session.save()
+>>> CookieSession(cookie_session.session_key).get_expiry_date() == expiry
+True
+
+# Expired cookies are ignored.
+>>> cookie_session.set_expiry(-1)
+>>> cookie_session.save()
+>>> CookieSession(cookie_session.session_key).get('foo')
+
+>>> cookie_session = CookieSession(key)
+>>> cookie_session.flush()
+>>> cookie_session.items()
+[]
+>>> cookie_session.modified, cookie_session.accessed
+(True, True)
+>>> CookieSession(cookie_session.session_key).items()
+[]
+
 >>> s = SessionBase()
 >>> s._session['some key'] = 'exists' # Pre-populate the session with some data
 >>> s.accessed = False   # Reset to pretend this wasn't accessed previously
@@ -381,6 +498,37 @@ True
 True
 
 >>> settings.SESSION_EXPIRE_AT_BROWSER_CLOSE = original_expire_at_browser_close
+
+# Without a refresh threshold, the expiry is always due for a refresh.
+>>> original_refresh_threshold = settings.SESSION_REFRESH_THRESHOLD
+>>> s = SessionBase()
+>>> s.expiry_refresh_due()
+True
+
+# With one, only once the remaining lifetime drops below the threshold.
+>>> settings.SESSION_REFRESH_THRESHOLD = 60
+>>> s.expiry_refresh_due()
+True
+>>> s.set_expiry(120)
+>>> s.mark_refreshed()
+>>> s.expiry_refresh_due()
+False
+
+# The refresh time isn't part of the visible session data.
+>>> s.keys(), s.values()
+(['_session_expiry'], [120])
+>>> s.items() == list(s.iteritems())
+True
+>>> s[s.REFRESHED_KEY] -= 61
+>>> s.expiry_refresh_due()
+True
+
+# Fixed expiry dates can't be pushed back.
+>>> s.set_expiry(td10)
+>>> s.expiry_refresh_due()
+False
+
+>>> settings.SESSION_REFRESH_THRESHOLD = original_refresh_threshold
 """
 
 if __name__ == '__main__':
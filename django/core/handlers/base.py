@@ -1,4 +1,6 @@
 import sys
+import time
+from threading import Lock
 
 from django import http
 from django.core import signals
@@ -16,6 +18,10 @@ class BaseHandler(object):
 
     def __init__(self):
         self._request_middleware = self._view_middleware = self._response_middleware = self._exception_middleware = None
+        # Maps (middleware path, method name) to [number of calls, cumulative
+        # seconds]. Only populated if settings.MIDDLEWARE_TIMING is True.
+        self.middleware_timings = {}
+        self._timings_lock = Lock()
 
     def load_middleware(self):
         """
@@ -50,19 +56,47 @@ class BaseHandler(object):
             except exceptions.MiddlewareNotUsed:
                 continue
 
-            if hasattr(mw_instance, 'process_request'):
-                request_middleware.append(mw_instance.process_request)
-            if hasattr(mw_instance, 'process_view'):
-                self._view_middleware.append(mw_instance.process_view)
-            if hasattr(mw_instance, 'process_response'):
-                self._response_middleware.insert(0, mw_instance.process_response)
-            if hasattr(mw_instance, 'process_exception'):
-                self._exception_middleware.insert(0, mw_instance.process_exception)
+            methods = {}
+            for name in ('process_request', 'process_view', 'process_response', 'process_exception'):
+                if hasattr(mw_instance, name):
+                    methods[name] = getattr(mw_instance, name)
+                    if settings.MIDDLEWARE_TIMING:
+                        methods[name] = self._timed(middleware_path, name, methods[name])
+
+            if 'process_request' in methods:
+                request_middleware.append(methods['process_request'])
+            if 'process_view' in methods:
+                self._view_middleware.append(methods['process_view'])
+            if 'process_response' in methods:
+                self._response_middleware.insert(0, methods['process_response'])
+            if 'process_exception' in methods:
+                self._exception_middleware.insert(0, methods['process_exception'])
 
         # We only assign to this when initialization is complete as it is used
         # as a flag for initialization being complete.
         self._request_middleware = request_middleware
 
+    def _timed(self, middleware_path, name, method):
+        """
+        Wraps a middleware method so the time spent in it is accumulated in
+        self.middleware_timings.
+        """
+        timing = self.middleware_timings.setdefault((middleware_path, name), [0, 0.0])
+        lock = self._timings_lock
+        def wrapper(*args):
+            start = time.time()
+            try:
+                return method(*args)
+            finally:
+                elapsed = time.time() - start
+                lock.acquire()
+                try:
+                    timing[0] += 1
+                    timing[1] += elapsed
+                finally:
+                    lock.release()
+        return wrapper
+
     def get_response(self, request):
         "Returns an HttpResponse object for the given HttpRequest"
         from django.core import exceptions, urlresolvers
@@ -75,9 +109,11 @@ class BaseHandler(object):
                 return response
 
         # Get urlconf from request object, if available.  Otherwise use default.
+        # Resolvers are cached per urlconf, so the patterns they compile and
+        # the lookups they populate are reused across requests.
         urlconf = getattr(request, "urlconf", settings.ROOT_URLCONF)
 
-        resolver = urlresolvers.RegexURLResolver(r'^/', urlconf)
+        resolver = urlresolvers.get_resolver(urlconf)
         try:
             callback, callback_args, callback_kwargs = resolver.resolve(
                     request.path_info)
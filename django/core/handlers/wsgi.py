@@ -256,5 +256,10 @@ class WSGIHandler(base.BaseHandler):
         for c in response.cookies.values():
             response_headers.append(('Set-Cookie', str(c.output(header=''))))
         start_response(status, response_headers)
+        if isinstance(response, http.FileResponse) and 'wsgi.file_wrapper' in environ:
+            # Let the server send the file itself, e.g. using sendfile().
+            filelike = response.file_to_stream()
+            if filelike is not None:
+                return environ['wsgi.file_wrapper'](filelike, response.block_size)
         return response
 
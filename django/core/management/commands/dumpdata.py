@@ -1,3 +1,6 @@
+import gzip
+import sys
+
 from django.core.exceptions import ImproperlyConfigured
 from django.core.management.base import BaseCommand, CommandError
 from django.core import serializers
@@ -5,6 +8,12 @@ from django.utils.datastructures import SortedDict
 
 from optparse import make_option
 
+try:
+    import bz2
+    has_bz2 = True
+except ImportError:
+    has_bz2 = False
+
 class Command(BaseCommand):
     option_list = BaseCommand.option_list + (
         make_option('--format', default='json', dest='format',
@@ -13,6 +22,10 @@ class Command(BaseCommand):
             help='Specifies the indent level to use when pretty-printing output'),
         make_option('-e', '--exclude', dest='exclude',action='append', default=[],
             help='App to exclude (use multiple --exclude to exclude multiple apps).'),
+        make_option('-o', '--output', default=None, dest='output',
+            help='Specifies a file to write the serialized data to. Files ending in .gz or .bz2 are compressed.'),
+        make_option('--batch-size', default=None, dest='batch_size', type='int',
+            help='Fetches the objects of each model in batches of this size, ordered by primary key, to use a constant amount of memory.'),
     )
     help = 'Output the contents of the database as a fixture of the given format.'
     args = '[appname ...]'
@@ -23,6 +36,8 @@ class Command(BaseCommand):
         format = options.get('format','json')
         indent = options.get('indent',None)
         exclude = options.get('exclude',[])
+        output = options.get('output', None)
+        batch_size = options.get('batch_size', None)
         show_traceback = options.get('traceback', False)
 
         excluded_apps = [get_app(app_label) for app_label in exclude]
@@ -67,18 +82,63 @@ class Command(BaseCommand):
         except KeyError:
             raise CommandError("Unknown serialization format: %s" % format)
 
-        objects = []
-        for app, model_list in app_list.items():
-            if model_list is None:
-                model_list = get_models(app)
+        if batch_size is not None and batch_size < 1:
+            raise CommandError("The batch size must be a positive integer.")
+
+        compression_types = {
+            'gz': gzip.GzipFile,
+        }
+        if has_bz2:
+            compression_types['bz2'] = bz2.BZ2File
 
-            for model in model_list:
-                if not model._meta.proxy:
-                    objects.extend(model._default_manager.all())
+        def get_objects():
+            # Objects are fetched lazily, model by model, and handed straight
+            # to the serializer.
+            for app, model_list in app_list.items():
+                if model_list is None:
+                    model_list = get_models(app)
+
+                for model in model_list:
+                    if model._meta.proxy:
+                        continue
+                    queryset = model._default_manager.all()
+                    if batch_size is None:
+                        for obj in queryset.iterator():
+                            yield obj
+                        continue
+                    # Fetch each batch starting after the last primary key
+                    # of the previous one, so every query is cheap no matter
+                    # how far into the table it is.
+                    pk_name = model._meta.pk.name
+                    queryset = queryset.order_by(pk_name)
+                    batch = list(queryset[:batch_size])
+                    while batch:
+                        for obj in batch:
+                            yield obj
+                        if len(batch) < batch_size:
+                            break
+                        last_pk = batch[-1]._get_pk_val()
+                        batch = list(queryset.filter(**{'%s__gt' % pk_name: last_pk})[:batch_size])
+
+        if output is None:
+            stream = sys.stdout
+        else:
+            extension = output.rsplit('.', 1)[-1]
+            open_method = compression_types.get(extension, open)
+            try:
+                stream = open_method(output, 'wb')
+            except IOError, e:
+                raise CommandError("Unable to open %s for writing: %s" % (output, e))
 
         try:
-            return serializers.serialize(format, objects, indent=indent)
-        except Exception, e:
-            if show_traceback:
-                raise
-            raise CommandError("Unable to serialize database: %s" % e)
+            try:
+                serializers.serialize(format, get_objects(), indent=indent, stream=stream)
+                if output is None:
+                    stream.write('\n')
+            except Exception, e:
+                if show_traceback:
+                    raise
+                raise CommandError("Unable to serialize database: %s" % e)
+        finally:
+            if output is not None:
+                stream.close()
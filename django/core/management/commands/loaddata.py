@@ -1,8 +1,10 @@
 import sys
 import os
+import copy
 import gzip
 import zipfile
 from optparse import make_option
+from StringIO import StringIO
 
 from django.core.management.base import BaseCommand
 from django.core.management.color import no_style
@@ -18,13 +20,43 @@ try:
 except ImportError:
     has_bz2 = False
 
+# Parsed fixtures kept by the "cache" option. Maps the path of a fixture file
+# to its size and modification time, and the objects deserialized from it.
+fixture_cache = {}
+
+def deserialize_cached(format, fixture, full_path):
+    """
+    Returns the deserialized objects of a fixture file, only parsing the file
+    if it changed since it was last loaded. Every call gets its own copies of
+    the objects, since saving them may set their primary keys.
+    """
+    from django.core import serializers
+    from django.core.serializers.base import DeserializedObject
+
+    stat = os.stat(full_path)
+    key = (stat.st_size, stat.st_mtime)
+    cached = fixture_cache.get(full_path)
+    if cached is None or cached[0] != key:
+        cached = (key, list(serializers.deserialize(format, fixture)))
+        fixture_cache[full_path] = cached
+    objects = []
+    for obj in cached[1]:
+        m2m_data = obj.m2m_data and dict(obj.m2m_data)
+        objects.append(DeserializedObject(copy.copy(obj.object), m2m_data))
+    return objects
+
 class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        make_option('--batch-size', default=None, dest='batch_size', type='int',
+            help='Saves consecutive objects of the same model in batches of this size, without sending signals.'),
+    )
     help = 'Installs the named fixture(s) in the database.'
     args = "fixture [fixture ...]"
 
     def handle(self, *fixture_labels, **options):
         from django.db.models import get_apps
         from django.core import serializers
+        from django.core.serializers.base import save_batch
         from django.db import connection, transaction
         from django.conf import settings
 
@@ -32,6 +64,7 @@ class Command(BaseCommand):
 
         verbosity = int(options.get('verbosity', 1))
         show_traceback = options.get('traceback', False)
+        batch_size = options.get('batch_size', None)
 
         # commit is a stealth option - it isn't really useful as
         # a command line option, but it can be useful when invoking
@@ -41,6 +74,11 @@ class Command(BaseCommand):
         # the transaction in place when loaddata was invoked.
         commit = options.get('commit', True)
 
+        # cache is a stealth option too. If cache=True, fixture files are
+        # only parsed again once they change; the test framework uses it
+        # to load the same fixtures for test after test.
+        use_cache = options.get('cache', False)
+
         # Keep a count of the installed objects and fixtures
         fixture_count = 0
         object_count = 0
@@ -65,8 +103,13 @@ class Command(BaseCommand):
                 zipfile.ZipFile.__init__(self, *args, **kwargs)
                 if settings.DEBUG:
                     assert len(self.namelist()) == 1, "Zip-compressed fixtures must contain only one file."
-            def read(self):
-                return zipfile.ZipFile.read(self, self.namelist()[0])
+                self._data = None
+            def read(self, size=-1):
+                # zipfile can't read a member bit by bit on older Pythons, so
+                # the whole file is decompressed on the first read.
+                if self._data is None:
+                    self._data = StringIO(zipfile.ZipFile.read(self, self.namelist()[0]))
+                return self._data.read(size)
 
         compression_types = {
             None:   file,
@@ -146,11 +189,26 @@ class Command(BaseCommand):
                                     print "Installing %s fixture '%s' from %s." % \
                                         (format, fixture_name, humanize(fixture_dir))
                                 try:
-                                    objects = serializers.deserialize(format, fixture)
+                                    if use_cache:
+                                        objects = deserialize_cached(format, fixture, full_path)
+                                    else:
+                                        objects = serializers.deserialize(format, fixture)
+                                    batch = []
                                     for obj in objects:
                                         objects_in_fixture += 1
                                         models.add(obj.object.__class__)
-                                        obj.save()
+                                        if batch_size is None:
+                                            obj.save()
+                                            continue
+                                        # Objects are saved in their original
+                                        # order, so only consecutive objects
+                                        # of a model share a batch.
+                                        if batch and (len(batch) >= batch_size or
+                                                batch[0].object.__class__ is not obj.object.__class__):
+                                            save_batch(batch)
+                                            batch = []
+                                        batch.append(obj)
+                                    save_batch(batch)
                                     object_count += objects_in_fixture
                                     label_found = True
                                 except (SystemExit, KeyboardInterrupt):
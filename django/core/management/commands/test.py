@@ -6,6 +6,16 @@ class Command(BaseCommand):
     option_list = BaseCommand.option_list + (
         make_option('--noinput', action='store_false', dest='interactive', default=True,
             help='Tells Django to NOT prompt the user for input of any kind.'),
+        make_option('--keepdb', action='store_true', dest='keepdb', default=False,
+            help='Keeps the test database after the run, and reuses it on the next run if the models are unchanged.'),
+        make_option('--keepfixtures', action='store_true', dest='keep_fixtures', default=False,
+            help='Loads the fixtures of a TestCase once and keeps them for the following TestCases using the same fixtures.'),
+        make_option('--parallel', default=1, dest='parallel', type='int',
+            help='Runs the tests in that many processes, each with its own test database.'),
+        make_option('--profile', default=0, dest='profile', type='int',
+            help='Lists that many of the slowest tests and of the tests running the most queries.'),
+        make_option('--profile-report', default=None, dest='profile_report',
+            help='Writes the time and queries of every test to this file, as JSON.'),
     )
     help = 'Runs the test suite for the specified applications, or the entire site if no apps are specified.'
     args = '[appname ...]'
@@ -20,6 +30,20 @@ class Command(BaseCommand):
         interactive = options.get('interactive', True)
         test_runner = get_runner(settings)
 
-        failures = test_runner(test_labels, verbosity=verbosity, interactive=interactive)
+        # Only pass the options below along when they're used, so that test
+        # runners that don't know about them keep working.
+        extra_options = {}
+        if options.get('keepdb'):
+            extra_options['keepdb'] = True
+        if options.get('keep_fixtures'):
+            extra_options['keep_fixtures'] = True
+        if options.get('parallel', 1) > 1:
+            extra_options['parallel'] = options['parallel']
+        if options.get('profile'):
+            extra_options['profile'] = options['profile']
+        if options.get('profile_report'):
+            extra_options['profile_report'] = options['profile_report']
+
+        failures = test_runner(test_labels, verbosity=verbosity, interactive=interactive, **extra_options)
         if failures:
             sys.exit(failures)
@@ -4,10 +4,15 @@ Module for abstract serializer/unserializer base classes.
 
 from StringIO import StringIO
 
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.query import insert_many_query, execute_insert_many
 from django.utils.encoding import smart_str, smart_unicode
 from django.utils import datetime_safe
 
+# The most values save_batch() puts in a single "IN (...)" clause; SQLite
+# doesn't allow more than 999 parameters in a query.
+BATCH_LOOKUP_SIZE = 500
+
 class SerializationError(Exception):
     """Something bad happened during serialization."""
     pass
@@ -168,3 +173,81 @@ class DeserializedObject(object):
         # prevent a second (possibly accidental) call to save() from saving
         # the m2m data twice.
         self.m2m_data = None
+
+def save_batch(deserialized_objects):
+    """
+    Saves a list of deserialized objects of the same model, with their
+    many-to-many data, using a few queries for the whole list rather than a
+    few for each object. Unlike ``DeserializedObject.save()``, no signals are
+    sent.
+
+    Objects that already exist in the database are updated one at a time;
+    the others are inserted together.
+    """
+    if not deserialized_objects:
+        return
+    model = deserialized_objects[0].object.__class__
+    opts = model._meta
+    objs = [d.object for d in deserialized_objects]
+    pk_vals = [obj._get_pk_val() for obj in objs]
+    if (opts.proxy or opts.order_with_respect_to or None in pk_vals
+            or len(set(pk_vals)) != len(pk_vals)
+            or [f for f in opts.local_fields if hasattr(f, 'get_placeholder')]):
+        # These need the extra care taken by Model.save_base().
+        for d in deserialized_objects:
+            d.save()
+        return
+
+    manager = model._base_manager
+    existing = set()
+    for i in range(0, len(pk_vals), BATCH_LOOKUP_SIZE):
+        existing.update(manager.filter(pk__in=pk_vals[i:i + BATCH_LOOKUP_SIZE])
+                               .values_list('pk', flat=True).order_by())
+
+    # The values are taken as Model.save_base(raw=True) takes them.
+    non_pks = [f for f in opts.local_fields if not f.primary_key]
+    rows = []
+    for obj, pk_val in zip(objs, pk_vals):
+        if pk_val in existing:
+            if non_pks:
+                values = [(f, None, getattr(obj, f.attname) or f.pre_save(obj, False))
+                          for f in non_pks]
+                manager.filter(pk=pk_val)._update(values)
+        else:
+            rows.append([f.get_db_prep_save(getattr(obj, f.attname) or f.pre_save(obj, True))
+                         for f in opts.local_fields])
+    insert_many_query(model, opts.local_fields, rows)
+
+    # Replace the many-to-many data of the whole batch, one relation at a
+    # time.
+    qn = connection.ops.quote_name
+    cursor = connection.cursor()
+    for field in opts.many_to_many:
+        m2m = [(obj, d.m2m_data[field.name]) for obj, d in zip(objs, deserialized_objects)
+               if d.m2m_data and field.name in d.m2m_data]
+        if not m2m:
+            continue
+        if not field.creates_table or (field.rel.symmetrical and field.rel.to == model):
+            for obj, object_list in m2m:
+                setattr(obj, field.name, object_list)
+            continue
+        table, source, target = (qn(field.m2m_db_table()), qn(field.m2m_column_name()),
+                                 qn(field.m2m_reverse_name()))
+        source_pks = [obj._get_pk_val() for obj, object_list in m2m if obj._get_pk_val() in existing]
+        for i in range(0, len(source_pks), BATCH_LOOKUP_SIZE):
+            chunk = source_pks[i:i + BATCH_LOOKUP_SIZE]
+            cursor.execute("DELETE FROM %s WHERE %s IN (%s)" % (table, source,
+                           ', '.join(['%s'] * len(chunk))), chunk)
+        rows = []
+        for obj, object_list in m2m:
+            seen = set()
+            for related_pk in object_list:
+                if related_pk not in seen:
+                    seen.add(related_pk)
+                    rows.append((obj._get_pk_val(), related_pk))
+        if rows:
+            execute_insert_many("INSERT INTO %s (%s, %s) VALUES (%%s, %%s)"
+                                % (table, source, target), rows)
+    for d in deserialized_objects:
+        d.m2m_data = None
+    transaction.commit_unless_managed()
@@ -3,6 +3,7 @@ Serialize data to/from JSON
 """
 
 import datetime
+import re
 from StringIO import StringIO
 
 from django.core.serializers.python import Serializer as PythonSerializer
@@ -21,10 +22,39 @@ class Serializer(PythonSerializer):
     """
     internal_use_only = False
 
+    def start_serialization(self):
+        super(Serializer, self).start_serialization()
+        self.json_options = self.options.copy()
+        self.json_options.pop('stream', None)
+        self.json_options.pop('fields', None)
+        self.json_options['cls'] = DjangoJSONEncoder
+        # Each object is written out as soon as it's complete, so the whole
+        # list never has to be held in memory. To produce exactly the output
+        # simplejson.dump() would for the whole list, find out how it starts,
+        # separates and ends the items of a list with these options.
+        sample = simplejson.dumps([0, 0], **self.json_options)
+        first, second = sample.index('0'), sample.rindex('0')
+        self._list_start = sample[:first]
+        self._list_separator = sample[first + 1:second]
+        self._list_end = sample[second + 1:]
+        self._first = True
+
+    def add_object(self, model_name, pk, fields):
+        super(Serializer, self).add_object(model_name, pk, fields)
+        item = simplejson.dumps(self.objects, **self.json_options)
+        self.objects = []
+        if self._first:
+            self.stream.write(self._list_start)
+            self._first = False
+        else:
+            self.stream.write(self._list_separator)
+        self.stream.write(item[len(self._list_start):-len(self._list_end)])
+
     def end_serialization(self):
-        self.options.pop('stream', None)
-        self.options.pop('fields', None)
-        simplejson.dump(self.objects, self.stream, cls=DjangoJSONEncoder, **self.options)
+        if self._first:
+            self.stream.write(simplejson.dumps([], **self.json_options))
+        else:
+            self.stream.write(self._list_end)
 
     def getvalue(self):
         if callable(getattr(self.stream, 'getvalue', None)):
@@ -38,9 +68,71 @@ def Deserializer(stream_or_string, **options):
         stream = StringIO(stream_or_string)
     else:
         stream = stream_or_string
-    for obj in PythonDeserializer(simplejson.load(stream)):
+    for obj in PythonDeserializer(iter_json_list(stream), **options):
         yield obj
 
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def iter_json_list(stream, chunk_size=64 * 1024):
+    """
+    Yields the items of the JSON list read from ``stream`` one at a time, so
+    that a fixture never has to be held in memory as a whole. Only as much of
+    the stream is read as is needed to decode the next item.
+    """
+    decoder = simplejson.JSONDecoder()
+    buf, pos, eof = stream.read(chunk_size), 0, False
+    # What's expected next: the opening bracket, the first item (or the
+    # closing bracket of an empty list), an item, or a separator.
+    state = 'start'
+    while True:
+        pos = WHITESPACE.match(buf, pos).end()
+        if pos < len(buf):
+            char = buf[pos]
+            if state == 'start':
+                if char != '[':
+                    raise ValueError("Expected a JSON list at position %d" % pos)
+                pos += 1
+                state = 'first'
+                continue
+            if state in ('first', 'separator') and char == ']':
+                break
+            if state == 'separator':
+                if char != ',':
+                    raise ValueError("Expected ',' or ']' at position %d" % pos)
+                pos += 1
+                state = 'item'
+                continue
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+            else:
+                # An item cut off at the end of the buffer may still decode
+                # (e.g. "12" of "12.5"), so only trust it if it's followed by
+                # the separator or the end of the list.
+                following = WHITESPACE.match(buf, end).end()
+                if eof or (following < len(buf) and buf[following] in ',]'):
+                    pos = end
+                    state = 'separator'
+                    yield obj
+                    continue
+        elif eof:
+            raise ValueError("Unexpected end of JSON data")
+        # Read more data. Reading at least as much as is buffered already
+        # keeps decoding large items from taking quadratic time.
+        chunk = stream.read(max(chunk_size, len(buf) - pos))
+        buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+
+    # Nothing but whitespace may follow the list.
+    rest = buf[pos + 1:]
+    while True:
+        if rest.strip():
+            raise ValueError("Extra data after the JSON list")
+        rest = stream.read(chunk_size)
+        if not rest:
+            break
+
 class DjangoJSONEncoder(simplejson.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time and decimal types.
@@ -4,9 +4,12 @@ and from basic Python data types (lists, dicts, strings, etc.). Useful as a basi
 other serializers.
 """
 
+from StringIO import StringIO
+
 from django.conf import settings
 from django.core.serializers import base
-from django.db import models
+from django.db import connection, models
+from django.db.models.query import QuerySet, ValuesQuerySet
 from django.utils.encoding import smart_unicode, is_protected_type
 
 class Serializer(base.Serializer):
@@ -16,6 +19,112 @@ class Serializer(base.Serializer):
 
     internal_use_only = True
 
+    def serialize(self, queryset, **options):
+        """
+        Serialize a queryset.
+
+        With the ``use_values`` option, a ``QuerySet`` is read with
+        ``values_list()`` instead of as model instances, ``batch_size`` rows
+        at a time, and the many-to-many data of each batch is fetched with a
+        single query per relation. The output is the same.
+        """
+        use_values = options.pop('use_values', False)
+        batch_size = options.pop('batch_size', 1000)
+        if (use_values and isinstance(queryset, QuerySet)
+                and not isinstance(queryset, ValuesQuerySet)):
+            self.options = options
+            self.stream = options.get("stream", StringIO())
+            self.selected_fields = options.get("fields")
+            if self.serialize_values(queryset, batch_size):
+                return self.getvalue()
+        return super(Serializer, self).serialize(queryset, **options)
+
+    def serialize_values(self, queryset, batch_size):
+        """
+        Serializes the queryset from ``values_list()`` rows. Returns False,
+        without serializing anything, if one of the fields can't be
+        converted from its database value alone.
+        """
+        opts = queryset.model._meta
+        fields, converters = [], []
+        for field in opts.local_fields:
+            if not field.serialize:
+                continue
+            if field.rel is None:
+                if self.selected_fields is not None and field.attname not in self.selected_fields:
+                    continue
+                converter = self.get_value_converter(field)
+                if converter is None:
+                    return False
+            else:
+                if self.selected_fields is not None and field.attname[:-3] not in self.selected_fields:
+                    continue
+                converter = lambda value: smart_unicode(value, strings_only=True)
+            fields.append(field)
+            converters.append(converter)
+        m2m_fields = [f for f in opts.many_to_many if f.serialize and f.creates_table
+                      and (self.selected_fields is None or f.attname in self.selected_fields)]
+
+        model_name = smart_unicode(opts)
+        rows = queryset.values_list(opts.pk.name, *[f.name for f in fields]).iterator()
+        self.start_serialization()
+        while True:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) == batch_size:
+                    break
+            if not batch:
+                break
+            pks = [row[0] for row in batch]
+            m2m_data = [(f, self.get_m2m_values(f, pks)) for f in m2m_fields]
+            for row in batch:
+                self._current = {}
+                for field, converter, value in zip(fields, converters, row[1:]):
+                    self._current[field.name] = converter(value)
+                for field, values in m2m_data:
+                    self._current[field.name] = values.get(row[0], [])
+                self.add_object(model_name, row[0], self._current)
+                self._current = None
+        self.end_serialization()
+        return True
+
+    def get_value_converter(self, field):
+        """
+        Returns a function converting a database value of ``field`` to what
+        handle_field() would output for it, or None if that's not possible
+        without a model instance (e.g. for custom fields, whose attributes may
+        hold something else than the database value).
+        """
+        if not field.__class__.__module__.startswith('django.db.models.fields'):
+            return None
+        holder = _ValueHolder()
+        def converter(value):
+            if is_protected_type(value):
+                return value
+            holder.__dict__[field.attname] = value
+            return field.value_to_string(holder)
+        return converter
+
+    def get_m2m_values(self, field, pks):
+        """
+        Returns a dictionary mapping each of ``pks`` that has related objects
+        through ``field`` to the list of their primary keys, in the order
+        handle_m2m_field() would output them.
+        """
+        qn = connection.ops.quote_name
+        source = '%s.%s' % (qn(field.m2m_db_table()), qn(field.m2m_column_name()))
+        lookup = '%s__in' % field.related_query_name()
+        values = {}
+        # Chunked, as databases limit the number of query parameters.
+        for i in range(0, len(pks), base.BATCH_LOOKUP_SIZE):
+            related = field.rel.to._default_manager.filter(
+                **{lookup: pks[i:i + base.BATCH_LOOKUP_SIZE]})
+            related = related.extra(select={'_source_pk': source})
+            for source_pk, related_pk in related.values_list('_source_pk', 'pk'):
+                values.setdefault(source_pk, []).append(smart_unicode(related_pk, strings_only=True))
+        return values
+
     def start_serialization(self):
         self._current = None
         self.objects = []
@@ -27,12 +136,18 @@ class Serializer(base.Serializer):
         self._current = {}
 
     def end_object(self, obj):
+        self.add_object(smart_unicode(obj._meta), obj._get_pk_val(), self._current)
+        self._current = None
+
+    def add_object(self, model_name, pk, fields):
+        """
+        Called with the data of each serialized object.
+        """
         self.objects.append({
-            "model"  : smart_unicode(obj._meta),
-            "pk"     : smart_unicode(obj._get_pk_val(), strings_only=True),
-            "fields" : self._current
+            "model"  : model_name,
+            "pk"     : smart_unicode(pk, strings_only=True),
+            "fields" : fields
         })
-        self._current = None
 
     def handle_field(self, obj, field):
         value = field._get_val_from_obj(obj)
@@ -63,6 +178,12 @@ class Serializer(base.Serializer):
     def getvalue(self):
         return self.objects
 
+class _ValueHolder(object):
+    """
+    Stands in for a model instance when calling Field.value_to_string().
+    """
+    pass
+
 def Deserializer(object_list, **options):
     """
     Deserialize simple Python objects back into Django ORM instances.
@@ -41,6 +41,17 @@ class Serializer(PythonSerializer):
         else:
             super(Serializer, self).handle_field(obj, field)
     
+    def get_value_converter(self, field):
+        converter = super(Serializer, self).get_value_converter(field)
+        if isinstance(field, models.TimeField) and converter is not None:
+            # The same special case as in handle_field().
+            def time_converter(value):
+                if value is None:
+                    return None
+                return str(value)
+            return time_converter
+        return converter
+
     def end_serialization(self):
         self.options.pop('stream', None)
         self.options.pop('fields', None)
@@ -32,6 +32,11 @@ class BaseDatabaseWrapper(local):
         self.connection = None
         self.queries = []
         self.settings_dict = settings_dict
+        # Set to True to record connection.queries even if DEBUG is off.
+        self.use_debug_cursor = False
+        # The unrounded total time of the queries recorded so far, which
+        # connection.queries resets don't affect.
+        self.queries_time = 0.0
 
     def _commit(self):
         if self.connection is not None:
@@ -79,7 +84,7 @@ class BaseDatabaseWrapper(local):
     def cursor(self):
         from django.conf import settings
         cursor = self._cursor()
-        if settings.DEBUG:
+        if settings.DEBUG or self.use_debug_cursor:
             return self.make_debug_cursor(cursor)
         return cursor
 
@@ -102,6 +107,9 @@ class BaseDatabaseFeatures(object):
     # If True, don't use integer foreign keys referring to, e.g., positive
     # integer primary keys.
     related_fields_match_type = False
+    # True if an INSERT can take several rows, as in
+    # "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)".
+    can_insert_multiple_rows = False
 
 class BaseDatabaseOperations(object):
     """
@@ -162,6 +170,14 @@ class BaseDatabaseOperations(object):
         """
         return None
 
+    def estimated_row_count(self, cursor, table_name):
+        """
+        Returns the number of rows in the given table as estimated from the
+        database's statistics, without counting them, or None if the backend
+        has no cheap way to estimate it.
+        """
+        return None
+
     def fetch_returned_insert_id(self, cursor):
         """
         Given a cursor object that has just performed an INSERT...RETURNING
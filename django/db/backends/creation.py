@@ -8,11 +8,16 @@ except NameError:
 
 from django.conf import settings
 from django.core.management import call_command
+from django.utils.encoding import smart_str
+from django.utils.hashcompat import md5_constructor
 
 # The prefix to put on the default database name when creating
 # the test database.
 TEST_DATABASE_PREFIX = 'test_'
 
+# The table holding the schema hash of a test database kept for reuse.
+TEST_SCHEMA_TABLE = 'django_test_schema'
+
 class BaseDatabaseCreation(object):
     """
     This class encapsulates all backend-specific differences that pertain to
@@ -316,11 +321,21 @@ class BaseDatabaseCreation(object):
                 output.append(ds)
         return output
 
-    def create_test_db(self, verbosity=1, autoclobber=False):
+    def create_test_db(self, verbosity=1, autoclobber=False, keepdb=False):
         """
         Creates a test database, prompting the user for confirmation if the
         database already exists. Returns the name of the test database created.
+
+        If keepdb is True, the test database left by a previous run is reused
+        instead, provided its tables were created for the same models.
         """
+        schema_hash = None
+        if keepdb:
+            schema_hash = self._test_db_schema_hash()
+            test_database_name = self._reuse_test_db(schema_hash, verbosity)
+            if test_database_name is not None:
+                return test_database_name
+
         if verbosity >= 1:
             print "Creating test database..."
 
@@ -340,20 +355,99 @@ class BaseDatabaseCreation(object):
             _, cache_name, _ = parse_backend_uri(settings.CACHE_BACKEND)
             call_command('createcachetable', cache_name)
 
+        if schema_hash is not None and self._get_test_db_name() is not None:
+            self._set_test_db_schema_hash(schema_hash)
+
         # Get a cursor (even though we don't need one yet). This has
         # the side effect of initializing the test database.
         cursor = self.connection.cursor()
 
         return test_database_name
 
+    def _get_test_db_name(self):
+        """
+        Returns the name of the test database, or None if the backend can't
+        keep a test database from one run to the next.
+        """
+        if settings.TEST_DATABASE_NAME:
+            return settings.TEST_DATABASE_NAME
+        return TEST_DATABASE_PREFIX + settings.DATABASE_NAME
+
+    def set_test_db_suffix(self, suffix):
+        """
+        Adds a suffix to the name of the test database, so that the worker
+        processes of a parallel test run each get a database of their own.
+        """
+        test_database_name = self._get_test_db_name()
+        if test_database_name is not None:
+            settings.TEST_DATABASE_NAME = test_database_name + suffix
+
+    def _test_db_schema_hash(self):
+        """
+        Returns a digest of the SQL syncdb runs to create the tables of the
+        installed models, which tells whether a kept test database is still
+        usable.
+        """
+        from django.core.management.color import no_style
+        from django.db import models
+        style = no_style()
+        known_models = set()
+        output = []
+        for app in models.get_apps():
+            for model in models.get_models(app):
+                output.extend(self.sql_create_model(model, style, known_models)[0])
+                output.extend(self.sql_for_many_to_many(model, style))
+                output.extend(self.sql_indexes_for_model(model, style))
+                known_models.add(model)
+        return md5_constructor(smart_str('\n'.join(output))).hexdigest()
+
+    def _set_test_db_schema_hash(self, schema_hash):
+        qn = self.connection.ops.quote_name
+        cursor = self.connection.cursor()
+        cursor.execute("CREATE TABLE %s (schema_hash varchar(32))" % qn(TEST_SCHEMA_TABLE))
+        cursor.execute("INSERT INTO %s (schema_hash) VALUES (%%s)" % qn(TEST_SCHEMA_TABLE),
+                       [schema_hash])
+        self.connection._commit()
+
+    def _reuse_test_db(self, schema_hash, verbosity):
+        """
+        Connects to the kept test database if its schema hash matches and
+        returns its name. Otherwise, returns None and leaves the connection
+        settings alone.
+        """
+        test_database_name = self._get_test_db_name()
+        if test_database_name is None:
+            return None
+        old_database_name = settings.DATABASE_NAME
+        self.connection.close()
+        settings.DATABASE_NAME = test_database_name
+        self.connection.settings_dict["DATABASE_NAME"] = test_database_name
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT schema_hash FROM %s" % self.connection.ops.quote_name(TEST_SCHEMA_TABLE))
+            row = cursor.fetchone()
+        except Exception:
+            row = None
+        if row is None or row[0] != schema_hash:
+            self.connection.close()
+            settings.DATABASE_NAME = old_database_name
+            self.connection.settings_dict["DATABASE_NAME"] = old_database_name
+            return None
+
+        if verbosity >= 1:
+            print "Using existing test database..."
+        can_rollback = self._rollback_works()
+        settings.DATABASE_SUPPORTS_TRANSACTIONS = can_rollback
+        self.connection.settings_dict["DATABASE_SUPPORTS_TRANSACTIONS"] = can_rollback
+        # Remove whatever the previous run left in the tables.
+        call_command('flush', verbosity=0, interactive=False)
+        return test_database_name
+
     def _create_test_db(self, verbosity, autoclobber):
         "Internal implementation - creates the test db tables."
         suffix = self.sql_table_creation_suffix()
 
-        if settings.TEST_DATABASE_NAME:
-            test_database_name = settings.TEST_DATABASE_NAME
-        else:
-            test_database_name = TEST_DATABASE_PREFIX + settings.DATABASE_NAME
+        test_database_name = self._get_test_db_name()
 
         qn = self.connection.ops.quote_name
 
@@ -397,19 +491,27 @@ class BaseDatabaseCreation(object):
         self.connection._commit()
         return count == 0
 
-    def destroy_test_db(self, old_database_name, verbosity=1):
+    def destroy_test_db(self, old_database_name, verbosity=1, keepdb=False):
         """
         Destroy a test database, prompting the user for confirmation if the
         database already exists. Returns the name of the test database created.
+
+        If keepdb is True, the test database is left in place for the next
+        run, if the backend supports that.
         """
+        keepdb = keepdb and self._get_test_db_name() is not None
         if verbosity >= 1:
-            print "Destroying test database..."
+            if keepdb:
+                print "Preserving test database..."
+            else:
+                print "Destroying test database..."
         self.connection.close()
         test_database_name = settings.DATABASE_NAME
         settings.DATABASE_NAME = old_database_name
         self.connection.settings_dict["DATABASE_NAME"] = old_database_name
 
-        self._destroy_test_db(test_database_name, verbosity)
+        if not keepdb:
+            self._destroy_test_db(test_database_name, verbosity)
 
     def _destroy_test_db(self, test_database_name, verbosity):
         "Internal implementation - remove the test db tables."
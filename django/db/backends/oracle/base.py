@@ -111,6 +111,14 @@ WHEN (new.%(col_name)s IS NULL)
     def drop_sequence_sql(self, table):
         return "DROP SEQUENCE %s;" % self.quote_name(get_sequence_name(table))
 
+    def estimated_row_count(self, cursor, table_name):
+        cursor.execute("SELECT num_rows FROM user_tables WHERE table_name = %s",
+                       [table_name.upper()])
+        row = cursor.fetchone()
+        if row is None or row[0] is None:
+            return None
+        return int(row[0])
+
     def fetch_returned_insert_id(self, cursor):
         return long(cursor._insert_id_var.getvalue())
 
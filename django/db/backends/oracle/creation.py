@@ -41,6 +41,16 @@ class DatabaseCreation(BaseDatabaseCreation):
 
     remember = {}
 
+    def _get_test_db_name(self):
+        # The test database is a user created for the run, so it can't be kept.
+        return None
+
+    def set_test_db_suffix(self, suffix):
+        # The test database lives in a user and tablespaces of its own.
+        settings.TEST_DATABASE_USER = self._test_database_user(settings) + suffix
+        settings.TEST_DATABASE_TBLSPACE = self._test_database_tblspace(settings) + suffix
+        settings.TEST_DATABASE_TBLSPACE_TMP = self._test_database_tblspace_tmp(settings) + suffix
+
     def _create_test_db(self, verbosity=1, autoclobber=False):
         TEST_DATABASE_NAME = self._test_database_name(settings)
         TEST_DATABASE_USER = self._test_database_user(settings)
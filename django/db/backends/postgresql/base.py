@@ -67,6 +67,7 @@ class UnicodeCursorWrapper(object):
 
 class DatabaseFeatures(BaseDatabaseFeatures):
     uses_savepoints = True
+    can_insert_multiple_rows = True
 
 class DatabaseWrapper(BaseDatabaseWrapper):
     operators = {
@@ -33,6 +33,16 @@ class DatabaseOperations(BaseDatabaseOperations):
     def deferrable_sql(self):
         return " DEFERRABLE INITIALLY DEFERRED"
 
+    # The text search configuration used by the 'search' lookup. It's given
+    # explicitly so that an expression index such as
+    # "CREATE INDEX ... USING gin(to_tsvector('english', column))" can be used.
+    text_search_config = 'english'
+
+    def fulltext_search_sql(self, field_name):
+        # http://www.postgresql.org/docs/8.3/static/textsearch-controls.html
+        return "to_tsvector('%s', %s) @@ plainto_tsquery('%s', %%s)" % (
+            self.text_search_config, field_name, self.text_search_config)
+
     def lookup_cast(self, lookup_type):
         lookup = '%s'
 
@@ -52,6 +62,17 @@ class DatabaseOperations(BaseDatabaseOperations):
             return 'HOST(%s)'
         return '%s'
 
+    def estimated_row_count(self, cursor, table_name):
+        # Only the table that the search path resolves the name to.
+        cursor.execute("""
+            SELECT reltuples FROM pg_class
+            WHERE relname = %s AND relkind = 'r' AND pg_table_is_visible(oid)""",
+            [table_name])
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return int(row[0])
+
     def last_insert_id(self, cursor, table_name, pk_name):
         cursor.execute("SELECT CURRVAL('\"%s_%s_seq\"')" % (table_name, pk_name))
         return cursor.fetchone()[0]
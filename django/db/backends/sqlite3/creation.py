@@ -38,6 +38,19 @@ class DatabaseCreation(BaseDatabaseCreation):
         "SQLite3 doesn't support constraints"
         return []
         
+    def _get_test_db_name(self):
+        # An in-memory database goes away with the connection.
+        if settings.TEST_DATABASE_NAME and settings.TEST_DATABASE_NAME != ":memory:":
+            return settings.TEST_DATABASE_NAME
+        return None
+
+    def _reuse_test_db(self, schema_hash, verbosity):
+        # Connecting to a missing file would create an empty database.
+        test_database_name = self._get_test_db_name()
+        if test_database_name is None or not os.access(test_database_name, os.F_OK):
+            return None
+        return super(DatabaseCreation, self)._reuse_test_db(schema_hash, verbosity)
+
     def _create_test_db(self, verbosity, autoclobber):
         if settings.TEST_DATABASE_NAME and settings.TEST_DATABASE_NAME != ":memory:":
             test_database_name = settings.TEST_DATABASE_NAME
@@ -19,6 +19,7 @@ class CursorDebugWrapper(object):
             return self.cursor.execute(sql, params)
         finally:
             stop = time()
+            self.db.queries_time += stop - start
             sql = self.db.ops.last_executed_query(self.cursor, sql, params)
             self.db.queries.append({
                 'sql': sql,
@@ -31,6 +32,7 @@ class CursorDebugWrapper(object):
             return self.cursor.executemany(sql, param_list)
         finally:
             stop = time()
+            self.db.queries_time += stop - start
             self.db.queries.append({
                 'sql': '%s times: %s' % (len(param_list), sql),
                 'time': "%.3f" % (stop - start),
@@ -406,11 +406,14 @@ def create_many_related_manager(superclass, through=False):
     and adds behavior for many-to-many related objects."""
     class ManyRelatedManager(superclass):
         def __init__(self, model=None, core_filters=None, instance=None, symmetrical=None,
-                join_table=None, source_col_name=None, target_col_name=None):
+                join_table=None, source_col_name=None, target_col_name=None,
+                field=None, reverse=False):
             super(ManyRelatedManager, self).__init__()
             self.core_filters = core_filters
             self.model = model
             self.symmetrical = symmetrical
+            self.field = field
+            self.reverse = reverse
             self.instance = instance
             self.join_table = join_table
             self.source_col_name = source_col_name
@@ -443,11 +446,13 @@ def create_many_related_manager(superclass, through=False):
             remove.alters_data = True
 
         def clear(self):
+            self._send_m2m_changed('pre_clear', None)
             self._clear_items(self.source_col_name)
 
             # If this is a symmetrical m2m relation to self, clear the mirror entry in the m2m table
             if self.symmetrical:
                 self._clear_items(self.target_col_name)
+            self._send_m2m_changed('post_clear', None)
         clear.alters_data = True
 
         def create(self, **kwargs):
@@ -496,13 +501,19 @@ def create_many_related_manager(superclass, through=False):
                     target_col_name, ",".join(['%s'] * len(new_ids))),
                     [self._pk_val] + list(new_ids))
                 existing_ids = set([row[0] for row in cursor.fetchall()])
+                new_ids = new_ids - existing_ids
 
+                # Don't signal the mirror entries of a symmetrical relation.
+                if source_col_name == self.source_col_name:
+                    self._send_m2m_changed('pre_add', new_ids)
                 # Add the ones that aren't there already
-                for obj_id in (new_ids - existing_ids):
+                for obj_id in new_ids:
                     cursor.execute("INSERT INTO %s (%s, %s) VALUES (%%s, %%s)" % \
                         (self.join_table, source_col_name, target_col_name),
                         [self._pk_val, obj_id])
                 transaction.commit_unless_managed()
+                if source_col_name == self.source_col_name:
+                    self._send_m2m_changed('post_add', new_ids)
 
         def _remove_items(self, source_col_name, target_col_name, *objs):
             # source_col_name: the PK colname in join_table for the source object
@@ -518,6 +529,8 @@ def create_many_related_manager(superclass, through=False):
                         old_ids.add(obj._get_pk_val())
                     else:
                         old_ids.add(obj)
+                if source_col_name == self.source_col_name:
+                    self._send_m2m_changed('pre_remove', old_ids)
                 # Remove the specified objects from the join table
                 cursor = connection.cursor()
                 cursor.execute("DELETE FROM %s WHERE %s = %%s AND %s IN (%s)" % \
@@ -525,6 +538,8 @@ def create_many_related_manager(superclass, through=False):
                     target_col_name, ",".join(['%s'] * len(old_ids))),
                     [self._pk_val] + list(old_ids))
                 transaction.commit_unless_managed()
+                if source_col_name == self.source_col_name:
+                    self._send_m2m_changed('post_remove', old_ids)
 
         def _clear_items(self, source_col_name):
             # source_col_name: the PK colname in join_table for the source object
@@ -534,6 +549,12 @@ def create_many_related_manager(superclass, through=False):
                 [self._pk_val])
             transaction.commit_unless_managed()
 
+        def _send_m2m_changed(self, action, pk_set):
+            if self.field is not None:
+                signals.m2m_changed.send(sender=self.field.get_through(),
+                    action=action, instance=self.instance, reverse=self.reverse,
+                    model=self.model, pk_set=pk_set, field=self.field)
+
     return ManyRelatedManager
 
 class ManyRelatedObjectsDescriptor(object):
@@ -564,7 +585,9 @@ class ManyRelatedObjectsDescriptor(object):
             symmetrical=False,
             join_table=qn(self.related.field.m2m_db_table()),
             source_col_name=qn(self.related.field.m2m_reverse_name()),
-            target_col_name=qn(self.related.field.m2m_column_name())
+            target_col_name=qn(self.related.field.m2m_column_name()),
+            field=self.related.field,
+            reverse=True
         )
 
         return manager
@@ -581,6 +604,11 @@ class ManyRelatedObjectsDescriptor(object):
         manager.clear()
         manager.add(*value)
 
+    def _through(self):
+        # The intermediary model of the relation (see ManyToManyField.get_through).
+        return self.related.field.get_through()
+    through = property(_through)
+
 class ReverseManyRelatedObjectsDescriptor(object):
     # This class provides the functionality that makes the related-object
     # managers available as attributes on a model class, for fields that have
@@ -609,7 +637,9 @@ class ReverseManyRelatedObjectsDescriptor(object):
             symmetrical=(self.field.rel.symmetrical and isinstance(instance, rel_model)),
             join_table=qn(self.field.m2m_db_table()),
             source_col_name=qn(self.field.m2m_column_name()),
-            target_col_name=qn(self.field.m2m_reverse_name())
+            target_col_name=qn(self.field.m2m_reverse_name()),
+            field=self.field,
+            reverse=False
         )
 
         return manager
@@ -626,6 +656,11 @@ class ReverseManyRelatedObjectsDescriptor(object):
         manager.clear()
         manager.add(*value)
 
+    def _through(self):
+        # The intermediary model of the relation (see ManyToManyField.get_through).
+        return self.field.get_through()
+    through = property(_through)
+
 class ManyToOneRel(object):
     def __init__(self, to, field_name, related_name=None,
             limit_choices_to=None, lookup_overrides=None, parent_link=False):
@@ -790,6 +825,23 @@ class OneToOneField(ForeignKey):
             return None
         return super(OneToOneField, self).formfield(**kwargs)
 
+class AutoCreatedThrough(object):
+    """
+    Stands in for the intermediary model of a ManyToManyField that doesn't
+    specify one, since its join table isn't backed by a model. It is what the
+    ``through`` attribute of the relation (e.g. ``Pizza.toppings.through``)
+    returns, and the sender of the relation's m2m_changed signals.
+    """
+    auto_created = True
+
+    def __init__(self, model, field):
+        self.model = model
+        self.field = field
+
+    def __repr__(self):
+        return '<AutoCreatedThrough: %s.%s_%s>' % (self.model._meta.app_label,
+            self.model._meta.object_name, self.field.name)
+
 class ManyToManyField(RelatedField, Field):
     def __init__(self, to, **kwargs):
         try:
@@ -938,6 +990,8 @@ class ManyToManyField(RelatedField, Field):
         elif self.rel.through:
             self.rel.through_model = self.rel.through
             self.rel.through = self.rel.through._meta.object_name
+        else:
+            self.auto_through = AutoCreatedThrough(cls, self)
 
         if isinstance(self.rel.to, basestring):
             target = self.rel.to
@@ -945,6 +999,15 @@ class ManyToManyField(RelatedField, Field):
             target = self.rel.to._meta.db_table
         cls._meta.duplicate_targets[self.column] = (target, "m2m")
 
+    def get_through(self):
+        """
+        Returns the intermediary model of the relation, or an
+        AutoCreatedThrough if the join table was created automatically.
+        """
+        if self.rel.through is None:
+            return self.auto_through
+        return self.rel.through_model
+
     def contribute_to_related_class(self, cls, related):
         # m2m relations to self do not have a ManyRelatedObjectsDescriptor,
         # as it would be redundant - unless the field is non-symmetrical.
@@ -1085,3 +1085,32 @@ def insert_query(model, values, return_id=False, raw_values=False):
     query = sql.InsertQuery(model, connection)
     query.insert_values(values, raw_values)
     return query.execute_sql(return_id)
+
+def insert_many_query(model, fields, rows):
+    """
+    Inserts a record for each of the lists of values in 'rows', which are
+    given in the order of 'fields'. It is not part of the public API.
+    """
+    if not rows:
+        return
+    query = sql.InsertQuery(model, connection)
+    query.insert_values([(f, None) for f in fields])
+    execute_insert_many(query.as_sql()[0], rows)
+
+def execute_insert_many(insert_sql, rows):
+    """
+    Executes the single row INSERT statement 'insert_sql' for each of the
+    parameter lists in 'rows'. Backends that support it get a single
+    multi-row INSERT; the others use the cursor's executemany(). It is not
+    part of the public API.
+    """
+    cursor = connection.cursor()
+    if connection.features.can_insert_multiple_rows:
+        head, placeholders = insert_sql.rsplit(' VALUES ', 1)
+        insert_sql = '%s VALUES %s' % (head, ', '.join([placeholders] * len(rows)))
+        params = []
+        for row in rows:
+            params.extend(row)
+        cursor.execute(insert_sql, params)
+    else:
+        cursor.executemany(insert_sql, rows)
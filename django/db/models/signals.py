@@ -11,4 +11,6 @@ post_save = Signal(providing_args=["instance", "raw", "created"])
 pre_delete = Signal(providing_args=["instance"])
 post_delete = Signal(providing_args=["instance"])
 
+m2m_changed = Signal(providing_args=["action", "instance", "reverse", "model", "pk_set", "field"])
+
 post_syncdb = Signal(providing_args=["class", "app", "created_models", "verbosity", "interactive"])
@@ -17,6 +17,94 @@ __all__ = ('BaseForm', 'Form')
 
 NON_FIELD_ERRORS = '__all__'
 
+class FieldDict(SortedDict):
+    """
+    The ``fields`` of a form instance. Values start out as the class-wide
+    fields from ``base_fields`` and are deep-copied the first time they're
+    looked up, so a form only pays for copying the fields that are actually
+    accessed (and so might be modified) through ``self.fields``. Fields that
+    are assigned are stored as they are.
+
+    The form's own validation and rendering use _raw_field_items(), which
+    doesn't copy anything.
+    """
+    def __init__(self, base_fields):
+        super(FieldDict, self).__init__(base_fields)
+        self._copied = set()
+
+    def __getitem__(self, key):
+        value = super(FieldDict, self).__getitem__(key)
+        if key not in self._copied:
+            value = deepcopy(value)
+            dict.__setitem__(self, key, value)
+            self._copied.add(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super(FieldDict, self).__setitem__(key, value)
+        self._copied.add(key)
+
+    def __delitem__(self, key):
+        super(FieldDict, self).__delitem__(key)
+        self._copied.discard(key)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super(FieldDict, self).pop(key, *args)
+
+    def popitem(self):
+        if not self.keyOrder:
+            raise KeyError('popitem(): dictionary is empty')
+        key = self.keyOrder[-1]
+        return key, self.pop(key)
+
+    def setdefault(self, key, default):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def insert(self, index, key, value):
+        super(FieldDict, self).insert(index, key, value)
+        self._copied.add(key)
+
+    def values(self):
+        return [self[key] for key in self.keyOrder]
+
+    def itervalues(self):
+        for key in self.keyOrder:
+            yield self[key]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keyOrder]
+
+    def iteritems(self):
+        for key in self.keyOrder:
+            yield key, self[key]
+
+    def copy(self):
+        return SortedDict(self.items())
+
+    def __deepcopy__(self, memo):
+        return SortedDict([(key, deepcopy(value, memo))
+                           for key, value in _raw_field_items(self)])
+
+def _raw_field_items(fields):
+    """
+    Returns the (name, field) pairs of a form's ``fields`` without copying
+    fields that haven't been accessed yet. Only for read-only use by the form
+    itself; these fields may be shared with ``base_fields``.
+    """
+    return [(name, dict.__getitem__(fields, name)) for name in fields.keys()]
+
 def pretty_name(name):
     "Converts 'first_name' to 'First name'"
     name = name[0].upper() + name[1:]
@@ -85,10 +173,10 @@ class BaseForm(StrAndUnicode):
 
         # The base_fields class attribute is the *class-wide* definition of
         # fields. Because a particular *instance* of the class might want to
-        # alter self.fields, we create self.fields here by copying base_fields.
-        # Instances should always modify self.fields; they should not modify
-        # self.base_fields.
-        self.fields = deepcopy(self.base_fields)
+        # alter self.fields, we create self.fields here from base_fields; each
+        # field is copied the first time it's looked up. Instances should
+        # always modify self.fields; they should not modify self.base_fields.
+        self.fields = FieldDict(self.base_fields)
 
     def __unicode__(self):
         return self.as_table()
@@ -138,7 +226,7 @@ class BaseForm(StrAndUnicode):
         "Helper function for outputting HTML. Used by as_table(), as_ul(), as_p()."
         top_errors = self.non_field_errors() # Errors that should be displayed above all fields.
         output, hidden_fields = [], []
-        for name, field in self.fields.items():
+        for name, field in _raw_field_items(self.fields):
             bf = BoundField(self, field, name)
             bf_errors = self.error_class([conditional_escape(error) for error in bf.errors]) # Escape and cache in local variable.
             if bf.is_hidden:
@@ -227,7 +315,7 @@ class BaseForm(StrAndUnicode):
         # changed from the initial data, short circuit any validation.
         if self.empty_permitted and not self.has_changed():
             return
-        for name, field in self.fields.items():
+        for name, field in _raw_field_items(self.fields):
             # value_from_datadict() gets the data from the data dictionaries.
             # Each widget type knows how to retrieve its own data, because some
             # widgets split data over several HTML fields.
@@ -277,7 +365,7 @@ class BaseForm(StrAndUnicode):
             # submitted data, but we'd need a way to easily get the string value
             # for a given field. Right now, that logic is embedded in the render
             # method of each widget.
-            for name, field in self.fields.items():
+            for name, field in _raw_field_items(self.fields):
                 prefixed_name = self.add_prefix(name)
                 data_value = field.widget.value_from_datadict(self.data, self.files, prefixed_name)
                 if not field.show_hidden_initial:
@@ -297,7 +385,7 @@ class BaseForm(StrAndUnicode):
         Provide a description of all media required to render the widgets on this form
         """
         media = Media()
-        for field in self.fields.values():
+        for name, field in _raw_field_items(self.fields):
             media = media + field.widget.media
         return media
     media = property(_get_media)
@@ -307,7 +395,7 @@ class BaseForm(StrAndUnicode):
         Returns True if the form needs to be multipart-encrypted, i.e. it has
         FileInput. Otherwise, False.
         """
-        for field in self.fields.values():
+        for name, field in _raw_field_items(self.fields):
             if field.widget.needs_multipart_form:
                 return True
         return False
@@ -9,7 +9,7 @@ from django.utils.text import get_text_list, capfirst
 from django.utils.translation import ugettext_lazy as _, ugettext
 
 from util import ValidationError, ErrorList
-from forms import BaseForm, get_declared_fields, NON_FIELD_ERRORS
+from forms import BaseForm, get_declared_fields, _raw_field_items, NON_FIELD_ERRORS
 from fields import Field, ChoiceField, IntegerField, EMPTY_VALUES
 from widgets import Select, SelectMultiple, HiddenInput, MultipleHiddenInput
 from widgets import media_property
@@ -23,7 +23,7 @@ except NameError:
 __all__ = (
     'ModelForm', 'BaseModelForm', 'model_to_dict', 'fields_for_model',
     'save_instance', 'form_for_fields', 'ModelChoiceField',
-    'ModelMultipleChoiceField',
+    'ModelMultipleChoiceField', 'ModelChoiceCache',
 )
 
 
@@ -452,8 +452,13 @@ class BaseModelFormSet(BaseFormSet):
     model = None
 
     def __init__(self, data=None, files=None, auto_id='id_%s', prefix=None,
-                 queryset=None, **kwargs):
+                 queryset=None, choice_cache=None, **kwargs):
         self.queryset = queryset
+        # The forms share the choices of their ModelChoiceFields, so each
+        # distinct queryset is only evaluated once when rendering.
+        if choice_cache is None:
+            choice_cache = ModelChoiceCache()
+        self.choice_cache = choice_cache
         defaults = {'data': data, 'files': files, 'auto_id': auto_id, 'prefix': prefix}
         defaults.update(kwargs)
         super(BaseModelFormSet, self).__init__(**defaults)
@@ -480,7 +485,9 @@ class BaseModelFormSet(BaseFormSet):
             kwargs['instance'] = self._existing_object(pk)
         if i < self.initial_form_count() and not kwargs.get('instance'):
             kwargs['instance'] = self.get_queryset()[i]
-        return super(BaseModelFormSet, self)._construct_form(i, **kwargs)
+        form = super(BaseModelFormSet, self)._construct_form(i, **kwargs)
+        self.choice_cache.add_form(form)
+        return form
 
     def get_queryset(self):
         if not hasattr(self, '_queryset'):
@@ -706,7 +713,7 @@ def modelformset_factory(model, form=ModelForm, formfield_callback=lambda f: f.f
 class BaseInlineFormSet(BaseModelFormSet):
     """A formset for child objects related to a parent."""
     def __init__(self, data=None, files=None, instance=None,
-                 save_as_new=False, prefix=None):
+                 save_as_new=False, prefix=None, choice_cache=None):
         from django.db.models.fields.related import RelatedObject
         if instance is None:
             self.instance = self.model()
@@ -721,7 +728,8 @@ class BaseInlineFormSet(BaseModelFormSet):
             backlink_value = getattr(self.instance, self.fk.rel.field_name)
         qs = self.model._default_manager.filter(**{self.fk.name: backlink_value})
         super(BaseInlineFormSet, self).__init__(data, files, prefix=prefix,
-                                                queryset=qs)
+                                                queryset=qs,
+                                                choice_cache=choice_cache)
 
     def initial_form_count(self):
         if self.save_as_new:
@@ -905,11 +913,25 @@ class ModelChoiceIterator(object):
             yield (u"", self.field.empty_label)
         if self.field.cache_choices:
             if self.field.choice_cache is None:
-                self.field.choice_cache = [
-                    self.choice(obj) for obj in self.queryset.all()
-                ]
-            for choice in self.field.choice_cache:
-                yield choice
+                self.field.choice_cache = list(self.generate_choices())
+            choices = self.field.choice_cache
+        elif self.field.shared_choice_cache is not None:
+            choices = self.field.shared_choice_cache.get_choices(self)
+        else:
+            choices = self.generate_choices()
+        for choice in choices:
+            yield choice
+
+    def generate_choices(self):
+        """
+        Yields the choices from a fresh copy of the queryset, without the
+        empty label. If the field has a ``label_field``, choices are read
+        with ``values_list()`` instead of instantiating model objects.
+        """
+        if self.field.label_field:
+            key = self.field.to_field_name or 'pk'
+            for value, label in self.queryset.values_list(key, self.field.label_field):
+                yield (value, smart_unicode(label))
         else:
             for obj in self.queryset.all():
                 yield self.choice(obj)
@@ -922,6 +944,46 @@ class ModelChoiceIterator(object):
         return (key, self.field.label_from_instance(obj))
 
 
+class ModelChoiceCache(object):
+    """
+    Caches the choices of the ModelChoiceFields of several forms, e.g. all the
+    forms of a formset, so that each distinct queryset is only evaluated once.
+
+    Choices are keyed on the SQL of the field's queryset (along with the field
+    class, to_field_name and label_field), so fields whose querysets have been
+    customized per form don't get each other's choices. The cache is never
+    invalidated; it should live no longer than a request.
+    """
+    def __init__(self):
+        self._choices = {}
+
+    def add_form(self, form):
+        """
+        Makes the ModelChoiceFields of the given form use this cache, unless
+        they already cache their own choices.
+        """
+        for name, field in _raw_field_items(form.fields):
+            if isinstance(field, ModelChoiceField) and not field.cache_choices:
+                form.fields[name].shared_choice_cache = self
+
+    def get_choices(self, iterator):
+        """
+        Returns the list of choices for the given ModelChoiceIterator.
+        """
+        from django.db.models.sql import EmptyResultSet
+        field = iterator.field
+        try:
+            sql, params = iterator.queryset.query.as_sql()
+        except EmptyResultSet:
+            return []
+        key = (field.__class__, field.to_field_name, field.label_field,
+               sql, repr(params))
+        try:
+            return self._choices[key]
+        except KeyError:
+            choices = self._choices[key] = list(iterator.generate_choices())
+            return choices
+
 class ModelChoiceField(ChoiceField):
     """A ChoiceField whose choices are a model QuerySet."""
     # This class is a subclass of ChoiceField for purity, but it doesn't
@@ -933,7 +995,8 @@ class ModelChoiceField(ChoiceField):
 
     def __init__(self, queryset, empty_label=u"---------", cache_choices=False,
                  required=True, widget=None, label=None, initial=None,
-                 help_text=None, to_field_name=None, *args, **kwargs):
+                 help_text=None, to_field_name=None, label_field=None,
+                 *args, **kwargs):
         if required and (initial is not None):
             self.empty_label = None
         else:
@@ -946,7 +1009,16 @@ class ModelChoiceField(ChoiceField):
                        *args, **kwargs)
         self.queryset = queryset
         self.choice_cache = None
+        self.shared_choice_cache = None
         self.to_field_name = to_field_name
+        self.label_field = label_field
+
+    def __deepcopy__(self, memo):
+        result = super(ModelChoiceField, self).__deepcopy__(memo)
+        # Give the copy's widget choices of its own, so that changes made to
+        # the copy (such as sharing a choice cache) take effect when rendering.
+        result.queryset = result.queryset
+        return result
 
     def _get_queryset(self):
         return self._queryset
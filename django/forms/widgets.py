@@ -12,7 +12,7 @@ from itertools import chain
 from django.conf import settings
 from django.utils.datastructures import MultiValueDict, MergeDict
 from django.utils.html import escape, conditional_escape
-from django.utils.translation import ugettext
+from django.utils.translation import ugettext, get_language
 from django.utils.encoding import StrAndUnicode, force_unicode
 from django.utils.safestring import mark_safe
 from django.utils import datetime_safe
@@ -389,6 +389,12 @@ class CheckboxInput(Widget):
         # same thing as False.
         return bool(initial) != bool(data)
 
+# Rendered <option> tags of Select widgets, keyed on the identity of the list
+# of choices (and the language) they were rendered from, so they're shared by
+# all widgets with the same list. See Select._rendered_options().
+_options_cache = {}
+_OPTIONS_CACHE_SIZE = 100
+
 class Select(Widget):
     def __init__(self, attrs=None, choices=()):
         super(Select, self).__init__(attrs)
@@ -408,24 +414,65 @@ class Select(Widget):
         return mark_safe(u'\n'.join(output))
 
     def render_options(self, choices, selected_choices):
-        def render_option(option_value, option_label):
-            option_value = force_unicode(option_value)
-            selected_html = (option_value in selected_choices) and u' selected="selected"' or ''
-            return u'<option value="%s"%s>%s</option>' % (
-                escape(option_value), selected_html,
-                conditional_escape(force_unicode(option_label)))
         # Normalize to strings.
         selected_choices = set([force_unicode(v) for v in selected_choices])
-        output = []
-        for option_value, option_label in chain(self.choices, choices):
+        if choices or not isinstance(self.choices, (list, tuple)):
+            output, options = self._render_option_tags(chain(self.choices, choices))
+        else:
+            output, options = self._rendered_options(self.choices)
+        # Only the selected options differ between renders.
+        if selected_choices:
+            output = output[:]
+            for value in selected_choices:
+                for index, start, end in options.get(value, ()):
+                    output[index] = u'%s selected="selected"%s' % (start, end)
+        return u'\n'.join(output)
+
+    def _rendered_options(self, choices):
+        """
+        Returns _render_option_tags() for the given list of choices, cached.
+
+        The cache is keyed on the identity of the list rather than on its
+        content, so that a hit costs nothing however long the list is. The
+        list must therefore not be modified in place, nor its labels change,
+        once it has been rendered; assign a new list to ``choices`` instead,
+        as ``ChoiceField.choices`` does. Other iterables of choices (such as
+        the ones of ``ModelChoiceField``) are rendered anew every time.
+        """
+        key = (id(choices), get_language())
+        cached = _options_cache.get(key)
+        # The list is kept in the cache, so its id can't be reused.
+        if cached is not None and cached[0] is choices:
+            return cached[1], cached[2]
+        output, options = self._render_option_tags(choices)
+        if len(_options_cache) >= _OPTIONS_CACHE_SIZE:
+            _options_cache.clear()
+        _options_cache[key] = (choices, output, options)
+        return output, options
+
+    def _render_option_tags(self, choices):
+        """
+        Returns a list of the unselected <option> (and <optgroup>) tags for the
+        given choices, and a dictionary mapping each option value to a list of
+        (index, start, end) tuples, where start and end are the parts of the
+        tag before and after its selected attribute.
+        """
+        output, options = [], {}
+        def render_option(option_value, option_label):
+            option_value = force_unicode(option_value)
+            start = u'<option value="%s"' % escape(option_value)
+            end = u'>%s</option>' % conditional_escape(force_unicode(option_label))
+            options.setdefault(option_value, []).append((len(output), start, end))
+            output.append(start + end)
+        for option_value, option_label in choices:
             if isinstance(option_label, (list, tuple)):
                 output.append(u'<optgroup label="%s">' % escape(force_unicode(option_value)))
                 for option in option_label:
-                    output.append(render_option(*option))
+                    render_option(*option)
                 output.append(u'</optgroup>')
             else:
-                output.append(render_option(option_value, option_label))
-        return u'\n'.join(output)
+                render_option(option_value, option_label)
+        return output, options
 
 class NullBooleanSelect(Select):
     """
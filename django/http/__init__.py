@@ -270,6 +270,10 @@ class HttpResponse(object):
     """A basic HTTP response, with content and dictionary-accessed headers."""
 
     status_code = 200
+    # Streaming responses (see FileResponse) shouldn't have their content read
+    # through ``content``, which would load the whole body into memory.
+    # Middleware checks this flag before touching the content.
+    streaming = False
 
     def __init__(self, content='', mimetype=None, status=None,
             content_type=None):
@@ -399,6 +403,142 @@ class HttpResponse(object):
             raise Exception("This %s instance cannot tell its position" % self.__class__)
         return sum([len(chunk) for chunk in self._container])
 
+range_re = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+class FileResponse(HttpResponse):
+    """
+    A response that streams a file (an open file object, or a path) in blocks
+    instead of loading it into memory.
+
+    Under WSGI servers that provide ``wsgi.file_wrapper`` the file is handed to
+    the server, which may send it with sendfile(). If ``request`` is given,
+    a single byte range requested with the Range header is sent with a 206
+    (Partial Content) response.
+    """
+    streaming = True
+    block_size = 8192
+
+    def __init__(self, file, mimetype=None, status=None, content_type=None,
+            request=None):
+        if isinstance(file, basestring):
+            file = open(file, 'rb')
+        if not (mimetype or content_type):
+            import mimetypes
+            content_type = mimetypes.guess_type(getattr(file, 'name', ''))[0] \
+                    or 'application/octet-stream'
+        HttpResponse.__init__(self, mimetype=mimetype, status=status,
+                content_type=content_type)
+        self._file = file
+        self._size = self._get_size(file)
+        self._offset, self._length = 0, self._size
+        if self._size is not None:
+            self['Content-Length'] = str(self._size)
+            self['Accept-Ranges'] = 'bytes'
+            if request is not None and self.status_code == 200:
+                self._apply_range(request.META.get('HTTP_RANGE'))
+
+    def _get_size(self, file):
+        try:
+            return os.fstat(file.fileno()).st_size
+        except (AttributeError, EnvironmentError, ValueError):
+            pass
+        try:
+            file.seek(0, 2)
+            size = file.tell()
+            file.seek(0)
+            return size
+        except (AttributeError, EnvironmentError):
+            # Not seekable: stream it without a Content-Length.
+            return None
+
+    def _apply_range(self, header):
+        """
+        Restricts the response to the byte range in the given Range header.
+        Only single ranges are supported; multiple ranges and malformed headers
+        are ignored, so the whole file is sent.
+        """
+        match = header and range_re.match(header.strip())
+        if not match or match.groups() == ('', ''):
+            return
+        first, last = match.groups()
+        if not first:
+            # A suffix range: the last N bytes.
+            first, last = max(self._size - int(last), 0), self._size - 1
+        elif not last:
+            first, last = int(first), self._size - 1
+        else:
+            first, last = int(first), int(last)
+            if last < first:
+                return
+            last = min(last, self._size - 1)
+        if first >= self._size:
+            self.status_code = 416
+            self['Content-Range'] = 'bytes */%d' % self._size
+            self['Content-Length'] = '0'
+            self._length = 0
+            return
+        self.status_code = 206
+        self['Content-Range'] = 'bytes %d-%d/%d' % (first, last, self._size)
+        self['Content-Length'] = str(last - first + 1)
+        self._offset, self._length = first, last - first + 1
+
+    def _read_blocks(self):
+        f = self._file
+        if self._offset:
+            f.seek(self._offset)
+        remaining = self._length
+        while remaining is None or remaining > 0:
+            size = self.block_size
+            if remaining is not None:
+                size = min(size, remaining)
+                remaining -= size
+            block = f.read(size)
+            if not block:
+                break
+            yield block
+
+    def file_to_stream(self):
+        """
+        Returns the file, positioned at the start of the content, if the
+        content runs up to the end of the file (so it can be handed to
+        ``wsgi.file_wrapper``). Otherwise returns None.
+        """
+        if self._file is None or self._size is None or self._length == 0 \
+                or self._offset + self._length != self._size:
+            return None
+        self._file.seek(self._offset)
+        return self._file
+
+    def _get_content(self):
+        if self._file is not None:
+            # Somebody insists on the whole body, so load it once and stop
+            # streaming.
+            content = ''.join(self._read_blocks())
+            self._file.close()
+            self._file = None
+            self.streaming = False
+            self._container = [content]
+            self._is_string = True
+        return HttpResponse._get_content(self)
+
+    def _set_content(self, value):
+        self.close()
+        self.streaming = False
+        HttpResponse._set_content(self, value)
+
+    content = property(_get_content, _set_content)
+
+    def __iter__(self):
+        if self._file is not None:
+            self._iterator = self._read_blocks()
+            return self
+        return HttpResponse.__iter__(self)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
 class HttpResponseRedirect(HttpResponse):
     status_code = 302
 
@@ -79,6 +79,9 @@ class UpdateCacheMiddleware(object):
             return response
         if not response.status_code == 200:
             return response
+        if response.streaming:
+            # Streamed content can't be stored in the cache.
+            return response
         # Try to get the timeout from the "max-age" section of the "Cache-
         # Control" header before reverting to using the default cache_timeout
         # length.
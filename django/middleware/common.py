@@ -5,7 +5,7 @@ from django import http
 from django.core.mail import mail_managers
 from django.utils.http import urlquote
 from django.core import urlresolvers
-from django.utils.hashcompat import md5_constructor
+from django.utils.cache import compute_etag
 
 class CommonMiddleware(object):
     """
@@ -96,12 +96,13 @@ class CommonMiddleware(object):
                                   % (referer, request.get_full_path(), ua, ip))
                 return response
 
-        # Use ETags, if requested.
-        if settings.USE_ETAGS:
+        # Use ETags, if requested. Streaming responses aren't read in full
+        # just to compute one.
+        if settings.USE_ETAGS and (response.has_header('ETag') or not response.streaming):
             if response.has_header('ETag'):
                 etag = response['ETag']
             else:
-                etag = '"%s"' % md5_constructor(response.content).hexdigest()
+                etag = compute_etag(response)
             if response.status_code >= 200 and response.status_code < 300 and request.META.get('HTTP_IF_NONE_MATCH') == etag:
                 cookies = response.cookies
                 response = http.HttpResponseNotModified()
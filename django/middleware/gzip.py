@@ -1,6 +1,8 @@
 import re
 
-from django.utils.text import compress_string
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.text import compress_sequence, compress_string
 from django.utils.cache import patch_vary_headers
 
 re_accepts_gzip = re.compile(r'\bgzip\b')
@@ -10,10 +12,24 @@ class GZipMiddleware(object):
     This middleware compresses content if the browser allows gzip compression.
     It sets the Vary header accordingly, so that caches will base their storage
     on the Accept-Encoding header.
+
+    Streaming responses (and responses built from an iterator) are compressed
+    incrementally as they are sent, rather than loaded into memory.
     """
     def process_response(self, request, response):
-        # It's not worth compressing non-OK or really short responses.
-        if response.status_code != 200 or len(response.content) < 200:
+        if response.status_code != 200:
+            return response
+
+        # Work out whether the response is too short to be worth compressing,
+        # without reading streaming or iterator content.
+        iterator = response.streaming or not response._is_string
+        if response.has_header('Content-Length'):
+            length = int(response['Content-Length'])
+        elif iterator:
+            length = None
+        else:
+            length = len(response.content)
+        if length is not None and length < settings.GZIP_MIN_LENGTH:
             return response
 
         patch_vary_headers(response, ('Accept-Encoding',))
@@ -22,9 +38,17 @@ class GZipMiddleware(object):
         if response.has_header('Content-Encoding'):
             return response
 
+        ctype = response.get('Content-Type', '').lower()
+        if settings.GZIP_CONTENT_TYPES is not None:
+            mimetype = ctype.split(';')[0].strip()
+            for allowed in settings.GZIP_CONTENT_TYPES:
+                if mimetype.startswith(allowed):
+                    break
+            else:
+                return response
+
         # MSIE have issues with gzipped respones of various content types.
         if "msie" in request.META.get('HTTP_USER_AGENT', '').lower():
-            ctype = response.get('Content-Type', '').lower()
             if not ctype.startswith("text/") or "javascript" in ctype:
                 return response
 
@@ -32,7 +56,34 @@ class GZipMiddleware(object):
         if not re_accepts_gzip.search(ae):
             return response
 
-        response.content = compress_string(response.content)
+        if iterator:
+            return self.compress_streaming(response)
+
+        response.content = compress_string(response.content,
+                settings.GZIP_COMPRESSION_LEVEL)
         response['Content-Encoding'] = 'gzip'
         response['Content-Length'] = str(len(response.content))
         return response
+
+    def compress_streaming(self, response):
+        """
+        Returns a new streaming response which gzips the content of the given
+        one as it is iterated over.
+        """
+        def chunks():
+            try:
+                for chunk in compress_sequence(response,
+                        settings.GZIP_COMPRESSION_LEVEL):
+                    yield chunk
+            finally:
+                response.close()
+        compressed = HttpResponse(chunks(), status=response.status_code)
+        compressed.streaming = True
+        for header, value in response.items():
+            compressed[header] = value
+        compressed.cookies = response.cookies
+        # The compressed length isn't known up front.
+        del compressed['Content-Length']
+        del compressed['Accept-Ranges']
+        compressed['Content-Encoding'] = 'gzip'
+        return compressed
@@ -11,7 +11,7 @@ class ConditionalGetMiddleware(object):
     """
     def process_response(self, request, response):
         response['Date'] = http_date()
-        if not response.has_header('Content-Length'):
+        if not response.has_header('Content-Length') and not response.streaming:
             response['Content-Length'] = str(len(response.content))
 
         if response.has_header('ETag'):
@@ -1,9 +1,13 @@
+import os
+import sys
+import time
 import unittest
 from django.conf import settings
+from django.db import reset_queries
 from django.db.models import get_app, get_apps
 from django.test import _doctest as doctest
-from django.test.utils import setup_test_environment, teardown_test_environment
-from django.test.testcases import OutputChecker, DocTestRunner, TestCase
+from django.test.utils import setup_test_environment, teardown_test_environment, QueryCounter
+from django.test.testcases import OutputChecker, DocTestRunner, TestCase, committed_fixtures
 
 # The module name for tests outside models.py
 TEST_MODULE = 'tests'
@@ -142,11 +146,248 @@ def reorder_suite(suite, classes):
     class_count = len(classes)
     bins = [unittest.TestSuite() for i in range(class_count+1)]
     partition_suite(suite, classes, bins)
+    if TestCase in classes:
+        bins[list(classes).index(TestCase)].addTest(FixtureCleanup())
     for i in range(class_count):
         bins[0].addTests(bins[i+1])
     return bins[0]
 
-def run_tests(test_labels, verbosity=1, interactive=True, extra_tests=[]):
+class FixtureCleanup(object):
+    """
+    Placed in the test suite after the TestCases, so that the fixtures they
+    left committed aren't seen by the tests that follow.
+    """
+    def __call__(self, result):
+        committed_fixtures.clear()
+
+    def countTestCases(self):
+        return 0
+
+class ProfilingTestResult(unittest._TextTestResult):
+    """
+    A test result that also records the time each test took, and the number
+    and total time of the database queries it ran, in profiles.
+    """
+    def __init__(self, *args, **kwargs):
+        unittest._TextTestResult.__init__(self, *args, **kwargs)
+        self.profiles = []
+
+    def startTest(self, test):
+        unittest._TextTestResult.startTest(self, test)
+        reset_queries()
+        self.query_counter = QueryCounter()
+        self.query_counter.start()
+        self.start_time = time.time()
+
+    def stopTest(self, test):
+        time_taken = time.time() - self.start_time
+        self.query_counter.stop()
+        self.profiles.append((str(test), time_taken, self.query_counter.count(),
+                              self.query_counter.time()))
+        unittest._TextTestResult.stopTest(self, test)
+
+class ProfilingTestRunner(unittest.TextTestRunner):
+    def _makeResult(self):
+        return ProfilingTestResult(self.stream, self.descriptions, self.verbosity)
+
+def get_runner_class(profile):
+    if profile:
+        return ProfilingTestRunner
+    return unittest.TextTestRunner
+
+def print_profiles(profiles, count, stream=None):
+    """
+    Prints the count slowest tests and the count tests that ran the most
+    queries.
+    """
+    if stream is None:
+        stream = sys.stderr
+    slowest = profiles[:]
+    slowest.sort(lambda a, b: cmp(b[1], a[1]))
+    stream.write("\nSlowest tests:\n")
+    for name, time_taken, queries, query_time in slowest[:count]:
+        stream.write("%9.3fs  %s\n" % (time_taken, name))
+    heaviest = profiles[:]
+    heaviest.sort(lambda a, b: cmp(b[2], a[2]) or cmp(b[3], a[3]))
+    stream.write("\nTests running the most queries:\n")
+    for name, time_taken, queries, query_time in heaviest[:count]:
+        stream.write("%6d queries (%.3fs)  %s\n" % (queries, query_time, name))
+
+def write_profile_report(profiles, filename):
+    "Writes the profiles of the tests to a file, as JSON."
+    from django.utils import simplejson
+    report = [{'test': name, 'time': time_taken, 'queries': queries,
+               'query_time': query_time}
+              for name, time_taken, queries, query_time in profiles]
+    f = open(filename, 'w')
+    try:
+        simplejson.dump(report, f, indent=2)
+    finally:
+        f.close()
+
+def split_suite(suite, count):
+    """
+    Splits a test suite into count suites with about the same number of
+    tests, each ordered by reorder_suite.
+
+    The tests of a module stay together, since they may share fixtures or
+    files outside the test database.
+    """
+    tests = unittest.TestSuite()
+    partition_suite(suite, (), [tests])
+    groups = []
+    last_key = None
+    for test in tests:
+        key = test.__class__.__module__
+        if isinstance(test, doctest.DocTestCase):
+            # Doctests share a class but have nothing else in common.
+            key = test
+        if not groups or key != last_key:
+            groups.append([])
+        groups[-1].append(test)
+        last_key = key
+
+    # Hand the largest groups out first, each to the least loaded part,
+    # then put the groups of every part back in their original order.
+    parts = [[] for i in range(count)]
+    sizes = [0] * count
+    order = range(len(groups))
+    order.sort(lambda a, b: cmp(len(groups[b]), len(groups[a])))
+    for index in order:
+        smallest = sizes.index(min(sizes))
+        parts[smallest].append(index)
+        sizes[smallest] += len(groups[index])
+
+    suites = []
+    for part in parts:
+        if not part:
+            continue
+        part.sort()
+        part_suite = unittest.TestSuite()
+        for index in part:
+            part_suite.addTests(groups[index])
+        suites.append(reorder_suite(part_suite, (TestCase,)))
+    return suites
+
+class RemoteTest(object):
+    """
+    Stands for a test that was run by a worker process, so that its failure
+    can be reported by the main one.
+    """
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+
+    def __str__(self):
+        return self.name
+
+    def shortDescription(self):
+        return self.description
+
+def run_worker(suite, number, verbosity, keepdb, profile, keep_fixtures=False):
+    """
+    Runs a part of a parallel test run against a test database of its own.
+    Returns the number of tests run, the failures and errors, with the tests
+    described by strings, and the profiles of the tests if profile is True.
+    """
+    from django.db import connection
+    old_name = settings.DATABASE_NAME
+    connection.creation.set_test_db_suffix('_%d' % number)
+    # Several processes can't prompt at once, so old worker databases are
+    # replaced without asking.
+    connection.creation.create_test_db(max(verbosity - 1, 0), autoclobber=True,
+                                       keepdb=keepdb)
+    if keep_fixtures and settings.DATABASE_SUPPORTS_TRANSACTIONS:
+        committed_fixtures.enable()
+    result = get_runner_class(profile)(verbosity=verbosity)._makeResult()
+    suite.run(result)
+    committed_fixtures.disable()
+    connection.creation.destroy_test_db(old_name, max(verbosity - 1, 0), keepdb=keepdb)
+
+    def describe(failures):
+        return [(str(test), test.shortDescription(), err) for test, err in failures]
+    return (result.testsRun, describe(result.failures), describe(result.errors),
+            getattr(result, 'profiles', []))
+
+def run_suite_parallel(suite, parallel, verbosity, keepdb, profile, keep_fixtures=False):
+    """
+    Runs a test suite in parallel worker processes, and reports their merged
+    results the way unittest.TextTestRunner does. Returns the merged result.
+    """
+    import cPickle as pickle
+    from django.db import connection
+
+    suites = split_suite(suite, parallel)
+    if verbosity >= 1:
+        print "Running tests in %d processes..." % len(suites)
+    start = time.time()
+    # The workers must neither share the connection nor repeat the output
+    # that is still buffered.
+    connection.close()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    workers = []
+    for number, worker_suite in enumerate(suites):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                try:
+                    data = run_worker(worker_suite, number + 1, verbosity, keepdb, profile,
+                                      keep_fixtures)
+                except:
+                    import traceback
+                    data = (0, [], [('worker %d' % (number + 1), None,
+                                     ''.join(traceback.format_exception(*sys.exc_info())))], [])
+                pipe = os.fdopen(write_fd, 'wb')
+                pickle.dump(data, pipe, pickle.HIGHEST_PROTOCOL)
+                pipe.close()
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(0)
+        os.close(write_fd)
+        workers.append((number + 1, pid, read_fd))
+
+    result = get_runner_class(profile)(verbosity=verbosity)._makeResult()
+    for number, pid, read_fd in workers:
+        pipe = os.fdopen(read_fd, 'rb')
+        try:
+            tests_run, failures, errors, profiles = pickle.load(pipe)
+        except (EOFError, pickle.UnpicklingError):
+            tests_run, failures, errors, profiles = 0, [], [('worker %d' % number, None,
+                                                             'The worker process died.\n')], []
+        pipe.close()
+        os.waitpid(pid, 0)
+        result.testsRun += tests_run
+        for name, description, err in failures:
+            result.failures.append((RemoteTest(name, description), err))
+        for name, description, err in errors:
+            result.errors.append((RemoteTest(name, description), err))
+        if profile:
+            result.profiles.extend(profiles)
+    time_taken = time.time() - start
+
+    result.printErrors()
+    result.stream.writeln(result.separator2)
+    run = result.testsRun
+    result.stream.writeln("Ran %d test%s in %.3fs" % (run, run != 1 and "s" or "", time_taken))
+    result.stream.writeln()
+    if result.wasSuccessful():
+        result.stream.writeln("OK")
+    else:
+        counts = []
+        if result.failures:
+            counts.append("failures=%d" % len(result.failures))
+        if result.errors:
+            counts.append("errors=%d" % len(result.errors))
+        result.stream.writeln("FAILED (%s)" % ", ".join(counts))
+    return result
+
+def run_tests(test_labels, verbosity=1, interactive=True, extra_tests=[], keepdb=False,
+              parallel=1, profile=0, profile_report=None, keep_fixtures=False):
     """
     Run the unit tests for all the test labels in the provided list.
     Labels must be of the form:
@@ -163,6 +404,25 @@ def run_tests(test_labels, verbosity=1, interactive=True, extra_tests=[]):
     A list of 'extra' tests may also be provided; these tests
     will be added to the test suite.
 
+    If keepdb is True, the test database is kept after the run and
+    reused by the next one, as long as the models haven't changed.
+
+    If parallel is greater than 1, the tests are split between that many
+    processes, each with a test database of its own. This needs os.fork(),
+    so the tests run in a single process where it isn't available.
+
+    If profile is given, the time and database queries of every test are
+    recorded, and the profile slowest tests and the profile tests running
+    the most queries are listed at the end. If profile_report is given, the
+    profiles of all the tests are written to that file, as JSON.
+
+    If keep_fixtures is True (and the database supports transactions), the
+    fixtures of a TestCase are committed once and kept for the following
+    TestCases using the same fixtures, instead of being loaded for every
+    test. Data tests commit outside of their fixtures, e.g. from signal
+    handlers, is then seen by the tests that follow until other fixtures
+    are loaded.
+
     Returns the number of tests that failed.
     """
     setup_test_environment()
@@ -184,13 +444,27 @@ def run_tests(test_labels, verbosity=1, interactive=True, extra_tests=[]):
     for test in extra_tests:
         suite.addTest(test)
 
-    suite = reorder_suite(suite, (TestCase,))
+    profiling = bool(profile or profile_report)
+    if parallel > 1 and hasattr(os, 'fork'):
+        result = run_suite_parallel(suite, parallel, verbosity, keepdb, profiling,
+                                    keep_fixtures)
+    else:
+        suite = reorder_suite(suite, (TestCase,))
+
+        old_name = settings.DATABASE_NAME
+        from django.db import connection
+        connection.creation.create_test_db(verbosity, autoclobber=not interactive,
+                                           keepdb=keepdb)
+        if keep_fixtures and settings.DATABASE_SUPPORTS_TRANSACTIONS:
+            committed_fixtures.enable()
+        result = get_runner_class(profiling)(verbosity=verbosity).run(suite)
+        committed_fixtures.disable()
+        connection.creation.destroy_test_db(old_name, verbosity, keepdb=keepdb)
 
-    old_name = settings.DATABASE_NAME
-    from django.db import connection
-    connection.creation.create_test_db(verbosity, autoclobber=not interactive)
-    result = unittest.TextTestRunner(verbosity=verbosity).run(suite)
-    connection.creation.destroy_test_db(old_name, verbosity)
+    if profile:
+        print_profiles(result.profiles, profile)
+    if profile_report:
+        write_profile_report(result.profiles, profile_report)
 
     teardown_test_environment()
 
@@ -1,4 +1,6 @@
+import datetime
 import re
+import sys
 import unittest
 from urlparse import urlsplit, urlunsplit
 from xml.dom.minidom import parseString, Node
@@ -11,6 +13,7 @@ from django.db import transaction, connection
 from django.http import QueryDict
 from django.test import _doctest as doctest
 from django.test.client import Client
+from django.test.utils import QueryCounter
 from django.utils import simplejson
 from django.utils.encoding import smart_str
 
@@ -203,6 +206,125 @@ class DocTestRunner(doctest.DocTestRunner):
         # side effects on other tests.
         transaction.rollback_unless_managed()
 
+class CommittedFixtures(object):
+    """
+    Keeps track of the fixtures committed to the test database.
+
+    While enabled (the test runner does that once the test database is set
+    up, when asked to keep fixtures), a TestCase loads its fixtures for good
+    rather than inside each test's transaction. The following tests using the
+    same fixtures then start right away from that state, since every test is
+    rolled back to it.
+
+    To switch to other fixtures, the database is restored from a snapshot
+    taken when it was enabled, which is much quicker than a flush.
+    """
+    def __init__(self):
+        self.enabled = False
+        # The fixtures in the database; None if its content is unknown.
+        self.fixtures = ()
+        self.snapshot = {}
+
+    def enable(self):
+        """
+        Takes the snapshot of the database, whose content must be the one
+        syncdb left.
+        """
+        qn = connection.ops.quote_name
+        cursor = connection.cursor()
+        self.snapshot = {}
+        for table in connection.introspection.table_names():
+            cursor.execute("SELECT * FROM %s" % qn(table))
+            self.snapshot[table] = cursor.fetchall()
+        self.enabled = True
+        self.fixtures = ()
+
+    def disable(self):
+        self.enabled = False
+        self.snapshot = {}
+
+    def load(self, fixtures):
+        fixtures = tuple(fixtures)
+        if fixtures == self.fixtures:
+            return
+        self.clear()
+        if fixtures:
+            call_command('loaddata', *fixtures, **{'verbosity': 0, 'cache': True})
+            self.fixtures = fixtures
+
+    def clear(self):
+        """
+        Removes the committed fixtures, so the database is left the way
+        syncdb created it.
+
+        All the tables are emptied with the backend's flush SQL, which copes
+        with foreign keys, then the snapshot is inserted back, referenced rows
+        first, and the sequences are reset.
+        """
+        if self.fixtures == ():
+            return
+        from django.core.management.color import no_style
+        from django.db.models import get_models
+        style = no_style()
+        qn = connection.ops.quote_name
+        cursor = connection.cursor()
+        for sql in connection.ops.sql_flush(style, connection.introspection.table_names(),
+                                            connection.introspection.sequence_list()):
+            cursor.execute(sql)
+        for table in self._insertion_order(self.snapshot.keys()):
+            rows = self.snapshot[table]
+            if rows:
+                cursor.executemany("INSERT INTO %s VALUES (%s)" % (qn(table),
+                                   ', '.join(['%s'] * len(rows[0]))),
+                                   [map(self._db_value, row) for row in rows])
+        for sql in connection.ops.sequence_reset_sql(style, get_models()):
+            cursor.execute(sql)
+        transaction.commit_unless_managed()
+        self.fixtures = ()
+
+    def _db_value(self, value):
+        """
+        Turns a value read by the backend back into one it can write.
+        """
+        if isinstance(value, datetime.datetime):
+            return connection.ops.value_to_db_datetime(value)
+        if isinstance(value, datetime.date):
+            return connection.ops.value_to_db_date(value)
+        if isinstance(value, datetime.time):
+            return connection.ops.value_to_db_time(value)
+        return value
+
+    def _insertion_order(self, tables):
+        """
+        Returns the given tables sorted so that the tables foreign keys refer
+        to come before the tables holding them.
+        """
+        from django.db.models import get_models
+        references = {}
+        for model in get_models():
+            opts = model._meta
+            references.setdefault(opts.db_table, set()).update(
+                [f.rel.to._meta.db_table for f in opts.local_fields if f.rel])
+            for field in opts.local_many_to_many:
+                if field.creates_table:
+                    references[field.m2m_db_table()] = set([opts.db_table,
+                                                            field.rel.to._meta.db_table])
+        ordered = []
+        seen = set()
+        def visit(table):
+            if table in seen:
+                return
+            seen.add(table)
+            for referenced in references.get(table, ()):
+                visit(referenced)
+            if table in tables:
+                ordered.append(table)
+        for table in sorted(tables):
+            visit(table)
+        return ordered
+
+committed_fixtures = CommittedFixtures()
+
 class TransactionTestCase(unittest.TestCase):
     def _pre_setup(self):
         """Performs any pre-test setup. This includes:
@@ -219,11 +341,13 @@ class TransactionTestCase(unittest.TestCase):
         mail.outbox = []
 
     def _fixture_setup(self):
+        # Whatever this test commits is left in the database.
+        committed_fixtures.fixtures = None
         call_command('flush', verbosity=0, interactive=False)
         if hasattr(self, 'fixtures'):
             # We have to use this slightly awkward syntax due to the fact
             # that we're using *args and **kwargs together.
-            call_command('loaddata', *self.fixtures, **{'verbosity': 0})
+            call_command('loaddata', *self.fixtures, **{'verbosity': 0, 'cache': True})
 
     def _urlconf_setup(self):
         if hasattr(self, 'urls'):
@@ -427,6 +551,45 @@ class TransactionTestCase(unittest.TestCase):
             (u"Template '%s' was used unexpectedly in rendering the"
              u" response") % template_name)
 
+    def assertNumQueries(self, num, func=None, *args, **kwargs):
+        """
+        Asserts that calling func with the given arguments runs num database
+        queries. If func isn't given, returns a context manager asserting the
+        same of the block it wraps::
+
+            with self.assertNumQueries(2):
+                Person.objects.create(name='Ann')
+                Person.objects.count()
+        """
+        context = _AssertNumQueriesContext(self, num)
+        if func is None:
+            return context
+        context.__enter__()
+        try:
+            func(*args, **kwargs)
+        except:
+            context.__exit__(*sys.exc_info())
+            raise
+        context.__exit__(None, None, None)
+
+class _AssertNumQueriesContext(object):
+    def __init__(self, test_case, num):
+        self.test_case = test_case
+        self.num = num
+
+    def __enter__(self):
+        self.counter = QueryCounter()
+        self.counter.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.counter.stop()
+        if exc_type is not None:
+            return
+        executed = self.counter.count()
+        self.test_case.assertEqual(executed, self.num,
+            "%d queries executed, %d expected" % (executed, self.num))
+
 class TestCase(TransactionTestCase):
     """
     Does basically the same as TransactionTestCase, but surrounds every test
@@ -439,6 +602,9 @@ class TestCase(TransactionTestCase):
         if not settings.DATABASE_SUPPORTS_TRANSACTIONS:
             return super(TestCase, self)._fixture_setup()
 
+        if committed_fixtures.enabled:
+            committed_fixtures.load(getattr(self, 'fixtures', ()))
+
         transaction.enter_transaction_management()
         transaction.managed(True)
         disable_transaction_methods()
@@ -446,10 +612,11 @@ class TestCase(TransactionTestCase):
         from django.contrib.sites.models import Site
         Site.objects.clear_cache()
 
-        if hasattr(self, 'fixtures'):
+        if hasattr(self, 'fixtures') and not committed_fixtures.enabled:
             call_command('loaddata', *self.fixtures, **{
                                                         'verbosity': 0,
-                                                        'commit': False
+                                                        'commit': False,
+                                                        'cache': True
                                                         })
 
     def _fixture_teardown(self):
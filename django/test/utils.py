@@ -1,6 +1,7 @@
 import sys, time, os
 from django.conf import settings
-from django.db import connection
+from django.db import connection, reset_queries
+from django.core.signals import request_started
 from django.core import mail
 from django.test import signals
 from django.template import Template
@@ -47,6 +48,46 @@ class TestSMTPConnection(object):
         mail.outbox.extend(messages)
         return len(messages)
 
+class QueryCounter(object):
+    """
+    Counts the queries run through the database connection between start()
+    and stop(), and adds up the time they took.
+
+    The queries are recorded in connection.queries whatever the DEBUG
+    setting, and requests made in the meantime (for instance through the
+    test client) don't reset it.
+    """
+    # The number of counters started and not stopped yet.
+    active = 0
+
+    def __init__(self):
+        self.queries = []
+        self.queries_time = 0.0
+
+    def start(self):
+        if QueryCounter.active == 0:
+            request_started.disconnect(reset_queries)
+        QueryCounter.active += 1
+        self.old_use_debug_cursor = connection.use_debug_cursor
+        connection.use_debug_cursor = True
+        self.start_index = len(connection.queries)
+        self.start_time = connection.queries_time
+
+    def stop(self):
+        self.queries = connection.queries[self.start_index:]
+        self.queries_time = connection.queries_time - self.start_time
+        connection.use_debug_cursor = self.old_use_debug_cursor
+        QueryCounter.active -= 1
+        if QueryCounter.active == 0:
+            request_started.connect(reset_queries)
+
+    def count(self):
+        return len(self.queries)
+
+    def time(self):
+        "Returns the total time of the queries, in seconds."
+        return self.queries_time
+
 def setup_test_environment():
     """Perform any global pre-test setup. This involves:
 
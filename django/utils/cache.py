@@ -90,6 +90,24 @@ def get_max_age(response):
         except (ValueError, TypeError):
             pass
 
+def compute_etag(response):
+    """
+    Returns a quoted ETag for the given HttpResponse, computed from the MD5
+    hash of its content.
+
+    The content is hashed chunk by chunk, so it's never joined into a single
+    string. Content coming from an iterator is consumed once and the chunks
+    are kept on the response, so it can still be sent afterwards.
+    """
+    hasher = md5_constructor()
+    chunks = []
+    for chunk in response:
+        hasher.update(chunk)
+        chunks.append(chunk)
+    if not response._is_string:
+        response._container = chunks
+    return '"%s"' % hasher.hexdigest()
+
 def patch_response_headers(response, cache_timeout=None):
     """
     Adds some useful headers to the given HttpResponse object:
@@ -104,8 +122,8 @@ def patch_response_headers(response, cache_timeout=None):
         cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
     if cache_timeout < 0:
         cache_timeout = 0 # Can't have max-age negative
-    if not response.has_header('ETag'):
-        response['ETag'] = '"%s"' % md5_constructor(response.content).hexdigest()
+    if not response.has_header('ETag') and not response.streaming:
+        response['ETag'] = compute_etag(response)
     if not response.has_header('Last-Modified'):
         response['Last-Modified'] = http_date()
     if not response.has_header('Expires'):
@@ -3,14 +3,21 @@ The md5 and sha modules are deprecated since Python 2.5, replaced by the
 hashlib module containing both hash algorithms. Here, we provide a common
 interface to the md5 and sha constructors, preferring the hashlib module when
 available.
+
+The ``*_hmac`` names are suitable for passing as the ``digestmod`` argument
+of ``hmac.new()``.
 """
 
 try:
     import hashlib
     md5_constructor = hashlib.md5
+    md5_hmac = md5_constructor
     sha_constructor = hashlib.sha1
+    sha_hmac = sha_constructor
 except ImportError:
     import md5
     md5_constructor = md5.new
+    md5_hmac = md5
     import sha
     sha_constructor = sha.new
+    sha_hmac = sha
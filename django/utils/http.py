@@ -1,6 +1,6 @@
 import re
 import urllib
-from email.Utils import formatdate
+from email.Utils import formatdate, parsedate_tz, mktime_tz
 
 from django.utils.encoding import smart_str, force_unicode
 from django.utils.functional import allow_lazy
@@ -69,6 +69,21 @@ def http_date(epoch_seconds=None):
     rfcdate = formatdate(epoch_seconds)
     return '%s GMT' % rfcdate[:25]
 
+def parse_http_date(date):
+    """
+    Parses a date in any of the formats allowed by HTTP RFC2616 section 3.3.1
+    (such as an If-Modified-Since header) and returns it as an integer number
+    of seconds since the epoch, in UTC, or None if it can't be parsed.
+    """
+    # Some browsers append "; length=..." to If-Modified-Since.
+    parsed = parsedate_tz(date.split(';')[0].strip())
+    if parsed is None:
+        return None
+    try:
+        return int(mktime_tz(parsed))
+    except (OverflowError, ValueError):
+        return None
+
 # Base 36 functions: useful for generating compact URLs
 
 def base36_to_int(s):
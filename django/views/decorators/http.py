@@ -9,10 +9,9 @@ except ImportError:
 
 from calendar import timegm
 from datetime import timedelta
-from email.Utils import formatdate
 
 from django.utils.decorators import decorator_from_middleware
-from django.utils.http import parse_etags, quote_etag
+from django.utils.http import http_date, parse_etags, parse_http_date, quote_etag
 from django.middleware.http import ConditionalGetMiddleware
 from django.http import HttpResponseNotAllowed, HttpResponseNotModified, HttpResponse
 
@@ -65,11 +64,17 @@ def condition(etag_func=None, last_modified_func=None):
     Any behavior marked as "undefined" in the HTTP spec (e.g. If-none-match
     plus If-modified-since headers) will result in the view function being
     called.
+
+    Both callables are called before the view, so they should be cheap (e.g.
+    a single aggregate query); when the resource hasn't changed the view
+    itself never runs.
     """
     def decorator(func):
         def inner(request, *args, **kwargs):
             # Get HTTP request headers
             if_modified_since = request.META.get("HTTP_IF_MODIFIED_SINCE")
+            if if_modified_since:
+                if_modified_since = parse_http_date(if_modified_since)
             if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
             if_match = request.META.get("HTTP_IF_MATCH")
             if if_none_match or if_match:
@@ -90,14 +95,11 @@ def condition(etag_func=None, last_modified_func=None):
                 res_etag = etag_func(request, *args, **kwargs)
             else:
                 res_etag = None
+            res_last_modified = None
             if last_modified_func:
                 dt = last_modified_func(request, *args, **kwargs)
                 if dt:
-                    res_last_modified = formatdate(timegm(dt.utctimetuple()))[:26] + 'GMT'
-                else:
-                    res_last_modified = None
-            else:
-                res_last_modified = None
+                    res_last_modified = timegm(dt.utctimetuple())
 
             response = None
             if not ((if_match and (if_modified_since or if_none_match)) or
@@ -107,7 +109,8 @@ def condition(etag_func=None, last_modified_func=None):
                 if ((if_none_match and (res_etag in etags or
                         "*" in etags and res_etag)) and
                         (not if_modified_since or
-                            res_last_modified == if_modified_since)):
+                            (res_last_modified and
+                             res_last_modified <= if_modified_since))):
                     if request.method in ("GET", "HEAD"):
                         response = HttpResponseNotModified()
                     else:
@@ -116,8 +119,9 @@ def condition(etag_func=None, last_modified_func=None):
                         (res_etag and res_etag not in etags)):
                     response = HttpResponse(status=412)
                 elif (not if_none_match and if_modified_since and
-                        request.method == "GET" and
-                        res_last_modified == if_modified_since):
+                        request.method in ("GET", "HEAD") and
+                        res_last_modified and
+                        res_last_modified <= if_modified_since):
                     response = HttpResponseNotModified()
 
             if response is None:
@@ -125,13 +129,13 @@ def condition(etag_func=None, last_modified_func=None):
 
             # Set relevant headers on the response if they don't already exist.
             if res_last_modified and not response.has_header('Last-Modified'):
-                response['Last-Modified'] = res_last_modified
+                response['Last-Modified'] = http_date(res_last_modified)
             if res_etag and not response.has_header('ETag'):
                 response['ETag'] = quote_etag(res_etag)
 
             return response
 
-        return inner
+        return wraps(func)(inner)
     return decorator
 
 # Shortcut decorators for common cases based on ETag or Last-Modified only
@@ -8,15 +8,43 @@ import os
 import posixpath
 import re
 import stat
+import time
 import urllib
 from email.Utils import parsedate_tz, mktime_tz
 
+from django.conf import settings
 from django.template import loader
-from django.http import Http404, HttpResponse, HttpResponseRedirect, HttpResponseNotModified
+from django.http import Http404, HttpResponse, HttpResponseRedirect, HttpResponseNotModified, FileResponse
 from django.template import Template, Context, TemplateDoesNotExist
+from django.utils.cache import patch_response_headers
 from django.utils.http import http_date
 
-def serve(request, path, document_root=None, show_indexes=False):
+# Maps full paths to (time of the stat() call, stat result, mimetype).
+_file_info_cache = {}
+_FILE_INFO_CACHE_SIZE = 256
+
+def _file_info(fullpath):
+    """
+    Returns the stat result and mimetype of the given path, raising OSError if
+    it doesn't exist. Mimetypes are cached, and stat results are reused for
+    settings.STATIC_SERVE_STAT_CACHE_TIMEOUT seconds.
+    """
+    now = time.time()
+    entry = _file_info_cache.get(fullpath)
+    if entry is not None and now - entry[0] < settings.STATIC_SERVE_STAT_CACHE_TIMEOUT:
+        return entry[1], entry[2]
+    statobj = os.stat(fullpath)
+    if entry is not None:
+        mimetype = entry[2]
+    else:
+        mimetype = mimetypes.guess_type(fullpath)[0] or 'application/octet-stream'
+        if len(_file_info_cache) >= _FILE_INFO_CACHE_SIZE:
+            _file_info_cache.clear()
+    _file_info_cache[fullpath] = (now, statobj, mimetype)
+    return statobj, mimetype
+
+def serve(request, path, document_root=None, show_indexes=False,
+          cache_timeout=None):
     """
     Serve static files below a given point in the directory structure.
 
@@ -29,6 +57,13 @@ def serve(request, path, document_root=None, show_indexes=False):
     of the directory.  This index view will use the template hardcoded below,
     but if you'd like to override it, you can create a template called
     ``static/directory_index.html``.
+
+    Files are streamed in blocks (or handed to the server's
+    ``wsgi.file_wrapper``), and single byte ranges are supported. If
+    ``settings.STATIC_SERVE_SENDFILE_HEADER`` is set, only the file's path is
+    sent, in that header, for the Web server to serve. If ``cache_timeout``
+    is given, Expires and Cache-Control headers are added telling clients to
+    cache the file for that many seconds.
     """
 
     # Clean up given path to only allow serving files below document_root.
@@ -48,22 +83,27 @@ def serve(request, path, document_root=None, show_indexes=False):
     if newpath and path != newpath:
         return HttpResponseRedirect(newpath)
     fullpath = os.path.join(document_root, newpath)
-    if os.path.isdir(fullpath):
+    try:
+        statobj, mimetype = _file_info(fullpath)
+    except OSError:
+        raise Http404, '"%s" does not exist' % fullpath
+    if stat.S_ISDIR(statobj[stat.ST_MODE]):
         if show_indexes:
             return directory_index(newpath, fullpath)
         raise Http404, "Directory indexes are not allowed here."
-    if not os.path.exists(fullpath):
-        raise Http404, '"%s" does not exist' % fullpath
     # Respect the If-Modified-Since header.
-    statobj = os.stat(fullpath)
     if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'),
                               statobj[stat.ST_MTIME], statobj[stat.ST_SIZE]):
         return HttpResponseNotModified()
-    mimetype = mimetypes.guess_type(fullpath)[0] or 'application/octet-stream'
-    contents = open(fullpath, 'rb').read()
-    response = HttpResponse(contents, mimetype=mimetype)
+    if settings.STATIC_SERVE_SENDFILE_HEADER:
+        response = HttpResponse(mimetype=mimetype)
+        response[settings.STATIC_SERVE_SENDFILE_HEADER] = fullpath
+    else:
+        response = FileResponse(fullpath, mimetype=mimetype, request=request)
     response["Last-Modified"] = http_date(statobj[stat.ST_MTIME])
-    response["Content-Length"] = len(contents)
+    response["ETag"] = '"%x-%x"' % (statobj[stat.ST_MTIME], statobj[stat.ST_SIZE])
+    if cache_timeout is not None:
+        patch_response_headers(response, cache_timeout)
     return response
 
 DEFAULT_DIRECTORY_INDEX_TEMPLATE = """
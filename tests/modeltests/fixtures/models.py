@@ -80,6 +80,44 @@ __test__ = {'API_TESTS': """
 >>> management.call_command('dumpdata', 'fixtures.Category', 'sites', format='json')
 [{"pk": 1, "model": "fixtures.category", "fields": {"description": "Latest news stories", "title": "News Stories"}}, {"pk": 1, "model": "sites.site", "fields": {"domain": "example.com", "name": "example.com"}}]
 
+# With a batch size, the objects of each model are fetched in primary key order
+>>> management.call_command('dumpdata', 'fixtures.Article', format='json', batch_size=2)
+[{"pk": 1, "model": "fixtures.article", "fields": {"headline": "Python program becomes self aware", "pub_date": "2006-06-16 11:00:00"}}, {"pk": 2, "model": "fixtures.article", "fields": {"headline": "Poker has no place on ESPN", "pub_date": "2006-06-16 12:00:00"}}, {"pk": 3, "model": "fixtures.article", "fields": {"headline": "Time to reform copyright", "pub_date": "2006-06-16 13:00:00"}}]
+
+# The output is the same as serializing the whole list at once
+>>> from django.core.serializers.json import DjangoJSONEncoder
+>>> from django.utils import simplejson
+>>> import sys
+>>> from StringIO import StringIO
+>>> old_stdout, sys.stdout = sys.stdout, StringIO()
+>>> management.call_command('dumpdata', 'fixtures.Article', format='json', indent=2)
+>>> output, sys.stdout = sys.stdout.getvalue(), old_stdout
+>>> from django.core import serializers
+>>> objects = serializers.serialize('python', Article.objects.all())
+>>> output.rstrip() == simplejson.dumps(objects, indent=2, cls=DjangoJSONEncoder)
+True
+
+# Dump to a compressed file, which loaddata can read back
+>>> import gzip, os, shutil, tempfile
+>>> tmp_dir = tempfile.mkdtemp()
+>>> management.call_command('dumpdata', 'fixtures.Category', format='json', output=os.path.join(tmp_dir, 'dump.json.gz'))
+>>> gzip.GzipFile(os.path.join(tmp_dir, 'dump.json.gz')).read()
+'[{"pk": 1, "model": "fixtures.category", "fields": {"description": "Latest news stories", "title": "News Stories"}}]'
+>>> Category.objects.all().delete()
+>>> management.call_command('loaddata', os.path.join(tmp_dir, 'dump.json.gz'), verbosity=0)
+>>> Category.objects.all()
+[<Category: News Stories>]
+
+# Objects can be loaded in batches, both new and existing ones
+>>> management.call_command('dumpdata', 'fixtures', format='json', output=os.path.join(tmp_dir, 'batch.json'))
+>>> Article.objects.filter(pk=1).update(headline='Changed')
+1
+>>> Article.objects.filter(pk=2).delete()
+>>> management.call_command('loaddata', os.path.join(tmp_dir, 'batch.json'), verbosity=0, batch_size=2)
+>>> Article.objects.all()
+[<Article: Time to reform copyright>, <Article: Poker has no place on ESPN>, <Article: Python program becomes self aware>]
+>>> shutil.rmtree(tmp_dir)
+
 # Load fixture 2. JSON file imported by default. Overwrites some existing objects
 >>> management.call_command('loaddata', 'fixture2.json', verbosity=0)
 >>> Article.objects.all()
@@ -0,0 +1,165 @@
+"""
+Testing signals emitted on changing m2m relations.
+"""
+
+from django.db import models
+
+class Part(models.Model):
+    name = models.CharField(max_length=20)
+
+    class Meta:
+        ordering = ('name',)
+
+    def __unicode__(self):
+        return self.name
+
+class Car(models.Model):
+    name = models.CharField(max_length=20)
+    default_parts = models.ManyToManyField(Part)
+
+    class Meta:
+        ordering = ('name',)
+
+    def __unicode__(self):
+        return self.name
+
+class Person(models.Model):
+    name = models.CharField(max_length=20)
+    friends = models.ManyToManyField('self')
+
+    class Meta:
+        ordering = ('name',)
+
+    def __unicode__(self):
+        return self.name
+
+def m2m_changed_test(signal, sender, **kwargs):
+    print 'm2m_changed signal'
+    print 'instance:', kwargs['instance']
+    print 'action:', kwargs['action']
+    print 'reverse:', kwargs['reverse']
+    print 'model:', kwargs['model'].__name__
+    if kwargs['pk_set'] is not None:
+        print 'objects:', list(kwargs['model'].objects.filter(pk__in=kwargs['pk_set']))
+
+
+__test__ = {'API_TESTS':"""
+# The sender stands in for the intermediary model of the relation; it is
+# the same from both sides of the relation.
+>>> Car.default_parts.through
+<AutoCreatedThrough: m2m_signals.Car_default_parts>
+>>> Car.default_parts.through is Part.car_set.through
+True
+
+>>> models.signals.m2m_changed.connect(m2m_changed_test,
+...     sender=Car.default_parts.through)
+
+>>> c1 = Car.objects.create(name='VW')
+>>> wheelset = Part.objects.create(name='Wheelset')
+>>> doors = Part.objects.create(name='Doors')
+>>> engine = Part.objects.create(name='Engine')
+
+>>> c1.default_parts.add(wheelset, doors)
+m2m_changed signal
+instance: VW
+action: pre_add
+reverse: False
+model: Part
+objects: [<Part: Doors>, <Part: Wheelset>]
+m2m_changed signal
+instance: VW
+action: post_add
+reverse: False
+model: Part
+objects: [<Part: Doors>, <Part: Wheelset>]
+
+# Adding parts that are already there only signals the new ones.
+>>> c1.default_parts.add(wheelset, engine)
+m2m_changed signal
+instance: VW
+action: pre_add
+reverse: False
+model: Part
+objects: [<Part: Engine>]
+m2m_changed signal
+instance: VW
+action: post_add
+reverse: False
+model: Part
+objects: [<Part: Engine>]
+
+>>> engine.car_set.remove(c1)
+m2m_changed signal
+instance: Engine
+action: pre_remove
+reverse: True
+model: Car
+objects: [<Car: VW>]
+m2m_changed signal
+instance: Engine
+action: post_remove
+reverse: True
+model: Car
+objects: [<Car: VW>]
+
+# Assigning a new set of objects clears the relation first.
+>>> c1.default_parts = [engine]
+m2m_changed signal
+instance: VW
+action: pre_clear
+reverse: False
+model: Part
+m2m_changed signal
+instance: VW
+action: post_clear
+reverse: False
+model: Part
+m2m_changed signal
+instance: VW
+action: pre_add
+reverse: False
+model: Part
+objects: [<Part: Engine>]
+m2m_changed signal
+instance: VW
+action: post_add
+reverse: False
+model: Part
+objects: [<Part: Engine>]
+
+>>> models.signals.m2m_changed.disconnect(m2m_changed_test,
+...     sender=Car.default_parts.through)
+
+# The ManyToManyField is sent along with the signal.
+>>> fields = []
+>>> def record_field(sender, field, **kwargs):
+...     fields.append(field)
+>>> models.signals.m2m_changed.connect(record_field, sender=Car.default_parts.through)
+>>> c1.default_parts.clear()
+>>> fields == [Car._meta.get_field('default_parts')] * 2
+True
+>>> models.signals.m2m_changed.disconnect(record_field, sender=Car.default_parts.through)
+
+# Symmetrical relations only signal once, not for the mirror entries.
+>>> models.signals.m2m_changed.connect(m2m_changed_test,
+...     sender=Person.friends.through)
+>>> alice = Person.objects.create(name='Alice')
+>>> bob = Person.objects.create(name='Bob')
+>>> alice.friends.add(bob)
+m2m_changed signal
+instance: Alice
+action: pre_add
+reverse: False
+model: Person
+objects: [<Person: Bob>]
+m2m_changed signal
+instance: Alice
+action: post_add
+reverse: False
+model: Person
+objects: [<Person: Bob>]
+>>> bob.friends.all()
+[<Person: Alice>]
+>>> models.signals.m2m_changed.disconnect(m2m_changed_test,
+...     sender=Person.friends.through)
+"""}
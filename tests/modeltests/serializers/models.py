@@ -231,6 +231,31 @@ __test__ = {'API_TESTS':"""
 >>> print serializers.serialize("json", Article.objects.all(), fields=('headline','pub_date'))
 [{"pk": 1, "model": "serializers.article", "fields": {"headline": "Just kidding; I love TV poker", "pub_date": "2006-06-16 11:00:00"}}, {"pk": 2, "model": "serializers.article", "fields": {"headline": "Time to reform copyright", "pub_date": "2006-06-16 13:00:11"}}, {"pk": 3, "model": "serializers.article", "fields": {"headline": "Forward references pose no problem", "pub_date": "2006-06-16 15:00:00"}}]
 
+# Objects of a model can also be saved in batches, with a few queries for the
+# whole batch. Existing objects are updated and the others inserted, and the
+# many-to-many data of all of them is replaced. No signals are sent.
+>>> from django.core.serializers.base import save_batch
+>>> json = '[{"pk": 3, "model": "serializers.article", "fields": {"headline": "Forward references are fine", "pub_date": "2006-06-16 15:00:00", "categories": [1], "author": 4}}, {"pk": 4, "model": "serializers.article", "fields": {"headline": "Batches are fast", "pub_date": "2006-06-16 16:00:00", "categories": [2, 4, 2], "author": 4}}]'
+>>> save_batch(list(serializers.deserialize("json", json)))
+>>> Article.objects.filter(pk__gte=3)
+[<Article: Forward references are fine>, <Article: Batches are fast>]
+>>> Article.objects.get(pk=3).categories.all()
+[<Category: Sports>]
+>>> Article.objects.get(pk=4).categories.all()
+[<Category: Music>, <Category: Reference>]
+
+# The JSON deserializer reads its stream a bit at a time, as needed
+>>> from StringIO import StringIO
+>>> from django.core.serializers.json import iter_json_list
+>>> stream = StringIO(json)
+>>> items = iter_json_list(stream, chunk_size=64)
+>>> items.next()['pk']
+3
+>>> stream.tell() < len(json)
+True
+>>> [item['pk'] for item in items]
+[4]
+
 # Every string is serialized as a unicode object, also primary key
 # which is 'varchar'
 >>> ac = Actor(name="Zażółć")
@@ -4,6 +4,12 @@ from django.contrib import admin
 class Parent(models.Model):
     name = models.CharField(max_length=128)
 
+    class Meta:
+        ordering = ('name',)
+
+    def __unicode__(self):
+        return self.name
+
 class Child(models.Model):
     parent = models.ForeignKey(Parent, editable=False)
     name = models.CharField(max_length=30, blank=True)
\ No newline at end of file
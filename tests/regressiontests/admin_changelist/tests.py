@@ -1,7 +1,12 @@
 import unittest 
 from django.contrib import admin
+from django.contrib.admin import filterspecs
+from django.contrib.admin.options import IncorrectLookupParameters
 from django.contrib.admin.views.main import ChangeList
-from regressiontests.admin_changelist.models import Child
+from django.core.cache import get_cache
+from django.db import connection
+from django.test import TestCase
+from regressiontests.admin_changelist.models import Parent, Child
 
 class ChangeListTests(unittest.TestCase):
     def test_select_related_preserved(self):
@@ -15,10 +20,172 @@ class ChangeListTests(unittest.TestCase):
                 m.list_select_related, m.list_per_page, m.list_editable, m)
         self.assertEqual(cl.query_set.query.select_related, {'parent': {'name': {}}})
 
+class ChangeListCountTests(TestCase):
+    def setUp(self):
+        parent = Parent.objects.create(name='parent')
+        for i in range(5):
+            Child.objects.create(parent=parent, name='child %s' % i)
+
+    def get_changelist(self, model_admin, **params):
+        m = model_admin
+        request = MockRequest()
+        request.GET = params
+        return ChangeList(request, Child, m.list_display, m.list_display_links,
+                m.list_filter, m.date_hierarchy, m.search_fields,
+                m.list_select_related, m.list_per_page, m.list_editable, m)
+
+    def test_without_total(self):
+        """
+        With list_show_total = False, nothing is counted; the paginator only
+        knows whether there's a next page.
+        """
+        m = NoTotalChildAdmin(Child, admin.site)
+        cl = self.get_changelist(m)
+        self.assertEqual(cl.result_count, None)
+        self.assertEqual(cl.full_result_count, None)
+        self.assertEqual(len(cl.result_list), 2)
+        self.assertEqual(cl.multi_page, True)
+        self.assertEqual(cl.paginator.num_pages, 2)
+
+        cl = self.get_changelist(m, p='2')
+        self.assertEqual([c.name for c in cl.result_list], ['child 0'])
+        self.assertEqual(cl.multi_page, True)
+        self.assertEqual(cl.paginator.num_pages, 3)
+
+        # Pages past the last one are rejected.
+        for page in ('3', '-1'):
+            self.assertRaises(IncorrectLookupParameters, self.get_changelist, m, p=page)
+
+    def test_estimated_count(self):
+        """
+        Estimates that are unavailable or too small fall back to counting.
+        """
+        m = ChildAdmin(Child, admin.site)
+        m.list_count_estimate = True
+        cl = self.get_changelist(m)
+        self.assertEqual(cl.result_count, 5)
+        self.assertEqual(cl.full_result_count, 5)
+
+    def test_cached_count(self):
+        m = ChildAdmin(Child, admin.site)
+        m.list_count_cache_timeout = 60
+        self.assertEqual(self.get_changelist(m).result_count, 5)
+        Child.objects.create(parent=Parent.objects.get(), name='child 5')
+        self.assertEqual(self.get_changelist(m).result_count, 5)
+        cl = self.get_changelist(m, name='child 5')
+        self.assertEqual((cl.result_count, cl.full_result_count), (1, 5))
+
+class ChangeListSearchTests(ChangeListCountTests):
+    def get_names(self, model_admin, q):
+        cl = self.get_changelist(model_admin, q=q)
+        return sorted([c.name for c in cl.query_set])
+
+    def test_contains_backend(self):
+        m = SearchChildAdmin(Child, admin.site)
+        self.assertEqual(self.get_names(m, 'CHILD'), ['child %s' % i for i in range(5)])
+        self.assertEqual(self.get_names(m, '1'), ['child 1'])
+
+    def test_prefix_backend(self):
+        """
+        The 'prefix' backend only matches the beginning of the fields, and
+        doesn't override an explicit operator prefix.
+        """
+        m = SearchChildAdmin(Child, admin.site)
+        m.search_backend = 'prefix'
+        self.assertEqual(self.get_names(m, 'CHILD'), ['child %s' % i for i in range(5)])
+        self.assertEqual(self.get_names(m, '1'), [])
+        m.search_fields = ['=name']
+        self.assertEqual(self.get_names(m, 'child'), [])
+
+    def test_fulltext_backend(self):
+        m = SearchChildAdmin(Child, admin.site)
+        m.search_backend = 'fulltext'
+        cl = self.get_changelist(m)
+        try:
+            connection.ops.fulltext_search_sql('')
+        except NotImplementedError:
+            self.assertEqual(cl.get_search_lookup(), 'icontains')
+        else:
+            self.assertEqual(cl.get_search_lookup(), 'search')
+
+class RelatedFilterSpecTests(TestCase):
+    def setUp(self):
+        # Keep the cached choices out of the shared cache.
+        self.old_cache = filterspecs.cache
+        filterspecs.cache = get_cache('locmem://')
+        for name in ('a', 'b', 'c'):
+            Parent.objects.create(name=name)
+        for parent in Parent.objects.filter(name__in=['a', 'c']):
+            Child.objects.create(parent=parent, name='child of %s' % parent.name)
+
+    def tearDown(self):
+        filterspecs.cache = self.old_cache
+
+    def get_spec(self, model_admin, **params):
+        request = MockRequest()
+        request.GET = params
+        cl = ChangeList(request, Child, model_admin.list_display,
+                model_admin.list_display_links, model_admin.list_filter,
+                model_admin.date_hierarchy, model_admin.search_fields,
+                model_admin.list_select_related, model_admin.list_per_page,
+                model_admin.list_editable, model_admin)
+        return cl, cl.filter_specs[0]
+
+    def get_displays(self, model_admin, **params):
+        cl, spec = self.get_spec(model_admin, **params)
+        return [unicode(c['display']) for c in spec.choices(cl)]
+
+    def test_all_related_objects(self):
+        m = FilterChildAdmin(Child, admin.site)
+        self.assertEqual(self.get_displays(m), [u'All', u'a', u'b', u'c'])
+
+    def test_related_only(self):
+        m = FilterChildAdmin(Child, admin.site)
+        m.list_filter_related_only = True
+        self.assertEqual(self.get_displays(m), [u'All', u'a', u'c'])
+
+    def test_max_choices(self):
+        """
+        Choices past list_filter_max_choices are replaced by a link that
+        shows the full list; an active filter past the cut stays visible.
+        """
+        m = FilterChildAdmin(Child, admin.site)
+        m.list_filter_max_choices = 1
+        cl, spec = self.get_spec(m)
+        choices = list(spec.choices(cl))
+        self.assertEqual([unicode(c['display']) for c in choices],
+                         [u'All', u'a', u'More\u2026'])
+        self.assertEqual(choices[-1]['query_string'], '?_more=parent')
+
+        self.assertEqual(self.get_displays(m, _more='parent'),
+                         [u'All', u'a', u'b', u'c'])
+
+        c = Parent.objects.get(name='c')
+        cl, spec = self.get_spec(m, parent__id__exact=str(c.pk))
+        self.assertEqual([c['display'] for c in spec.choices(cl) if c['selected']], [u'c'])
+        self.assertEqual([c.name for c in cl.result_list], [u'child of c'])
+
+    def test_cached_choices(self):
+        m = FilterChildAdmin(Child, admin.site)
+        m.list_filter_cache_timeout = 60
+        self.assertEqual(self.get_displays(m), [u'All', u'a', u'b', u'c'])
+        Parent.objects.create(name='d')
+        self.assertEqual(self.get_displays(m), [u'All', u'a', u'b', u'c'])
+
 class ChildAdmin(admin.ModelAdmin):
     list_display = ['name', 'parent']
     def queryset(self, request):
         return super(ChildAdmin, self).queryset(request).select_related("parent__name")
 
+class NoTotalChildAdmin(admin.ModelAdmin):
+    list_per_page = 2
+    list_show_total = False
+
+class FilterChildAdmin(admin.ModelAdmin):
+    list_filter = ['parent']
+
+class SearchChildAdmin(admin.ModelAdmin):
+    search_fields = ['name']
+
 class MockRequest(object):
     GET = {}
@@ -70,6 +70,35 @@ True
 >>> user.has_perms(['auth.test3', 'auth.test_group'])
 True
 
+# With AUTH_PERMISSION_CACHE_TIMEOUT set, permissions are cached across user
+# instances until the user's permissions or groups, or a group's permissions,
+# change.
+>>> from django.conf import settings
+>>> old_timeout = settings.AUTH_PERMISSION_CACHE_TIMEOUT
+>>> settings.AUTH_PERMISSION_CACHE_TIMEOUT = 300
+>>> User.objects.get(username="test").get_all_permissions() == exp
+True
+>>> Permission.objects.filter(codename='test2').update(codename='renamed')
+1
+>>> User.objects.get(username="test").get_all_permissions() == exp
+True
+>>> user = User.objects.get(username="test")
+>>> user.user_permissions.remove(Permission.objects.get(codename='test3'))
+>>> exp = set([u'auth.renamed', u'auth.test', u'auth.test_group'])
+>>> User.objects.get(username="test").get_all_permissions() == exp
+True
+>>> perm = Permission.objects.create(name="test_group2", content_type=content_type, codename="test_group2")
+>>> group.permissions.add(perm)
+>>> exp.add(u'auth.test_group2')
+>>> User.objects.get(username="test").get_all_permissions() == exp
+True
+>>> User.objects.get(username="test").get_group_permissions() == set([u'auth.test_group', u'auth.test_group2'])
+True
+>>> group.user_set.clear()
+>>> User.objects.get(username="test").get_all_permissions() == set([u'auth.renamed', u'auth.test'])
+True
+>>> settings.AUTH_PERMISSION_CACHE_TIMEOUT = old_timeout
+
 >>> user = AnonymousUser()
 >>> user.has_perm('test')
 False
@@ -9,6 +9,7 @@ FULL_RESPONSE = 'Test conditional get response'
 LAST_MODIFIED = datetime(2007, 10, 21, 23, 21, 47)
 LAST_MODIFIED_STR = 'Sun, 21 Oct 2007 23:21:47 GMT'
 EXPIRED_LAST_MODIFIED_STR = 'Sat, 20 Oct 2007 23:21:47 GMT'
+NEWER_LAST_MODIFIED_STR = 'Mon, 22 Oct 2007 08:00:00 GMT'
 ETAG = 'b4246ffc4f62314ca13147c9d4f76974'
 EXPIRED_ETAG = '7fae4cd4b0f81e7d2914700043aa8ed6'
 
@@ -37,6 +38,38 @@ class ConditionalGet(TestCase):
         response = self.client.get('/condition/')
         self.assertFullResponse(response)
 
+    def testIfModifiedSinceNewer(self):
+        """
+        If-Modified-Since dates are compared as dates, not strings.
+        """
+        self.client.defaults['HTTP_IF_MODIFIED_SINCE'] = NEWER_LAST_MODIFIED_STR
+        response = self.client.get('/condition/')
+        self.assertNotModified(response)
+        self.client.defaults['HTTP_IF_MODIFIED_SINCE'] = 'Sunday, 21-Oct-07 23:21:47 GMT'
+        response = self.client.get('/condition/')
+        self.assertNotModified(response)
+        self.client.defaults['HTTP_IF_MODIFIED_SINCE'] = 'not a date'
+        response = self.client.get('/condition/')
+        self.assertFullResponse(response)
+
+    def testIfModifiedSinceHead(self):
+        self.client.defaults['HTTP_IF_MODIFIED_SINCE'] = LAST_MODIFIED_STR
+        response = self.client.head('/condition/last_modified/')
+        self.assertEquals(response.status_code, 304)
+
+    def testViewNotCalled(self):
+        """
+        The view isn't run at all when the resource hasn't changed.
+        """
+        from regressiontests.conditional_processing import views
+        views.calls = 0
+        self.client.defaults['HTTP_IF_NONE_MATCH'] = '"%s"' % ETAG
+        self.client.get('/condition/etag/')
+        self.assertEquals(views.calls, 0)
+        self.client.defaults['HTTP_IF_NONE_MATCH'] = '"%s"' % EXPIRED_ETAG
+        self.client.get('/condition/etag/')
+        self.assertEquals(views.calls, 1)
+
     def testIfNoneMatch(self):
         self.client.defaults['HTTP_IF_NONE_MATCH'] = '"%s"' % ETAG
         response = self.client.get('/condition/')
@@ -16,7 +16,12 @@ def last_modified_view2(request):
     return HttpResponse(FULL_RESPONSE)
 last_modified_view2 = last_modified(lambda r: LAST_MODIFIED)(last_modified_view2)
 
+# Number of times etag_view1 actually ran.
+calls = 0
+
 def etag_view1(request):
+    global calls
+    calls += 1
     return HttpResponse(FULL_RESPONSE)
 etag_view1 = condition(etag_func=lambda r: ETAG)(etag_view1)
 
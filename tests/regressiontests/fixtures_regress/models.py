@@ -192,4 +192,20 @@ Weight = 1.2 (<type 'float'>)
 >>> management.call_command('dumpdata', 'fixtures_regress', format='json')
 [{"pk": 1, "model": "fixtures_regress.widget", "fields": {"name": "grommet"}}]
 
+###############################################
+# With cache=True, a fixture is only parsed once, but every load saves
+# its own copies of the objects.
+
+>>> from django.core.management.commands import loaddata
+>>> management.call_command('loaddata', 'animal.xml', verbosity=0, cache=True)
+>>> [path] = [path for path in loaddata.fixture_cache if path.endswith('animal.xml')]
+>>> emu = Animal.specimens.get(pk=10)
+>>> emu.name = 'Ostrich'
+>>> emu.save()
+>>> management.call_command('loaddata', 'animal.xml', verbosity=0, cache=True)
+>>> Animal.specimens.get(pk=10).name
+u'Emu'
+>>> [obj.object.name for obj in loaddata.fixture_cache[path][1]]
+[u'Emu']
+
 """}
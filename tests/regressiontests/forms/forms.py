@@ -809,6 +809,52 @@ to the next.
 >>> f['first_name'].field.max_length, f['last_name'].field.max_length
 (30, 30)
 
+Fields are only copied from base_fields when they're looked up in the
+instance's fields. Validating and rendering a form doesn't copy them, but
+changes made through self.fields are still used, and don't affect
+base_fields or other instances.
+>>> class CountingField(CharField):
+...     copies = 0
+...     def __deepcopy__(self, memo):
+...         CountingField.copies += 1
+...         return super(CountingField, self).__deepcopy__(memo)
+>>> class CountingPerson(Form):
+...     first_name = CountingField(max_length=30)
+...     last_name = CountingField(max_length=30)
+>>> f = CountingPerson(data={'first_name': 'John', 'last_name': 'Lennon'})
+>>> f.is_valid()
+True
+>>> len(f.as_p()) > 0
+True
+>>> CountingField.copies
+0
+>>> f.fields['first_name'].max_length = 3
+>>> CountingField.copies
+1
+>>> CountingPerson.base_fields['first_name'].max_length
+30
+>>> f.fields['first_name'] is f.fields['first_name']
+True
+>>> f.fields['first_name'] is CountingPerson.base_fields['first_name']
+False
+>>> CountingField.copies
+1
+>>> f2 = CountingPerson(data={'first_name': 'John', 'last_name': 'Lennon'})
+>>> f2.is_valid(), f2.fields['first_name'].max_length
+(True, 30)
+
+>>> f = Person(name_max_length=3, data={'first_name': 'John', 'last_name': 'Lennon'})
+>>> f.errors['first_name']
+[u'Ensure this value has at most 3 characters (it has 4).']
+>>> Person.base_fields['first_name'].max_length
+30
+>>> f.fields.keys()
+['first_name', 'last_name']
+>>> f.fields.pop('last_name').max_length
+3
+>>> f.fields.keys()
+['first_name']
+
 HiddenInput widgets are displayed differently in the as_table(), as_ul()
 and as_p() output of a Form -- their verbose names are not displayed, and a
 separate row is not displayed. They're displayed in the last row of the
@@ -492,6 +492,59 @@ Choices can be nested one level in order to create HTML optgroups:
 </optgroup>
 </select>
 
+The rendered options are cached and shared by widgets with the same list of
+choices. Selecting an option in one render doesn't affect the others:
+>>> from django.utils.safestring import mark_safe
+>>> choices = [(1, 'a&b')]
+>>> w1 = Select(choices=choices)
+>>> w2 = Select()
+>>> w2.choices = choices
+>>> print w1.render('x', 1)
+<select name="x">
+<option value="1" selected="selected">a&amp;b</option>
+</select>
+>>> print w2.render('x', None)
+<select name="x">
+<option value="1">a&amp;b</option>
+</select>
+>>> w1._rendered_options(w1.choices) == w2._rendered_options(w2.choices)
+True
+
+A new list is rendered anew, even if its choices compare equal to those of a
+cached one:
+>>> w2.choices = [(1, mark_safe('a&b'))]
+>>> print w2.render('x', None)
+<select name="x">
+<option value="1">a&b</option>
+</select>
+>>> print Select(choices=[(True, 'a&b')]).render('x', None)
+<select name="x">
+<option value="True">a&amp;b</option>
+</select>
+
+Other iterables aren't cached, so labels computed from objects are current:
+>>> class Label(object):
+...     text = u'old'
+...     def __unicode__(self):
+...         return self.text
+>>> class ChoiceIterable(object):
+...     def __init__(self, choices):
+...         self.choices = choices
+...     def __iter__(self):
+...         return iter(self.choices)
+>>> label = Label()
+>>> w = Select()
+>>> w.choices = ChoiceIterable([(1, label)])
+>>> print w.render('x', None)
+<select name="x">
+<option value="1">old</option>
+</select>
+>>> label.text = u'new'
+>>> print w.render('x', None)
+<select name="x">
+<option value="1">new</option>
+</select>
+
 # NullBooleanSelect Widget ####################################################
 
 >>> w = NullBooleanSelect()
@@ -0,0 +1,2 @@
+from django.conf.urls.defaults import *
+from regressiontests.handlers.urls import override_urlpatterns as urlpatterns
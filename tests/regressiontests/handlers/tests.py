@@ -0,0 +1,104 @@
+from StringIO import StringIO
+
+from django.conf import settings
+from django.core import urlresolvers
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import TestCase
+
+class UrlconfOverrideMiddleware(object):
+    def process_request(self, request):
+        if 'override' in request.path:
+            request.urlconf = 'regressiontests.handlers.override_urls'
+
+class HandlerTests(TestCase):
+    urls = 'regressiontests.handlers.urls'
+
+    def setUp(self):
+        self.old_middleware = settings.MIDDLEWARE_CLASSES
+        self.old_timing = settings.MIDDLEWARE_TIMING
+        settings.MIDDLEWARE_CLASSES = (
+            'django.middleware.common.CommonMiddleware',
+            'regressiontests.handlers.tests.UrlconfOverrideMiddleware',
+        )
+
+    def tearDown(self):
+        settings.MIDDLEWARE_CLASSES = self.old_middleware
+        settings.MIDDLEWARE_TIMING = self.old_timing
+
+    def test_resolver_reuse(self):
+        self.assertEqual(self.client.get('/default/').content, 'default')
+        resolver = urlresolvers.get_resolver(settings.ROOT_URLCONF)
+        self.assertEqual(self.client.get('/default/').content, 'default')
+        self.assert_(urlresolvers.get_resolver(settings.ROOT_URLCONF) is resolver)
+
+    def test_urlconf_override(self):
+        self.assertEqual(self.client.get('/override/').content, 'override')
+        self.assertEqual(self.client.get('/default/').content, 'default')
+        self.assertEqual(self.client.get('/default/override/').status_code, 404)
+
+    def test_middleware_timing(self):
+        settings.MIDDLEWARE_TIMING = True
+        self.client.get('/default/')
+        self.client.get('/default/')
+        timings = self.client.handler.middleware_timings
+        self.assertEqual(sorted(timings.keys()), [
+            ('django.middleware.common.CommonMiddleware', 'process_request'),
+            ('django.middleware.common.CommonMiddleware', 'process_response'),
+            ('regressiontests.handlers.tests.UrlconfOverrideMiddleware', 'process_request'),
+        ])
+        for calls, seconds in timings.values():
+            self.assertEqual(calls, 2)
+            self.assert_(seconds >= 0)
+
+    def test_middleware_timing_disabled(self):
+        settings.MIDDLEWARE_TIMING = False
+        self.client.get('/default/')
+        self.assertEqual(self.client.handler.middleware_timings, {})
+
+class FileWrapper(object):
+    def __init__(self, filelike, block_size):
+        self.filelike, self.block_size = filelike, block_size
+
+class WSGIFileWrapperTests(TestCase):
+    urls = 'regressiontests.handlers.urls'
+
+    def setUp(self):
+        self.old_middleware = settings.MIDDLEWARE_CLASSES
+        settings.MIDDLEWARE_CLASSES = ()
+
+    def tearDown(self):
+        settings.MIDDLEWARE_CLASSES = self.old_middleware
+
+    def request(self, path, **extra):
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': path,
+            'SERVER_NAME': 'testserver',
+            'SERVER_PORT': '80',
+            'wsgi.input': StringIO(''),
+            'wsgi.file_wrapper': FileWrapper,
+        }
+        environ.update(extra)
+        status = []
+        def start_response(s, headers):
+            status.append(s)
+        result = WSGIHandler()(environ, start_response)
+        return result, status
+
+    def test_file_wrapper(self):
+        result, status = self.request('/file/')
+        self.assert_(isinstance(result, FileWrapper))
+        self.assertEqual(status, ['200 OK'])
+        self.assertEqual(result.filelike.read(), '0123456789')
+
+    def test_partial_range(self):
+        # The file wrapper would send everything up to the end of the file.
+        result, status = self.request('/file/', HTTP_RANGE='bytes=2-3')
+        self.failIf(isinstance(result, FileWrapper))
+        self.assertEqual(status, ['206 PARTIAL CONTENT'])
+        self.assertEqual(''.join(result), '23')
+
+    def test_other_responses(self):
+        result, status = self.request('/default/')
+        self.failIf(isinstance(result, FileWrapper))
+        self.assertEqual(''.join(result), 'default')
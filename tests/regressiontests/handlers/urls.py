@@ -0,0 +1,19 @@
+from django.conf.urls.defaults import *
+from StringIO import StringIO
+
+from django.http import HttpResponse, FileResponse
+
+def view(request, name):
+    return HttpResponse(name)
+
+def file_view(request):
+    return FileResponse(StringIO('0123456789'), request=request)
+
+urlpatterns = patterns('',
+    (r'^default/$', view, {'name': 'default'}),
+    (r'^file/$', file_view),
+)
+
+override_urlpatterns = patterns('',
+    (r'^override/$', view, {'name': 'override'}),
+)
@@ -463,9 +463,65 @@ BadHeaderError: Header values can't contain newlines (got 'test\\nstr')
 >>> x.update(y)
 >>> x.getlist('a')
 [u'1', u'2', u'3', u'4']
+
+#
+# FileResponse
+#
+
+>>> from StringIO import StringIO
+>>> r = FileResponse(StringIO('0123456789' * 1000))
+>>> r.streaming, r.status_code, r['Content-Type'], r['Content-Length']
+(True, 200, 'application/octet-stream', '10000')
+>>> r.block_size = 4096
+>>> [len(chunk) for chunk in r]
+[4096, 4096, 1808]
+
+# Reading the content loads it into memory and turns streaming off.
+>>> r = FileResponse(StringIO('0123456789'), mimetype='text/plain')
+>>> r.content, r.streaming, r['Content-Type']
+('0123456789', False, 'text/plain')
+
+# Setting the content discards the file.
+>>> r = FileResponse(StringIO('0123456789'))
+>>> r.content = ''
+>>> ''.join(r), r.file_to_stream()
+('', None)
+
+# Range requests.
+>>> class FakeRequest(object):
+...     def __init__(self, range):
+...         self.META = {'HTTP_RANGE': range}
+>>> def ranged(range):
+...     r = FileResponse(StringIO('0123456789'), request=FakeRequest(range))
+...     return r.status_code, r.get('Content-Range', None), r['Content-Length'], ''.join(r)
+>>> ranged('bytes=2-4')
+(206, 'bytes 2-4/10', '3', '234')
+>>> ranged('bytes=7-')
+(206, 'bytes 7-9/10', '3', '789')
+>>> ranged('bytes=-3')
+(206, 'bytes 7-9/10', '3', '789')
+>>> ranged('bytes=5-100')
+(206, 'bytes 5-9/10', '5', '56789')
+>>> ranged('bytes=10-')
+(416, 'bytes */10', '0', '')
+
+# Malformed or multiple ranges are ignored.
+>>> ranged('bytes=4-2')
+(200, None, '10', '0123456789')
+>>> ranged('bytes=0-1,4-5')
+(200, None, '10', '0123456789')
+>>> ranged('pages=1-2')
+(200, None, '10', '0123456789')
+
+# The file can be handed to wsgi.file_wrapper if the content runs up to its
+# end.
+>>> r = FileResponse(StringIO('0123456789'), request=FakeRequest('bytes=4-'))
+>>> r.file_to_stream().read()
+'456789'
+>>> FileResponse(StringIO('0123456789'), request=FakeRequest('bytes=4-5')).file_to_stream()
 """
 
-from django.http import QueryDict, HttpResponse
+from django.http import QueryDict, HttpResponse, FileResponse
 
 if __name__ == "__main__":
     import doctest
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import gzip
+from cStringIO import StringIO
+
 from django.test import TestCase
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse, FileResponse
 from django.middleware.common import CommonMiddleware
+from django.middleware.gzip import GZipMiddleware
 from django.conf import settings
+from django.utils.hashcompat import md5_constructor
 
 class CommonMiddlewareTest(TestCase):
     def setUp(self):
@@ -125,3 +130,95 @@ class CommonMiddlewareTest(TestCase):
         self.assertEquals(r.status_code, 301)
         self.assertEquals(r['Location'],
                           'http://www.testserver/middleware/slash/')
+    def test_etag_iterator(self):
+        """
+        ETags for iterator responses are computed without losing the content.
+        """
+        old_use_etags = settings.USE_ETAGS
+        settings.USE_ETAGS = True
+        try:
+            request = self._get_request('slash/')
+            response = CommonMiddleware().process_response(request,
+                    HttpResponse(iter(['abc', u'd\xe9f'])))
+            etag = '"%s"' % md5_constructor('abcd\xc3\xa9f').hexdigest()
+            self.assertEquals(response['ETag'], etag)
+            self.assertEquals(response.content, 'abcd\xc3\xa9f')
+
+            request.META['HTTP_IF_NONE_MATCH'] = etag
+            response = CommonMiddleware().process_response(request,
+                    HttpResponse(iter(['abc', u'd\xe9f'])))
+            self.assertEquals(response.status_code, 304)
+        finally:
+            settings.USE_ETAGS = old_use_etags
+
+class GZipMiddlewareTest(TestCase):
+    def setUp(self):
+        self.old_settings = (settings.GZIP_MIN_LENGTH,
+                             settings.GZIP_CONTENT_TYPES)
+        self.request = HttpRequest()
+        self.request.META = {
+            'SERVER_NAME': 'testserver',
+            'SERVER_PORT': 80,
+            'HTTP_ACCEPT_ENCODING': 'gzip, deflate',
+        }
+        self.content = 'x' * 300
+
+    def tearDown(self):
+        settings.GZIP_MIN_LENGTH, settings.GZIP_CONTENT_TYPES = self.old_settings
+
+    def decompress(self, data):
+        return gzip.GzipFile(fileobj=StringIO(data)).read()
+
+    def test_compress_string(self):
+        response = GZipMiddleware().process_response(self.request,
+                HttpResponse(self.content))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertEqual(self.decompress(response.content), self.content)
+
+    def test_compress_iterator(self):
+        """
+        Iterator responses are compressed incrementally, without a
+        Content-Length.
+        """
+        original = HttpResponse(iter(['x' * 100] * 3))
+        response = GZipMiddleware().process_response(self.request, original)
+        self.assertNotEqual(response, original)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(self.decompress(''.join(response)), self.content)
+
+    def test_compress_file_response(self):
+        original = FileResponse(StringIO(self.content), mimetype='text/plain')
+        original.set_cookie('name', 'value')
+        response = GZipMiddleware().process_response(self.request, original)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Type'], 'text/plain')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(response.cookies['name'].value, 'value')
+        self.assertEqual(self.decompress(''.join(response)), self.content)
+
+    def test_short_content(self):
+        settings.GZIP_MIN_LENGTH = 500
+        response = GZipMiddleware().process_response(self.request,
+                HttpResponse(self.content))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, self.content)
+
+    def test_content_types(self):
+        settings.GZIP_CONTENT_TYPES = ('text/', 'application/json')
+        middleware = GZipMiddleware()
+        response = middleware.process_response(self.request,
+                HttpResponse(self.content, mimetype='image/png'))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        response = middleware.process_response(self.request,
+                HttpResponse(self.content, mimetype='application/json; charset=utf-8'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_no_accept_encoding(self):
+        del self.request.META['HTTP_ACCEPT_ENCODING']
+        response = GZipMiddleware().process_response(self.request,
+                HttpResponse(iter([self.content])))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(''.join(response), self.content)
@@ -2,7 +2,7 @@ from datetime import date
 
 from django import db
 from django import forms
-from django.forms.models import modelform_factory
+from django.forms.models import modelform_factory, modelformset_factory, ModelChoiceCache
 from django.conf import settings
 from django.test import TestCase
 
@@ -30,6 +30,55 @@ class ModelMultipleChoiceFieldTests(TestCase):
         selected = f.clean([1, 3, 5, 7, 9])
         self.assertEquals(len(db.connection.queries), 1)
 
+class ModelChoiceCacheTests(TestCase):
+
+    def setUp(self):
+        self.old_debug = settings.DEBUG
+        settings.DEBUG = True
+        for i in range(3):
+            Publication.objects.create(title="Publication %s" % i,
+                                       date_published=date(2009, 1, i + 1))
+        for i in range(5):
+            Article.objects.create(headline="Article %s" % i)
+
+    def tearDown(self):
+        settings.DEBUG = self.old_debug
+
+    def test_formset_shares_choices(self):
+        """
+        Test that the forms of a model formset evaluate each distinct choice
+        queryset only once.
+        """
+        ArticleFormSet = modelformset_factory(Article, extra=2)
+        formset = ArticleFormSet(queryset=Article.objects.order_by('pk'))
+        db.reset_queries()
+        output = formset.as_table()
+        # The forms were built by the constructor, so rendering only needs
+        # the publication choices.
+        self.assertEquals(len(db.connection.queries), 1)
+        self.assertEquals(output.count('>Publication 2</option>'), 7)
+
+    def test_customized_querysets_not_shared(self):
+        cache = ModelChoiceCache()
+        f1 = modelform_factory(Article)()
+        f2 = modelform_factory(Article)()
+        f2.fields['publications'].queryset = Publication.objects.filter(title__endswith='1')
+        cache.add_form(f1)
+        cache.add_form(f2)
+        self.assertEquals(len(list(f1.fields['publications'].choices)), 3)
+        self.assertEquals(list(f2.fields['publications'].choices),
+                          [(2, u'Publication 1')])
+
+    def test_label_field(self):
+        """
+        Test that choices can be read with values_list().
+        """
+        f = forms.ModelChoiceField(Publication.objects.order_by('pk'),
+                                   label_field='title', empty_label=None)
+        self.assertEquals(list(f.choices),
+                          [(1, u'Publication 0'), (2, u'Publication 1'),
+                           (3, u'Publication 2')])
+
 class TripleForm(forms.ModelForm):
     class Meta:
         model = Triple
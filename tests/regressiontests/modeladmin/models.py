@@ -708,6 +708,19 @@ Traceback (most recent call last):
 ...
 ImproperlyConfigured: 'ValidationTestModelAdmin.search_fields' must be a list or tuple.
 
+# search_backend
+
+>>> class ValidationTestModelAdmin(ModelAdmin):
+...     search_backend = 'icontains'
+>>> validate(ValidationTestModelAdmin, ValidationTestModel)
+Traceback (most recent call last):
+...
+ImproperlyConfigured: 'ValidationTestModelAdmin.search_backend' should be one of 'contains', 'fulltext', 'prefix'.
+
+>>> class ValidationTestModelAdmin(ModelAdmin):
+...     search_backend = 'prefix'
+>>> validate(ValidationTestModelAdmin, ValidationTestModel)
+
 # date_hierarchy
 
 >>> class ValidationTestModelAdmin(ModelAdmin):
@@ -13,6 +13,7 @@ from cStringIO import StringIO
 
 from django.utils.functional import curry
 from django.core import serializers
+from django.core.serializers import base
 from django.db import transaction
 from django.core import management
 from django.conf import settings
@@ -434,8 +435,49 @@ def streamTest(format, self):
     self.assertEqual(string_data, stream.getvalue())
     stream.close()
 
+def valuesTest(format, self):
+    # Clear the database first
+    management.call_command('flush', verbosity=0, interactive=False)
+
+    transaction.enter_transaction_management()
+    try:
+        transaction.managed(True)
+        klasses = []
+        for (func, pk, klass, datum) in test_data:
+            func[0](pk, klass, datum)
+            if klass not in klasses:
+                klasses.append(klass)
+        transaction.commit()
+    except:
+        transaction.rollback()
+        transaction.leave_transaction_management()
+        raise
+    transaction.leave_transaction_management()
+
+    # Serializing from values_list() gives the same output as serializing
+    # the model instances.
+    for klass in klasses:
+        queryset = klass._default_manager.order_by('pk')
+        self.assertEqual(serializers.serialize(format, queryset, indent=2),
+                         serializers.serialize(format, queryset, indent=2,
+                                               use_values=True, batch_size=3))
+
+    # The many-to-many data of a batch is fetched in chunks of primary keys.
+    old_lookup_size = base.BATCH_LOOKUP_SIZE
+    base.BATCH_LOOKUP_SIZE = 2
+    try:
+        for klass in (M2MData, M2MSelfData):
+            queryset = klass._default_manager.order_by('pk')
+            self.assert_(queryset.count() > base.BATCH_LOOKUP_SIZE)
+            self.assertEqual(serializers.serialize(format, queryset, indent=2),
+                             serializers.serialize(format, queryset, indent=2,
+                                                   use_values=True))
+    finally:
+        base.BATCH_LOOKUP_SIZE = old_lookup_size
+
 for format in serializers.get_serializer_formats():
     setattr(SerializerTests, 'test_'+format+'_serializer', curry(serializerTest, format))
     setattr(SerializerTests, 'test_'+format+'_serializer_fields', curry(fieldsTest, format))
+    setattr(SerializerTests, 'test_'+format+'_serializer_values', curry(valuesTest, format))
     if format != 'python':
         setattr(SerializerTests, 'test_'+format+'_serializer_stream', curry(streamTest, format))
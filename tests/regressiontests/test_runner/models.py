@@ -0,0 +1 @@
+# models.py file for tests to run.
@@ -0,0 +1,85 @@
+import unittest
+
+from django.contrib.auth.models import Group, Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.test.simple import split_suite
+from django.test.testcases import CommittedFixtures
+
+class FirstTests(unittest.TestCase):
+    def test_1(self): pass
+    def test_2(self): pass
+    def test_3(self): pass
+
+# Test classes of another module, which split_suite() keeps together.
+class SecondTests(unittest.TestCase):
+    def test_1(self): pass
+    def test_2(self): pass
+SecondTests.__module__ = 'regressiontests.test_runner.other'
+
+class DatabaseTests(TestCase):
+    def test_1(self): pass
+DatabaseTests.__module__ = 'regressiontests.test_runner.other'
+
+def names(suite):
+    tests = []
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            tests.extend(names(test))
+        elif isinstance(test, unittest.TestCase):
+            tests.append('%s.%s' % (test.__class__.__name__, test._testMethodName))
+    return tests
+
+class SplitSuiteTests(unittest.TestCase):
+    def setUp(self):
+        loader = unittest.TestLoader()
+        self.suite = unittest.TestSuite()
+        for test_class in (FirstTests, SecondTests, DatabaseTests):
+            self.suite.addTest(loader.loadTestsFromTestCase(test_class))
+
+    def test_modules_stay_together(self):
+        suites = split_suite(self.suite, 2)
+        self.assertEqual([names(suite) for suite in suites], [
+            ['FirstTests.test_1', 'FirstTests.test_2', 'FirstTests.test_3'],
+            ['DatabaseTests.test_1', 'SecondTests.test_1', 'SecondTests.test_2'],
+        ])
+
+    def test_no_empty_suites(self):
+        suites = split_suite(self.suite, 4)
+        self.assertEqual(len(suites), 2)
+        self.assertEqual(sum([suite.countTestCases() for suite in suites]), 6)
+
+class CommittedFixturesTests(unittest.TestCase):
+    def test_insertion_order(self):
+        "Tables referenced by foreign keys are restored first."
+        m2m_table = User._meta.get_field('groups').m2m_db_table()
+        tables = [User._meta.db_table, Group._meta.db_table, m2m_table,
+                  Permission._meta.db_table, ContentType._meta.db_table]
+        order = CommittedFixtures()._insertion_order(tables)
+        self.assertEqual(sorted(tables), sorted(order))
+        for referenced, table in ((ContentType._meta.db_table, Permission._meta.db_table),
+                                  (User._meta.db_table, m2m_table),
+                                  (Group._meta.db_table, m2m_table)):
+            self.assert_(order.index(referenced) < order.index(table))
+
+    def test_clear(self):
+        "Clearing restores the database as it was when it was enabled."
+        fixtures = CommittedFixtures()
+        content_types = ContentType.objects.count()
+        fixtures.enable()
+        try:
+            group = Group.objects.create(name='editors')
+            group.permissions.add(Permission.objects.all()[0])
+            user = User.objects.create(username='joe')
+            user.groups.add(group)
+            ContentType.objects.all()[0].delete()
+            fixtures.fixtures = None
+            fixtures.clear()
+        finally:
+            fixtures.disable()
+        self.assertEqual(0, Group.objects.count())
+        self.assertEqual(0, User.objects.count())
+        self.assertEqual(content_types, ContentType.objects.count())
+        ContentType.objects.clear_cache()
+        # The sequences still work.
+        Group.objects.create(name='editors').delete()
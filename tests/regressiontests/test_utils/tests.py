@@ -69,4 +69,31 @@ r"""
 >>> produce_xml_fragment()
 '<foo bbb="2.0" aaa="1.0">Hello</foo><bar ddd="4.0" ccc="3.0"></bar>'
 
-"""
\ No newline at end of file
+"""
+
+from django.core.signals import request_started
+from django.test import TestCase
+
+from models import Person
+
+class AssertNumQueriesTests(TestCase):
+    def test_func(self):
+        def create_and_count():
+            Person.objects.create(name='Ann')
+            return Person.objects.count()
+        self.assertNumQueries(2, create_and_count)
+        self.assertRaises(AssertionError, self.assertNumQueries, 1, create_and_count)
+
+    def test_context_manager(self):
+        context = self.assertNumQueries(2)
+        context.__enter__()
+        Person.objects.count()
+        # Requests made by the test client don't reset the queries counted.
+        request_started.send(sender=self.__class__)
+        Person.objects.count()
+        context.__exit__(None, None, None)
+
+        context = self.assertNumQueries(0)
+        context.__enter__()
+        Person.objects.count()
+        self.assertRaises(AssertionError, context.__exit__, None, None, None)
@@ -4,7 +4,7 @@ Tests for django.utils.
 
 from unittest import TestCase
 
-from django.utils import html, checksums
+from django.utils import html, checksums, crypto
 
 import timesince
 import datastructures
@@ -161,6 +161,16 @@ class TestUtilsChecksums(TestCase):
         for value, output in items:
             self.check_output(f, value, output)
 
+class TestUtilsCrypto(TestCase):
+
+    def test_constant_time_compare(self):
+        f = crypto.constant_time_compare
+        self.assertEqual(f('', ''), True)
+        self.assertEqual(f('abc', 'abc'), True)
+        self.assertEqual(f('abc', 'abd'), False)
+        self.assertEqual(f('abc', 'ab'), False)
+        self.assertEqual(f('abc', ''), False)
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -1,6 +1,8 @@
 from os import path
 
+from django.conf import settings
 from django.test import TestCase
+from django.views import static
 from regressiontests.views.urls import media_dir
 
 class StaticTests(TestCase):
@@ -25,3 +27,50 @@ class StaticTests(TestCase):
         file = open(path.join(media_dir, file_name))
         self.assertEquals(file.read(), response.content)
 
+
+    def test_range(self):
+        "The static view honours Range requests"
+        response = self.client.get('/views/site_media/file.txt', HTTP_RANGE='bytes=2-5')
+        file = open(path.join(media_dir, 'file.txt'))
+        self.assertEquals(response.status_code, 206)
+        self.assertEquals(file.read()[2:6], response.content)
+        self.assertEquals(response['Content-Length'], '4')
+
+    def test_last_modified(self):
+        "The static view honours If-Modified-Since"
+        response = self.client.get('/views/site_media/file.txt')
+        response = self.client.get('/views/site_media/file.txt',
+                HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEquals(response.status_code, 304)
+
+    def test_cache_timeout(self):
+        "The static view can add caching headers"
+        response = self.client.get('/views/site_media/cached/file.txt')
+        self.assertEquals(response['Cache-Control'], 'max-age=3600')
+        self.failUnless(response.has_header('Expires'))
+        self.failUnless(response.has_header('ETag'))
+
+    def test_sendfile(self):
+        "The static view can hand files off to the Web server"
+        old_header = settings.STATIC_SERVE_SENDFILE_HEADER
+        settings.STATIC_SERVE_SENDFILE_HEADER = 'X-Sendfile'
+        try:
+            response = self.client.get('/views/site_media/file.txt')
+        finally:
+            settings.STATIC_SERVE_SENDFILE_HEADER = old_header
+        self.assertEquals(response['X-Sendfile'], path.join(media_dir, 'file.txt'))
+        self.assertEquals(response['Content-Type'], 'text/plain')
+        self.assertEquals(response.content, '')
+
+    def test_stat_cache(self):
+        "stat() results are reused for STATIC_SERVE_STAT_CACHE_TIMEOUT seconds"
+        old_timeout = settings.STATIC_SERVE_STAT_CACHE_TIMEOUT
+        fullpath = path.join(media_dir, 'file.txt')
+        try:
+            settings.STATIC_SERVE_STAT_CACHE_TIMEOUT = 60
+            statobj = static._file_info(fullpath)[0]
+            self.assertEquals(static._file_info(fullpath)[0] is statobj, True)
+            settings.STATIC_SERVE_STAT_CACHE_TIMEOUT = 0
+            self.assertEquals(static._file_info(fullpath)[0] is statobj, False)
+        finally:
+            settings.STATIC_SERVE_STAT_CACHE_TIMEOUT = old_timeout
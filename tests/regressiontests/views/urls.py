@@ -38,6 +38,7 @@ urlpatterns = patterns('',
     (r'^jsi18n/$', 'django.views.i18n.javascript_catalog', js_info_dict),
 
     # Static views
+    (r'^site_media/cached/(?P<path>.*)$', 'django.views.static.serve', {'document_root': media_dir, 'cache_timeout': 3600}),
     (r'^site_media/(?P<path>.*)$', 'django.views.static.serve', {'document_root': media_dir}),
 
     # Special URLs for particular regression cases.
@@ -85,7 +85,8 @@ class InvalidModelTestCase(unittest.TestCase):
         self.assert_(not unexpected, "Unexpected Errors: " + '\n'.join(unexpected))
         self.assert_(not missing, "Missing Errors: " + '\n'.join(missing))
 
-def django_tests(verbosity, interactive, test_labels):
+def django_tests(verbosity, interactive, test_labels, keepdb=False, parallel=1,
+                 profile=0, profile_report=None, keep_fixtures=False):
     from django.conf import settings
 
     old_installed_apps = settings.INSTALLED_APPS
@@ -158,7 +159,18 @@ def django_tests(verbosity, interactive, test_labels):
         settings.TEST_RUNNER = 'django.test.simple.run_tests'
     test_runner = get_runner(settings)
 
-    failures = test_runner(test_labels, verbosity=verbosity, interactive=interactive, extra_tests=extra_tests)
+    extra_options = {}
+    if keepdb:
+        extra_options['keepdb'] = True
+    if keep_fixtures:
+        extra_options['keep_fixtures'] = True
+    if parallel > 1:
+        extra_options['parallel'] = parallel
+    if profile:
+        extra_options['profile'] = profile
+    if profile_report:
+        extra_options['profile_report'] = profile_report
+    failures = test_runner(test_labels, verbosity=verbosity, interactive=interactive, extra_tests=extra_tests, **extra_options)
     if failures:
         sys.exit(failures)
 
@@ -180,6 +192,16 @@ if __name__ == "__main__":
         help='Verbosity level; 0=minimal output, 1=normal output, 2=all output')
     parser.add_option('--noinput', action='store_false', dest='interactive', default=True,
         help='Tells Django to NOT prompt the user for input of any kind.')
+    parser.add_option('--keepdb', action='store_true', dest='keepdb', default=False,
+        help='Keeps the test database after the run, and reuses it on the next run if the models are unchanged.')
+    parser.add_option('--keepfixtures', action='store_true', dest='keep_fixtures', default=False,
+        help='Loads the fixtures of a TestCase once and keeps them for the following TestCases using the same fixtures.')
+    parser.add_option('--parallel', default=1, type='int',
+        help='Runs the tests in that many processes, each with its own test database.')
+    parser.add_option('--profile', default=0, type='int',
+        help='Lists that many of the slowest tests and of the tests running the most queries.')
+    parser.add_option('--profile-report', dest='profile_report',
+        help='Writes the time and queries of every test to this file, as JSON.')
     parser.add_option('--settings',
         help='Python path to settings module, e.g. "myproject.settings". If this isn\'t provided, the DJANGO_SETTINGS_MODULE environment variable will be used.')
     options, args = parser.parse_args()
@@ -188,4 +210,6 @@ if __name__ == "__main__":
     elif "DJANGO_SETTINGS_MODULE" not in os.environ:
         parser.error("DJANGO_SETTINGS_MODULE is not set in the environment. "
                       "Set it or use --settings.")
-    django_tests(int(options.verbosity), options.interactive, args)
+    django_tests(int(options.verbosity), options.interactive, args, options.keepdb,
+                 options.parallel, options.profile, options.profile_report,
+                 options.keep_fixtures)